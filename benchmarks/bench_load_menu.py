@@ -0,0 +1,53 @@
+"""Benchmark cold, lazy and warm (snapshot cache) menu loads.
+
+Usage:
+    python benchmarks/bench_load_menu.py [--items N]
+"""
+
+import argparse
+import os
+import tempfile
+
+from common import timed, write_fixture
+
+from pymenu_cli.cache import snapshot_path
+from pymenu_cli.pymenu import load_menu
+
+
+def main() -> None:
+    """Generate a large menu file and compare cold and warm load times."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000, help="Number of action items")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        menu_file, actions_file = write_fixture(tmp, args.items)
+        cache_dir = os.path.join(tmp, "cache")
+
+        def cold() -> None:
+            load_menu(menu_file, actions_file)
+
+        def lazy() -> None:
+            load_menu(menu_file, actions_file, lazy=True)
+
+        def warm() -> None:
+            load_menu(menu_file, actions_file, cache_dir=cache_dir)
+
+        warm()  # build the snapshot
+        size_mb = os.path.getsize(menu_file) / 1e6
+        snapshot_mb = os.path.getsize(snapshot_path(menu_file, cache_dir)) / 1e6
+        cold_s = timed(cold, args.repeat)
+        lazy_s = timed(lazy, args.repeat)
+        warm_s = timed(warm, args.repeat)
+
+    print(f"menu JSON:      {size_mb:8.2f} MB ({args.items} items)")
+    print(f"snapshot:       {snapshot_mb:8.2f} MB")
+    print(f"cold load:      {cold_s * 1000:8.1f} ms")
+    print(f"lazy load:      {lazy_s * 1000:8.1f} ms")
+    print(f"warm load:      {warm_s * 1000:8.1f} ms")
+    print(f"speedup:        {cold_s / warm_s:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
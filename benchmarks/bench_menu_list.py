@@ -0,0 +1,66 @@
+"""Benchmark cursor movement in MenuListPanel for menus of different sizes.
+
+Usage:
+    python benchmarks/bench_menu_list.py [--sizes 100 10000 100000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from textual.app import App, ComposeResult
+
+from pymenu_cli.models.menu import Menu
+from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.widgets.menu_list import MenuListPanel
+
+
+class _PanelApp(App):
+    def __init__(self, menu) -> None:
+        super().__init__()
+        self.menu = menu
+
+    def compose(self) -> ComposeResult:
+        yield MenuListPanel(self.menu)
+
+
+def make_menu(count: int) -> Menu:
+    """Return a flat menu with ``count`` action items."""
+    menu = Menu("Bench")
+    for i in range(count):
+        menu.add_item(MenuItem(f"Item {i}", i_action="noop"))
+    return menu
+
+
+async def cursor_moves(count: int, presses: int) -> tuple:
+    """Return (ms per keystroke, lines rendered, rows formatted) for ``presses`` down keys."""
+    app = _PanelApp(make_menu(count))
+    async with app.run_test(size=(100, 40)) as pilot:
+        panel = app.query_one(MenuListPanel)
+        panel.focus()
+        await pilot.pause()
+        panel.render_counters.reset()
+        start = time.perf_counter()
+        for _ in range(presses):
+            await pilot.press("down")
+            await pilot.pause()
+        elapsed_ms = (time.perf_counter() - start) * 1000 / presses
+        counters = panel.render_counters
+        return elapsed_ms, counters.lines / presses, counters.formats / presses
+
+
+def main() -> None:
+    """Measure per-keystroke cursor latency and render counters for several menu sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--presses", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'items':>10}{'per key':>12}{'lines/key':>12}{'formats/key':>13}")
+    for size in args.sizes:
+        elapsed_ms, lines, formats = asyncio.run(cursor_moves(size, args.presses))
+        print(f"{size:>10}{elapsed_ms:>10.2f}ms{lines:>12.1f}{formats:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark per-keystroke global search latency.
+
+``linear`` is the original substring scan that returns every match in tree
+order. ``index`` runs the fuzzy search from scratch on each keystroke and
+``narrowing`` filters the previous matches; both rank only the top results.
+
+Usage:
+    python benchmarks/bench_search.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import time
+
+from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.search import IncrementalSearch, SearchIndex, SearchResult
+
+WORDS = (
+    "backup restore deploy build migrate config network disk memory user group "
+    "service log report export import sync cache clean status monitor alert"
+).split()
+
+
+def make_results(count: int, seed: int = 0) -> list:
+    """Return ``count`` search results with random multi-word titles."""
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        title = f"{' '.join(rng.choices(WORDS, k=3))} {i}"
+        results.append(SearchResult(MenuItem(title, i_action="noop"), f"Main › {title}", None))
+    return results
+
+
+def linear_search(results: list, query: str) -> list:
+    """The original per-keystroke scan: lowercase every title."""
+    query_lower = query.lower()
+    return [sr for sr in results if query_lower in sr.title.lower()]
+
+
+def keystroke_latency(search, query: str) -> float:
+    """Return the mean latency (ms) of typing ``query`` and deleting it again.
+
+    Every prefix is searched on the way in and again on the way out, as with
+    one backspace per character.
+    """
+    prefixes = [query[:end] for end in range(1, len(query) + 1)]
+    prefixes += prefixes[-2::-1]
+    start = time.perf_counter()
+    for prefix in prefixes:
+        search(prefix)
+    return (time.perf_counter() - start) * 1000 / len(prefixes)
+
+
+def main() -> None:
+    """Compare the linear scan, fuzzy search and incremental narrowing."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--query", default="deploy status 42")
+    args = parser.parse_args()
+
+    print(f"query: {args.query!r} (mean latency per keystroke)")
+    print(f"{'items':>10}{'build':>12}{'linear':>12}{'index':>12}{'narrowing':>12}")
+    for size in args.sizes:
+        results = make_results(size)
+        start = time.perf_counter()
+        index = SearchIndex(results)
+        build_ms = (time.perf_counter() - start) * 1000
+        linear_ms = keystroke_latency(lambda q, r=results: linear_search(r, q), args.query)
+        index_ms = keystroke_latency(index.search, args.query)
+        narrowing_ms = keystroke_latency(IncrementalSearch(index).search, args.query)
+        print(
+            f"{size:>10}{build_ms:>10.0f}ms{linear_ms:>10.2f}ms"
+            f"{index_ms:>10.2f}ms{narrowing_ms:>10.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
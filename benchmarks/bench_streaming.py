@@ -0,0 +1,50 @@
+"""Benchmark peak memory and time of the JSON and streaming menu loaders.
+
+Usage:
+    python benchmarks/bench_streaming.py [--items N]
+"""
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+
+from common import timed, write_fixture
+
+from pymenu_cli.pymenu import load_menu
+
+
+def measure(func) -> tuple:
+    """Return (seconds, peak traced MB, retained traced MB) of ``func``.
+
+    The time is taken from an untraced call since tracemalloc slows allocation down.
+    """
+    elapsed = timed(func, repeat=1)
+    tracemalloc.start()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / 1e6, current / 1e6
+
+
+def main() -> None:
+    """Generate a large menu file and compare both loaders."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000, help="Number of action items")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        menu_file, actions_file = write_fixture(tmp, args.items)
+
+        print(f"menu JSON: {os.path.getsize(menu_file) / 1e6:.2f} MB ({args.items} items)")
+        print(f"{'loader':<10}{'time':>10}{'peak':>12}{'final':>12}")
+        for name, streaming in (("json", False), ("streaming", True)):
+            elapsed, peak, final = measure(
+                lambda streaming=streaming: load_menu(menu_file, actions_file, streaming=streaming)
+            )
+            print(f"{name:<10}{elapsed * 1000:>8.0f}ms{peak:>10.1f}MB{final:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Shared helpers for the pymenu-cli benchmarks."""
+
+import json
+import os
+import time
+from typing import Callable, Dict, List, Tuple
+
+
+def make_menu_data(total_items: int, fanout: int = 10, depth: int = 4) -> Dict:
+    """Build a synthetic menu dict with roughly ``total_items`` items.
+
+    Every menu holds ``fanout`` submenus until ``depth`` is reached; the
+    remaining items are spread as actions across the leaf menus.
+    """
+    leaf_menus: List[Dict] = []
+
+    def build(title: str, level: int) -> Dict:
+        menu = {"title": title, "items": []}
+        if level < depth:
+            for i in range(fanout):
+                child = build(f"{title} {i}", level + 1)
+                menu["items"].append({"title": f"{title} group {i}", "submenu": child})
+        else:
+            leaf_menus.append(menu)
+        return menu
+
+    root = build("Main", 1)
+    for i in range(max(total_items, 0)):
+        leaf = leaf_menus[i % len(leaf_menus)]
+        leaf["items"].append({"title": f"Action item {i}", "action": "noop"})
+    return root
+
+
+def timed(func: Callable, repeat: int = 5) -> float:
+    """Return the best wall time of ``repeat`` calls of ``func`` in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def write_fixture(directory: str, total_items: int) -> Tuple[str, str]:
+    """Write a synthetic menu JSON file and a matching actions file.
+
+    Returns:
+        The (menu file, actions file) paths.
+    """
+    menu_file = os.path.join(directory, "menu.json")
+    actions_file = os.path.join(directory, "actions.py")
+    with open(menu_file, "w", encoding="utf-8") as file:
+        json.dump(make_menu_data(total_items), file)
+    with open(actions_file, "w", encoding="utf-8") as file:
+        file.write("def noop():\n    pass\n")
+    return menu_file, actions_file
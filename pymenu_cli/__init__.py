@@ -1,9 +1,26 @@
-"""pymenu-cli: Interactive CLI menus from JSON configuration."""
+"""pymenu-cli: Interactive CLI menus from JSON configuration.
 
-from pymenu_cli.app import MenuApp
-from pymenu_cli.models.menu import Menu
-from pymenu_cli.models.menu_item import MenuItem
-from pymenu_cli.pymenu import create_menu_from_data, load_actions_module, load_menu
+The public API is exported lazily so that ``from pymenu_cli import load_menu``
+and classic mode never import Textual; ``MenuApp`` pulls it in on first access.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pymenu_cli.app import MenuApp
+    from pymenu_cli.models.menu import Menu
+    from pymenu_cli.models.menu_item import MenuItem
+    from pymenu_cli.pymenu import create_menu_from_data, load_actions_module, load_menu
+
+_EXPORTS = {
+    "load_menu": "pymenu_cli.pymenu",
+    "create_menu_from_data": "pymenu_cli.pymenu",
+    "load_actions_module": "pymenu_cli.pymenu",
+    "Menu": "pymenu_cli.models.menu",
+    "MenuItem": "pymenu_cli.models.menu_item",
+    "MenuApp": "pymenu_cli.app",
+}
 
 __all__ = [
     "load_menu",
@@ -13,3 +30,17 @@ __all__ = [
     "MenuItem",
     "MenuApp",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its module on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
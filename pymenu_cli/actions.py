@@ -0,0 +1,115 @@
+"""Deferred loading of actions modules.
+
+``DeferredActions`` stands in for an actions module. The module is only
+executed on the first attribute access, or ahead of time by ``_preload`` in a
+background thread, so heavy imports in the actions file do not delay startup.
+The names of its top-level functions are read from the source with ``ast``,
+which lets menus be validated without running the module.
+"""
+
+# pylint: disable=import-outside-toplevel
+import ast
+import threading
+from typing import FrozenSet, Optional
+
+
+def _scan_functions(actions_path: str) -> list:
+    """Parse an actions file and return its top-level (sync and async) function definitions."""
+    with open(actions_path, "rb") as file:
+        tree = ast.parse(file.read(), filename=actions_path)
+    return [node for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+
+
+def scan_action_names(actions_path: str) -> FrozenSet[str]:
+    """Return the names of the top-level functions of an actions file without running it.
+
+    Args:
+        actions_path: The path to the actions Python file.
+
+    Returns:
+        The names of the top-level (sync and async) functions.
+
+    Raises:
+        FileNotFoundError: If the actions file is not found.
+        SyntaxError: If the actions file is not valid Python.
+    """
+    return frozenset(node.name for node in _scan_functions(actions_path))
+
+
+class DeferredActions:
+    """An actions module that is imported on first use.
+
+    Every public attribute is looked up on the module, so the proxy's own API
+    is underscore-prefixed, like ``namedtuple``'s, to leave every action name
+    free.
+
+    Attributes:
+        _path (str): The path to the actions Python file.
+        _names (FrozenSet[str]): The top-level function names found by scanning the file.
+        _async_names (FrozenSet[str]): The names among them defined with ``async def``.
+    """
+
+    def __init__(self, actions_path: str) -> None:
+        """
+        Args:
+            actions_path: The path to the actions Python file.
+
+        Raises:
+            FileNotFoundError: If the actions file is not found.
+            SyntaxError: If the actions file is not valid Python.
+        """
+        self._path = actions_path
+        functions = _scan_functions(actions_path)
+        self._names = frozenset(node.name for node in functions)
+        self._async_names = frozenset(
+            node.name for node in functions if isinstance(node, ast.AsyncFunctionDef)
+        )
+        self._module: Optional[object] = None
+        self._lock = threading.Lock()
+        self._preload_thread: Optional[threading.Thread] = None
+
+    @property
+    def _is_loaded(self) -> bool:
+        """Whether the actions module has been executed."""
+        return self._module is not None
+
+    def _load(self) -> object:
+        """Import the actions module if needed and return it.
+
+        Blocks while a background preload is importing the module.
+        """
+        if self._module is None:
+            # Lazy import to avoid circular dependency
+            from pymenu_cli.pymenu import load_actions_module
+
+            with self._lock:
+                if self._module is None:
+                    self._module = load_actions_module(self._path)
+        return self._module
+
+    def _preload(self) -> None:
+        """Start importing the actions module in a background thread.
+
+        Import errors are not raised here; they surface on the first action dispatch.
+        """
+        if self._module is not None or self._preload_thread is not None:
+            return
+        self._preload_thread = threading.Thread(
+            target=self._load_quietly, name="pymenu-actions-preload", daemon=True
+        )
+        self._preload_thread.start()
+
+    def _load_quietly(self) -> None:
+        try:
+            self._load()
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._is_loaded else "deferred"
+        return f"<DeferredActions {self._path!r} ({state})>"
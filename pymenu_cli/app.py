@@ -1,26 +1,80 @@
 """Main TUI application for pymenu-cli."""
 
-import contextlib
-import io
-import traceback
+from __future__ import annotations
+
+import asyncio
+import functools
+import shlex
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.constants import MAX_FPS
 from textual.containers import Horizontal, Vertical
+from textual.timer import Timer
 from textual.widgets import Footer, Input, Static
+from textual.worker import get_current_worker
 
+from pymenu_cli.actions import DeferredActions
 from pymenu_cli.banner import render_banner
+from pymenu_cli.dag import resolve_prerequisites
+from pymenu_cli.jobs import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    MAX_JOBS,
+    RUNNING,
+    Batch,
+    Job,
+    JobScheduler,
+)
+from pymenu_cli.metrics import Measurement, MetricsRegistry
+from pymenu_cli.models.lazy_menu import LazyMenu
+from pymenu_cli.process_pool import PROCESS_WORKERS, ProcessPool, actions_file
+from pymenu_cli.results import CachedResult, ResultCache
+from pymenu_cli.runner import (
+    ActionResult,
+    OutputSink,
+    call_action,
+    call_async_action,
+    call_command,
+    call_process_action,
+    install_output_capture,
+    is_async_action,
+    uninstall_output_capture,
+)
+from pymenu_cli.search import (
+    IncrementalSearch,
+    SearchCancelled,
+    SearchIndex,
+    SearchPage,
+    SearchResult,
+)
 from pymenu_cli.widgets.breadcrumb import BreadcrumbBar
-from pymenu_cli.widgets.menu_list import MenuListPanel, SearchResult
+from pymenu_cli.widgets.jobs_panel import JobsPanel
+from pymenu_cli.widgets.menu_list import MenuListPanel
 from pymenu_cli.widgets.output_panel import OutputPanel
 from pymenu_cli.widgets.search_bar import SearchBar
 from pymenu_cli.widgets.sidebar import MenuSidebar
 
 THEMES_DIR = Path(__file__).parent / "themes"
+SEARCH_DEBOUNCE = 0.05
+# Streamed action output is written to the output panel at most once per frame
+OUTPUT_FLUSH_INTERVAL = 1 / MAX_FPS
 
 
-class MenuApp(App):
+def _locate_item(menu, location: tuple[int, ...]) -> tuple[object, object]:
+    """Build the submenus along ``location`` and return the item it leads to, with its menu."""
+    for position in location[:-1]:
+        menu = menu.items[position].submenu
+    return menu.items[location[-1]], menu
+
+
+class MenuApp(App):  # pylint: disable=too-many-instance-attributes
     """The main pymenu-cli TUI application."""
 
     BINDINGS = [
@@ -29,25 +83,86 @@ class MenuApp(App):
         Binding("backspace", "go_back", "Back", show=False),
         Binding("slash", "focus_search", "Search", show=True),
         Binding("t", "toggle_theme", "Theme", show=True),
+        Binding("x", "cancel_action", "Cancel", show=True),
+        Binding("r", "refresh_action", "Refresh", show=True),
+        Binding("s", "run_selected", "Run selected", show=True),
     ]
 
     CSS_PATH = [
         THEMES_DIR / "dark.tcss",
     ]
 
-    def __init__(self, menu, theme: str = "dark") -> None:
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        menu,
+        theme: str = "dark",
+        search_debounce: float = SEARCH_DEBOUNCE,
+        lazy_sidebar_root: bool = False,
+        *,
+        execution: str = "thread",
+        action_timeout: float | None = None,
+        process_workers: int = PROCESS_WORKERS,
+        max_jobs: int = MAX_JOBS,
+        batch_limit: int | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        """
+        Args:
+            menu: The root menu.
+            theme: Theme name ('dark' or 'light').
+            search_debounce: Seconds to wait for more keystrokes before searching.
+            lazy_sidebar_root: Start with the sidebar root collapsed and unpopulated.
+            execution: Where actions run unless their item overrides it: 'thread' runs
+                       them in this process, 'process' in a pool of worker processes.
+            action_timeout: Seconds after which a process-isolated action is killed,
+                            unless its item sets its own timeout.
+            process_workers: The number of worker processes per actions file.
+            max_jobs: The number of actions that may run at once; later ones are queued.
+            batch_limit: The number of marked actions run together that may run at once.
+                         Defaults to ``max_jobs``.
+            metrics: Where the cost of every completed run is recorded. Defaults to a
+                     registry of the app's own, available as ``metrics``.
+        """
         super().__init__()
         self.root_menu = menu
         self._menu_stack: list = [menu]
         self._cursor_stack: list[int] = [0]
         self._app_theme = theme
+        self._lazy_sidebar_root = lazy_sidebar_root
         self._global_index: list = []
+        self._main_loop: asyncio.AbstractEventLoop | None = None
+        self._unindexed_menus: list = []  # Lazy submenus built before the index was ready
+        self._search = IncrementalSearch(SearchIndex([]))
+        self._search_lock = threading.Lock()
+        self._search_query = ""
+        self._search_debounce = search_debounce
+        self._search_timer: Timer | None = None
+        self._index_ready = False
+        self._load_time: float | None = None
+        self._first_paint_time: float | None = None
+        self._action_pool: ThreadPoolExecutor | None = None
+        self._jobs = JobScheduler(max_jobs)
+        self._batch_limit = batch_limit if batch_limit is not None else max_jobs
+        self._action_items: dict[str, tuple] = {}  # Found while resolving prerequisites
+        if self._batch_limit < 1:
+            raise ValueError(f"The batch limit must be at least 1, not {self._batch_limit}")
+        self._results = ResultCache()
+        self._metrics = metrics if metrics is not None else MetricsRegistry()
+        self._execution = execution
+        self._action_timeout = action_timeout
+        self._process_workers = process_workers
+        self._process_pools: dict[str, ProcessPool] = {}
 
     @property
     def current_menu(self) -> object:
         """Return the currently active menu."""
         return self._menu_stack[-1]
 
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Return the histograms of the cost of the runs completed so far."""
+        return self._metrics
+
     @property
     def app_theme(self) -> str:
         """Return the current theme name."""
@@ -63,40 +178,171 @@ class MenuApp(App):
         yield BreadcrumbBar()
 
         with Horizontal():
-            yield MenuSidebar(self.root_menu)
+            yield MenuSidebar(self.root_menu, lazy_root=self._lazy_sidebar_root)
             with Vertical():
                 yield SearchBar()
                 yield MenuListPanel(self.root_menu)
+                yield JobsPanel(self._jobs)
                 yield OutputPanel()
 
         yield Footer()
 
     def on_mount(self) -> None:
-        """Initialize breadcrumb, theme, and global index on app mount."""
+        """Initialize breadcrumb and theme on app mount, and schedule the background work."""
+        # Route prints to the action printing them for as long as the app runs, so that
+        # starting an action only sets a context variable
+        install_output_capture()
+        self._main_loop = asyncio.get_running_loop()
         self._update_breadcrumb()
         if self._app_theme == "light":
             self._apply_theme("light")
-        self._global_index = self._build_global_index()
+        # Build the search index and import deferred actions once the first frame is shown
+        self.call_after_refresh(self._after_first_paint)
         # Focus the menu list so keyboard navigation works immediately
         self.query_one(MenuListPanel).focus()
 
+    def on_load(self) -> None:
+        """Record when the app started running, for ``time_to_first_paint``."""
+        self._load_time = time.perf_counter()
+
+    @property
+    def time_to_first_paint(self) -> float | None:
+        """Seconds from the app starting to run to its first frame, or None before it."""
+        if self._load_time is None or self._first_paint_time is None:
+            return None
+        return self._first_paint_time - self._load_time
+
+    @property
+    def index_ready(self) -> bool:
+        """Whether the global search index has been built."""
+        return self._index_ready
+
+    def _after_first_paint(self) -> None:
+        self._first_paint_time = time.perf_counter()
+        self._build_search_index()
+        actions = self.root_menu.actions
+        if isinstance(actions, DeferredActions):
+            actions._preload()
+        if self._execution == "process":
+            pool = self._process_pool(actions)
+            if pool is not None:
+                # Start the workers now so that the first action finds them warm
+                self.run_worker(pool.start, thread=True, group="process-pool")
+
+    @work(thread=True, exclusive=True, group="index")
+    def _build_search_index(self) -> None:
+        """Index every item of the menu tree in a worker thread."""
+        results = self._build_global_index()
+        index = SearchIndex(results)
+        self.call_from_thread(self._set_search_index, results, index)
+
+    def _set_search_index(self, results: list[SearchResult], index: SearchIndex) -> None:
+        self._global_index = results
+        self._search = IncrementalSearch(index)
+        self._index_ready = True
+        menus, self._unindexed_menus = self._unindexed_menus, []
+        for menu in menus:
+            self._index_loaded_menu(menu)
+        if self._search_query:
+            # Run the query typed while the index was being built
+            self._run_search(self._search_query)
+
     def _build_global_index(self) -> list[SearchResult]:
         """Build a flat index of all items across the entire menu tree."""
-        results = []
-        self._index_menu(self.root_menu, [], results)
+        results: list[SearchResult] = []
+        self._index_menu(self.root_menu, self.root_menu.title, results)
         return results
 
-    def _index_menu(self, menu, path_parts: list[str], results: list[SearchResult]) -> None:
-        """Recursively index all items in a menu."""
-        current_path = " › ".join(path_parts) if path_parts else menu.title
+    def _index_menu(self, menu, menu_path: str, results: list[SearchResult]) -> None:
+        """Recursively index all items in a menu and in its submenus.
+
+        ``menu_path`` holds the titles of the menus from the root down to ``menu``.
+        Lazy submenus are not built here: those built from JSON data are indexed from
+        it, and the others once they are built.
+        """
         for item in menu.items:
-            if path_parts:
-                item_path = f"{current_path} › {item.title}"
+            results.append(SearchResult(item, f"{menu_path} › {item.title}", menu))
+            submenu = item.submenu
+            if not submenu:
+                continue
+            submenu_path = f"{menu_path} › {submenu.title}"
+            if isinstance(submenu, LazyMenu) and not submenu.is_loaded:
+                if submenu.items_data is not None:
+                    self._index_items_data(submenu.items_data, submenu, (), submenu_path, results)
+                    continue
+                if submenu.add_load_listener(self._on_menu_loaded):
+                    continue
+            self._index_menu(submenu, submenu_path, results)
+
+    def _index_items_data(
+        self,
+        items_data: list[dict],
+        menu: LazyMenu,
+        location: tuple[int, ...],
+        menu_path: str,
+        results: list[SearchResult],
+    ) -> None:
+        """Index the JSON data of the items of an unbuilt lazy submenu and of its submenus.
+
+        ``location`` holds the positions of the items that lead from ``menu`` to the
+        submenu whose items are indexed. The entries build the menus leading to their
+        item only when they are resolved, on selection.
+        """
+        for position, item_data in enumerate(items_data):
+            title = item_data["title"]
+            submenu_data = item_data.get("submenu")
+            if submenu_data is not None:
+                kind = "submenu"
+            elif "command" in item_data:
+                kind = "command"
             else:
-                item_path = f"{menu.title} › {item.title}"
-            results.append(SearchResult(item, item_path, menu))
-            if item.submenu:
-                self._index_menu(item.submenu, path_parts + [menu.title], results)
+                kind = "action" if item_data.get("action") else ""
+            item_location = location + (position,)
+            results.append(
+                SearchResult(
+                    None,
+                    f"{menu_path} › {title}",
+                    None,
+                    title=title,
+                    kind=kind,
+                    locate=functools.partial(_locate_item, menu, item_location),
+                )
+            )
+            if submenu_data is not None:
+                submenu_path = f"{menu_path} › {submenu_data['title']}"
+                self._index_items_data(
+                    submenu_data["items"], menu, item_location, submenu_path, results
+                )
+
+    def _on_menu_loaded(self, menu: LazyMenu) -> None:
+        """Schedule the indexing of a lazy submenu whose items were just built.
+
+        Called in the thread that built them.
+        """
+        try:
+            self._main_loop.call_soon_threadsafe(self._index_loaded_menu, menu)
+        except RuntimeError:
+            pass  # The event loop has closed; there is no search to update
+
+    def _index_loaded_menu(self, menu: LazyMenu) -> None:
+        """Add the items of a newly built lazy submenu to the search index."""
+        if not self.is_running:
+            return
+        if not self._index_ready:
+            self._unindexed_menus.append(menu)
+            return
+        chain = menu.ancestors()
+        menu_path = " › ".join(parent.title for parent in chain[chain.index(self.root_menu) :])
+        results: list[SearchResult] = []
+        self._index_menu(menu, menu_path, results)
+        # Stop the running search rather than wait for it to let go of the index
+        self.workers.cancel_group(self, "search")
+        with self._search_lock:
+            self._search.index.extend(results)
+            self._search.reset()
+        self._global_index.extend(results)
+        if self._search_query:
+            self._run_search(self._search_query)
 
     def _update_breadcrumb(self) -> None:
         path = [m.title for m in self._menu_stack]
@@ -104,9 +350,7 @@ class MenuApp(App):
 
     def _navigate_to_menu(self, target_menu) -> None:
         """Navigate the stack to a specific menu (used by global search)."""
-        self._menu_stack = [self.root_menu]
-        self._cursor_stack = [0]
-        self._find_path_to(self.root_menu, target_menu)
+        self._jump_to(target_menu)
 
         panel = self.query_one(MenuListPanel)
         panel.set_menu(self.current_menu)
@@ -127,35 +371,301 @@ class MenuApp(App):
         self.query_one(MenuSidebar).set_active(menu)
         self._update_breadcrumb()
 
-    def _execute_action(self, item) -> None:
+    def _execute_action(self, item, refresh: bool = False) -> None:
+        """Submit a run of an action to the job scheduler, keeping the UI responsive.
+
+        The output of a cached item's last successful run is replayed instead while
+        it is fresh, unless ``refresh`` is True.
+        """
+        actions = self.current_menu.actions
+        if item.cache is not None and not refresh:
+            cached = self._results.get(self._result_key(item, actions))
+            if cached is not None:
+                self._replay_result(item, cached)
+                return
+        if item.requires:
+            self._run_with_prerequisites(item, actions)
+            return
+        self._jobs.submit(item, actions)
+        self.query_one(MenuListPanel).set_running(item, True)
+        self._start_jobs()
+        self.query_one(MenuListPanel).focus()
+
+    @staticmethod
+    def _result_key(item, actions) -> tuple:
+        """Return the key of an item's output in the result cache."""
+        if item.command:
+            return ("command", item.command)
+        return (id(actions), item.action)
+
+    def _append_header(self, item, job_id: int | None = None, note: str | None = None) -> None:
+        """Write the header line of a run of an item's action or command."""
         output_panel = self.query_one(OutputPanel)
-        output_panel.append_action_header(item.action)
+        if item.command:
+            output_panel.append_command_header(shlex.join(item.command), job_id, note)
+        else:
+            output_panel.append_action_header(item.action, job_id, note)
 
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
+    def _run_with_prerequisites(self, item, actions) -> None:
+        """Run an action after the actions it requires, directly or not."""
+        if self._submit_with_prerequisites([(item, actions)]):
+            self.query_one(MenuListPanel).focus()
+
+    def _submit_with_prerequisites(self, entries: list) -> bool:
+        """Submit (item, actions) pairs as one batch, each after the actions it requires.
+
+        Prerequisites that do not depend on each other run in parallel, up to the batch
+        limit; an action whose prerequisite fails, or is cancelled, is skipped. An action
+        required by several items runs once.
+
+        Returns:
+            False, and nothing is submitted, if an item requires actions not in the menu.
+        """
+        expanded = self._expand_prerequisites(entries)
+        if expanded is None:
+            return False
+        batch = self._jobs.submit_batch(expanded, self._batch_limit)
+        jobs = {job.item.action: job for job in batch.jobs if job.item.action}
+        output_panel = self.query_one(OutputPanel)
+        panel = self.query_one(MenuListPanel)
+        for job in batch.jobs:
+            job.requires = [jobs[name] for name in job.item.requires or ()]
+            if job.requires:
+                waits_for = ", ".join(dependency.name for dependency in job.requires)
+                output_panel.append_note(f"… {job.name} waits for {waits_for}", job.id)
+            panel.set_running(job.item, True)
+        self._start_jobs()
+        return True
+
+    def _expand_prerequisites(self, entries: list) -> list | None:
+        """Return the (item, actions) pairs preceded by those of the actions they require,
+        each action once, or None if an item requires actions not in the menu."""
+        expanded = []
+        included = set()
+        for item, actions in entries:
+            if item.action in included:
+                continue  # It already runs, e.g. as a prerequisite of an earlier item
+            if item.requires:
+                try:
+                    required = resolve_prerequisites(
+                        self.root_menu, item.action, item.requires, self._action_items
+                    )
+                except ValueError as error:
+                    self.notify(str(error), severity="error")
+                    return None
+                for entry in required:
+                    if entry[0].action not in included:
+                        included.add(entry[0].action)
+                        expanded.append(entry)
+            if item.action:
+                included.add(item.action)
+            expanded.append((item, actions))
+        return expanded
+
+    def _replay_result(self, item, cached: CachedResult) -> None:
+        """Write the cached output of an action to the output panel."""
+        output_panel = self.query_one(OutputPanel)
+        age = cached.age(self._results.now())
+        self._append_header(item, note=f"cached (age {age:.0f}s)")
+        for is_error, text in cached.output:
+            if is_error:
+                output_panel.append_error(text)
+            else:
+                output_panel.append_output(text)
+        if not cached.output:
+            output_panel.append_output("✓ Done (no output)")
+
+    def _start_jobs(self) -> None:
+        """Start as many queued jobs as the concurrency limit allows."""
+        for job in self._jobs.start_ready():
+            self._append_header(job.item, job.id)
+            job.worker = self.run_worker(
+                self._run_job(job), name=job.name, group="actions", exit_on_error=False
+            )
+        self.query_one(JobsPanel).refresh_jobs()
+
+    async def _run_job(self, job: Job) -> None:
+        """Run a job's action and stream its output to the job and the output panel."""
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+        output_panel = self.query_one(OutputPanel)
 
+        def schedule_flush() -> None:
+            # Called from the action thread when the first line of a batch is written
+            try:
+                loop.call_soon_threadsafe(
+                    loop.call_later, OUTPUT_FLUSH_INTERVAL, self._flush_output, job, sink
+                )
+            except RuntimeError:
+                pass  # The event loop has closed; nobody is left to show the output
+
+        sink = OutputSink(schedule_flush)
+        # Other jobs share the process, so only the figures of the thread, worker or command
+        # that ran the job are the run's own
+        measurement = Measurement(process_wide=False)
         try:
-            with (
-                contextlib.redirect_stdout(stdout_capture),
-                contextlib.redirect_stderr(stderr_capture),
-            ):
-                action_fn = getattr(self.current_menu.actions, item.action)
-                action_fn()
-
-            stdout_text = stdout_capture.getvalue()
-            stderr_text = stderr_capture.getvalue()
-
-            if stdout_text:
-                output_panel.append_output(stdout_text.rstrip())
-            if stderr_text:
-                output_panel.append_error(stderr_text.rstrip())
-            if not stdout_text and not stderr_text:
-                output_panel.append_output("✓ Done (no output)")
-
-        except Exception:  # pylint: disable=broad-exception-caught
-            output_panel.append_error(traceback.format_exc())
-        finally:
+            result = await self._call_action(job.item, job.actions, cancel_event, sink)
+        except asyncio.CancelledError:
+            cancel_event.set()
+            sink.close()
+            self._flush_output(job, sink)
+            output_panel.append_error(f"✗ {job.name} cancelled", job.id)
+            self._finish_job(job, CANCELLED)
+            raise
+
+        self._flush_output(job, sink)
+        if result.error:
+            output_panel.append_error(result.error, job.id)
+        elif result.exit_code is not None:
+            output_panel.append_output(f"✓ exit code {result.exit_code}", job.id)
+        elif not sink.wrote:
+            output_panel.append_output("✓ Done (no output)", job.id)
+        job.metrics = measurement.stop(result.cpu_time, result.rss_delta)
+        self._metrics.record(job.name, job.metrics)
+        output_panel.append_note(job.metrics.describe(), job.id)
+        if job.item.cache is not None and not result.error:
+            self._results.put(self._result_key(job.item, job.actions), job.output, job.item.cache)
+        self._finish_job(job, FAILED if result.error else DONE)
+
+    def action_run_selected(self) -> None:
+        """Run every marked action at once, with the actions they require, at most
+        ``batch_limit`` of them in parallel."""
+        panel = self.query_one(MenuListPanel)
+        entries = [(item, menu.actions) for item, menu in panel.marked_items]
+        if not entries:
+            self.notify("Mark actions with Space first", severity="warning")
+            return
+        if self._submit_with_prerequisites(entries):
+            panel.clear_marks()
+
+    def _summarise_batch(self, batch: Batch) -> None:
+        """Write the status and duration of every job of a finished batch."""
+        states = {}
+        for job in batch.jobs:
+            states[job.state] = states.get(job.state, 0) + 1
+        counts = ", ".join(f"{count} {state}" for state, count in states.items())
+        duration = batch.duration()
+        took = f" in {duration:.1f}s" if duration is not None else ""
+        title = f"Batch #{batch.id} of {len(batch.jobs)} finished{took}: {counts}"
+        rows = [JobsPanel.render_job(job) for job in batch.jobs]
+        self.query_one(OutputPanel).append_summary(title, rows)
+        self.notify(title, severity="error" if FAILED in states else "information")
+
+    def _finish_job(self, job: Job, state: str) -> None:
+        """Record the end of a job and start the next queued ones."""
+        skipped = self._jobs.finish(job, state)
+        panel = self.query_one(MenuListPanel)
+        for stopped in [job] + skipped:
+            panel.set_running(stopped.item, bool(self._jobs.active_for(stopped.item)))
+        if skipped and self.is_running:
+            output_panel = self.query_one(OutputPanel)
+            for dependent in skipped:
+                output_panel.append_error(
+                    f"↷ {dependent.name} skipped: {job.name} {state}", dependent.id
+                )
+        if job.batch is not None and job.batch.is_done and self.is_running:
+            self._summarise_batch(job.batch)
+        if self.is_running:
+            self._start_jobs()
+
+    async def _call_action(
+        self, item, actions, cancel_event: threading.Event, sink: OutputSink
+    ) -> ActionResult:
+        """Run an action where its item or the app says it should run."""
+        if item.command:
+            # Commands are asyncio subprocesses, so they need neither a thread nor the actions
+            return await call_command(item.command, sink, item.timeout)
+        loop = asyncio.get_running_loop()
+        if (item.execution or self._execution) == "process":
+            pool = self._process_pool(actions)
+            if pool is None:
+                return ActionResult(error="Process execution needs actions loaded from a file")
+            timeout = item.timeout if item.timeout is not None else self._action_timeout
+            # The default executor only waits on the worker process, so it needs no stdout swap
+            return await loop.run_in_executor(
+                None, call_process_action, pool, item.action, cancel_event, sink, timeout
+            )
+        if is_async_action(actions, item.action):
+            # Coroutine actions run on the event loop itself, so they do not use a thread
+            return await call_async_action(actions, item.action, sink)
+        if self._action_pool is None:
+            # Each thread's output is captured separately, so every running job can have one
+            self._action_pool = ThreadPoolExecutor(self._jobs.limit, "pymenu-action")
+        return await loop.run_in_executor(
+            self._action_pool, call_action, actions, item.action, cancel_event, sink
+        )
+
+    def _process_pool(self, actions) -> ProcessPool | None:
+        """Return the worker pool for an actions file, or None if it was not loaded from one."""
+        path = actions_file(actions)
+        if path is None:
+            return None
+        pool = self._process_pools.get(path)
+        if pool is None:
+            pool = self._process_pools[path] = ProcessPool(path, self._process_workers)
+        return pool
+
+    def _flush_output(self, job: Job, sink: OutputSink) -> None:
+        """Move the output a job has streamed so far to its buffer and the output panel."""
+        chunks = sink.drain()
+        job.output.extend(chunks)
+        if not self.is_running:
+            return
+        output_panel = self.query_one(OutputPanel)
+        for is_error, text in chunks:
+            if is_error:
+                output_panel.append_error(text, job.id)
+            else:
+                output_panel.append_output(text, job.id)
+
+    def action_refresh_action(self) -> None:
+        """Run the highlighted action again, even if its cached output is still fresh."""
+        panel = self.query_one(MenuListPanel)
+        if panel.selected_is_runnable:
+            panel.select_highlighted(refresh=True)
+
+    def action_cancel_action(self) -> None:
+        """Cancel the job highlighted in the jobs panel, or else the latest job of the
+        highlighted menu item, or else the latest job still queued or running."""
+        jobs_panel = self.query_one(JobsPanel)
+        if jobs_panel.has_focus_within:
+            job = self._jobs.get(jobs_panel.highlighted_job or 0)
+            candidates = [job] if job is not None and job.is_active else []
+        else:
+            candidates = self._jobs.active_for(self.query_one(MenuListPanel).selected_item)
+        if not candidates:
+            candidates = [job for job in self._jobs.jobs if job.is_active]
+        if candidates:
+            self._cancel_job(candidates[-1])
+
+    def _cancel_job(self, job: Job) -> None:
+        if job.state == RUNNING:
+            job.worker.cancel()
+        else:
+            self.query_one(OutputPanel).append_error(f"✗ {job.name} cancelled", job.id)
+            self._finish_job(job, CANCELLED)
+
+    def on_jobs_panel_job_selected(self, event: JobsPanel.JobSelected) -> None:
+        """Show the output of the selected job only, or of every job."""
+        output_panel = self.query_one(OutputPanel)
+        job = self._jobs.get(event.job_id) if event.job_id is not None else None
+        if job is None:
+            output_panel.show_job(None)
             self.query_one(MenuListPanel).focus()
+        else:
+            output_panel.show_job(job.id, f"#{job.id} {job.name}")
+
+    def on_unmount(self) -> None:
+        """Stop handing work to the action threads; running actions finish in the background.
+
+        Worker processes are stopped, and killed if they are still running an action.
+        Output capture stays installed until the actions still running are done.
+        """
+        uninstall_output_capture()
+        if self._action_pool is not None:
+            self._action_pool.shutdown(wait=False, cancel_futures=True)
+        for pool in self._process_pools.values():
+            pool.shutdown()
 
     def on_menu_list_panel_menu_item_selected(self, event: MenuListPanel.MenuItemSelected) -> None:
         """Handle a menu item selection from the list panel."""
@@ -171,33 +681,29 @@ class MenuApp(App):
 
         if item.submenu:
             self._navigate_to(item.submenu)
-        elif item.action:
-            self._execute_action(item)
+        elif item.is_runnable:
+            self._execute_action(item, refresh=event.refresh)
 
     def on_menu_sidebar_sidebar_item_selected(self, event: MenuSidebar.SidebarItemSelected) -> None:
         """Handle a sidebar node selection and navigate to the target menu."""
         target_menu = event.menu
-        self._menu_stack = [self.root_menu]
-        self._cursor_stack = [0]
-        self._find_path_to(self.root_menu, target_menu)
+        self._jump_to(target_menu)
 
         panel = self.query_one(MenuListPanel)
         panel.set_menu(self.current_menu)
         self.query_one(MenuSidebar).set_active(self.current_menu)
         self._update_breadcrumb()
 
-    def _find_path_to(self, current, target) -> bool:
-        if current is target:
-            return True
-        for item in current.items:
-            if item.submenu:
-                self._menu_stack.append(item.submenu)
-                self._cursor_stack.append(0)
-                if self._find_path_to(item.submenu, target):
-                    return True
-                self._menu_stack.pop()
-                self._cursor_stack.pop()
-        return False
+    def _jump_to(self, target) -> None:
+        """Rebuild the menu stack from the root to ``target`` by following parent links."""
+        chain = target.ancestors()
+        for depth, menu in enumerate(chain):
+            if menu is self.root_menu:
+                self._menu_stack = chain[depth:]
+                break
+        else:
+            self._menu_stack = [self.root_menu]
+        self._cursor_stack = [0] * len(self._menu_stack)
 
     def on_breadcrumb_bar_breadcrumb_navigate(
         self, event: BreadcrumbBar.BreadcrumbNavigate
@@ -218,17 +724,54 @@ class MenuApp(App):
         """Handle search query changes and update the menu list with filtered results."""
         panel = self.query_one(MenuListPanel)
         query = event.query.strip()
+        self._search_query = query
+        # A new query supersedes the pending and running searches
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+        self.workers.cancel_group(self, "search")
         if not query:
             # Clear search — show current menu items
             panel.clear_search()
             return
-        # Global search across all menus
-        query_lower = query.lower()
-        results = [sr for sr in self._global_index if query_lower in sr.item.title.lower()]
-        panel.set_search_results(results)
+        if not self._index_ready:
+            panel.set_search_status("Indexing…")
+            return
+        # Global search across all menus, off the event loop, once typing pauses
+        if self._search_debounce > 0:
+            self._search_timer = self.set_timer(
+                self._search_debounce, lambda: self._run_search(query)
+            )
+        else:
+            self._run_search(query)
+
+    @work(thread=True, exclusive=True, group="search")
+    def _run_search(self, query: str) -> None:
+        """Search in a worker thread and apply the latest result.
+
+        Starting a new search cancels the previous one, which then stops at its
+        next cancellation check without touching the results panel.
+        """
+        worker = get_current_worker()
+        if worker.is_cancelled:
+            return
+        try:
+            with self._search_lock:
+                page = self._search.search(query, lambda: worker.is_cancelled)
+        except SearchCancelled:
+            return
+        self.call_from_thread(self._apply_search_results, query, page)
+
+    def _apply_search_results(self, query: str, page: SearchPage) -> None:
+        if query != self._search_query:
+            return  # A newer query (or a cleared search bar) superseded this one
+        self.query_one(MenuListPanel).set_search_results(
+            page.results, total=page.total, exact=page.exact
+        )
 
     def action_go_back(self) -> None:
-        """Navigate back: clear search if active, otherwise pop the menu stack."""
+        """Navigate back: clear search if active, else cancel the highlighted item's running
+        command, if any, otherwise pop the menu stack."""
         panel = self.query_one(MenuListPanel)
         search = self.query_one(SearchBar)
         inp = search.query_one(Input)
@@ -240,6 +783,13 @@ class MenuApp(App):
             panel.focus()
             return
 
+        # Escape stops a command running from the item under the cursor before going back
+        item = panel.selected_item
+        commands = self._jobs.active_for(item) if item is not None and item.command else []
+        if commands:
+            self._cancel_job(commands[-1])
+            return
+
         if len(self._menu_stack) > 1:
             self._menu_stack.pop()
             self._cursor_stack.pop()
@@ -0,0 +1,197 @@
+"""On-disk snapshot cache for menus built from JSON files.
+
+A snapshot is the ``Menu``/``MenuItem`` tree built from a menu JSON file,
+compiled to nested tuples and stored with ``marshal`` together with the key of
+that file (absolute path, mtime, size and SHA-256 of the content). A snapshot
+is only reused while its key, the snapshot format and the Python version still
+match. The actions object is never written to disk; it is attached to every
+menu of the tree when the snapshot is loaded.
+"""
+
+import contextlib
+import gc
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from typing import Optional, Tuple
+
+from pymenu_cli.models.menu import Menu
+from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.results import CachePolicy
+
+SNAPSHOT_VERSION = 6
+SNAPSHOT_SUFFIX = ".pymenu-cache"
+
+_CHUNK_SIZE = 1 << 20
+
+MenuFileKey = Tuple[str, int, int, str]
+
+
+def menu_file_key(file_path: str) -> MenuFileKey:
+    """Compute the cache key of a menu JSON file.
+
+    Args:
+        file_path: Path to the menu JSON file.
+
+    Returns:
+        A (absolute path, mtime in ns, size, sha256 hex digest) tuple.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    path = os.path.abspath(file_path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        stat = os.fstat(file.fileno())
+        for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return (path, stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+
+
+def snapshot_path(file_path: str, cache_dir: Optional[str] = None) -> str:
+    """Return where the snapshot of a menu JSON file is stored.
+
+    Args:
+        file_path: Path to the menu JSON file.
+        cache_dir: Directory holding snapshots. If None, the snapshot is a
+                   hidden file next to the JSON file.
+
+    Returns:
+        The snapshot file path.
+    """
+    path = os.path.abspath(file_path)
+    if cache_dir is None:
+        directory, name = os.path.split(path)
+        return os.path.join(directory, f".{name}{SNAPSHOT_SUFFIX}")
+    name = hashlib.sha256(path.encode("utf-8")).hexdigest()[:32]
+    return os.path.join(os.path.expanduser(cache_dir), f"{name}{SNAPSHOT_SUFFIX}")
+
+
+def _encode_menu(menu: Menu) -> tuple:
+    items = tuple(
+        (
+            item.title,
+            item.action,
+            item.color,
+            _encode_menu(item.submenu) if item.submenu else None,
+            item.execution,
+            item.timeout,
+            tuple(item.cache) if item.cache else None,
+            item.command,
+            item.requires,
+        )
+        for item in menu.items
+    )
+    return (menu.title, menu.color, menu.banner, items)
+
+
+def _decode_menu(data: tuple, actions: object) -> Menu:
+    title, color, banner, items = data
+    config = {
+        "items": [
+            MenuItem(
+                item_title,
+                i_action=action,
+                i_submenu=_decode_menu(submenu, actions) if submenu else None,
+                i_color=item_color,
+                i_execution=execution,
+                i_timeout=timeout,
+                i_cache=CachePolicy(*cache) if cache else None,
+                i_command=command,
+                i_requires=requires,
+            )
+            for (
+                item_title,
+                action,
+                item_color,
+                submenu,
+                execution,
+                timeout,
+                cache,
+                command,
+                requires,
+            ) in items
+        ],
+        "actions": actions,
+        "color": color,
+        "banner": banner,
+    }
+    return Menu(i_title=title, i_config=config)
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Pause the cyclic garbage collector while a large object graph is allocated."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def load_snapshot(
+    key: MenuFileKey, actions: object, cache_dir: Optional[str] = None
+) -> Optional[Menu]:
+    """Load the snapshot of a menu JSON file if it is still valid.
+
+    Args:
+        key: The current key of the menu JSON file (see menu_file_key).
+        actions: The actions object to attach to the loaded menus.
+        cache_dir: Directory holding snapshots (see snapshot_path).
+
+    Returns:
+        The cached menu, or None if there is no valid snapshot.
+    """
+    try:
+        with open(snapshot_path(key[0], cache_dir), "rb") as file:
+            if marshal.load(file) != _snapshot_header(key):
+                return None
+            data = file.read()
+        with _gc_paused():
+            return _decode_menu(marshal.loads(data), actions)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def save_snapshot(menu: Menu, key: MenuFileKey, cache_dir: Optional[str] = None) -> bool:
+    """Atomically write the snapshot of a menu JSON file.
+
+    Args:
+        menu: The menu built from the JSON file.
+        key: The key of the JSON file the menu was built from.
+        cache_dir: Directory holding snapshots (see snapshot_path).
+
+    Returns:
+        True if the snapshot was written, False if the cache is not writable.
+    """
+    path = snapshot_path(key[0], cache_dir)
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as file:
+            marshal.dump(_snapshot_header(key), file)
+            file.write(marshal.dumps(_encode_menu(menu)))
+        os.replace(tmp_path, path)
+    except (OSError, ValueError):
+        _remove_quietly(tmp_path)
+        return False
+    return True
+
+
+def _snapshot_header(key: MenuFileKey) -> tuple:
+    return (SNAPSHOT_VERSION, marshal.version, tuple(sys.version_info[:2]), tuple(key))
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -5,9 +5,10 @@ Activated via the --classic CLI flag or display(classic=True).
 """
 
 # pylint: disable=import-outside-toplevel
+import functools
 import os
 import sys
-from typing import Optional
+from typing import List, Optional
 
 from pymenu_cli.ui.styles import BackgroundColors, Styles, TextColors
 
@@ -17,12 +18,19 @@ def _clear_screen() -> None:
     os.system("cls" if os.name == "nt" else "clear")
 
 
-def classic_display(menu) -> None:
+def classic_display(menu, metrics=None, root=None) -> None:
     """Display a menu using the classic input() loop.
 
     Args:
         menu: A Menu instance to display.
+        metrics (Optional[MetricsRegistry]): Where the cost of every run is recorded.
+                                            Each run is summarised either way, below the
+                                            redrawn menu.
+        root (Optional[Menu]): The root of the menu tree, where the actions that items
+                               require are looked up. Defaults to ``menu``.
     """
+    root = menu if root is None else root
+    notes: List[str] = []  # What the last choice did, shown below the redrawn menu
     while True:
         _clear_screen()
 
@@ -38,6 +46,10 @@ def classic_display(menu) -> None:
 
         print("\nB. Back")
         print("X. Exit")
+        if notes:
+            print()
+            print("\n".join(notes))
+            notes = []
 
         choice = input("\nEnter your choice: ").upper()
 
@@ -50,13 +62,98 @@ def classic_display(menu) -> None:
             if 0 <= index < len(menu.items):
                 selected_item = menu.items[index]
                 if selected_item.submenu:
-                    classic_display(selected_item.submenu)
-                elif selected_item.action:
-                    getattr(menu.actions, selected_item.action)()
+                    classic_display(selected_item.submenu, metrics, root)
+                elif selected_item.requires:
+                    _run_with_prerequisites(root, menu, selected_item, metrics, notes)
+                elif selected_item.is_runnable:
+                    _run_item(menu.actions, selected_item, metrics, notes)
             else:
                 raise ValueError
         except (ValueError, IndexError):
-            print("\nInvalid choice. Please try again.")
+            notes.append("Invalid choice. Please try again.")
+
+
+def _run_with_prerequisites(root, menu, item, metrics, notes: List[str]) -> None:
+    """Run the actions an item requires one after another, then its own action.
+
+    The run stops at the first prerequisite that fails, skipping the actions after it.
+    """
+    import traceback
+
+    from pymenu_cli.dag import resolve_prerequisites
+
+    try:
+        required = resolve_prerequisites(root, item.action, item.requires, {})
+    except ValueError as error:
+        notes.append(str(error))
+        return
+    for node, actions in required + [(item, menu.actions)]:
+        print(f"\n$ {node.action}()")
+        notes.append(f"$ {node.action}()")
+        try:
+            succeeded = _run_item(actions, node, metrics, notes)
+        except Exception:  # pylint: disable=broad-exception-caught
+            traceback.print_exc()
+            succeeded = False
+        if not succeeded and node is not item:
+            notes.append(f"↷ {item.action} skipped: {node.action} failed")
+            return
+
+
+def _run_item(actions, item, metrics, notes: List[str]) -> bool:
+    """Run an item's command or action, then note and record what the run cost.
+
+    Returns False if a command exited with a non-zero code or could not be started.
+    """
+    import shlex
+
+    from pymenu_cli.metrics import measure
+
+    succeeded = True
+    with measure() as measurement:
+        if item.command:
+            succeeded = _run_command(item.command, notes)
+        else:
+            _run_action(actions, item.action)
+    notes.append(measurement.result.describe())
+    if metrics is not None:
+        metrics.record(
+            shlex.join(item.command) if item.command else item.action, measurement.result
+        )
+    return succeeded
+
+
+def _run_action(actions, name: str) -> None:
+    """Call an action, running coroutine actions to completion on the private event loop."""
+    import inspect
+
+    action_fn = getattr(actions, name)
+    if inspect.iscoroutinefunction(action_fn):
+        _event_loop().run_until_complete(action_fn())
+    else:
+        action_fn()
+
+
+def _run_command(command, notes: List[str]) -> bool:
+    """Run a command item's program with the terminal, note its exit code, and return
+    whether it succeeded."""
+    import subprocess
+
+    try:
+        code = subprocess.run(command, check=False).returncode
+    except OSError as error:
+        notes.append(f"{command[0]}: {error}")
+        return False
+    notes.append(f"exit code {code}")
+    return code == 0
+
+
+@functools.lru_cache(maxsize=None)
+def _event_loop():
+    """Return the event loop async actions run on in classic mode, created on first use."""
+    import asyncio
+
+    return asyncio.new_event_loop()
 
 
 def _print_banner(banner: dict) -> None:
@@ -0,0 +1,108 @@
+"""Dependencies between actions.
+
+An action item may list the actions it ``"requires"``. Together they form a
+directed graph from action names to the names of their prerequisites, which
+must be acyclic: ``find_cycle`` is used to reject menus with cycles when they
+are loaded, and ``prerequisites`` orders what must run before an action.
+``resolve_prerequisites`` finds the items running them in a menu tree, only
+building as many lazy submenus as it takes.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+def find_cycle(graph: Mapping[str, Iterable[str]]) -> Optional[List[str]]:
+    """Return a cycle of the graph as a list of names whose first and last are the same,
+    or None if the graph is acyclic."""
+    done = set()
+    for start in graph:
+        if start in done:
+            continue
+        path = [start]
+        on_path = {start}
+        pending = [iter(graph.get(start, ()))]
+        while pending:
+            name = next(pending[-1], None)
+            if name is None:
+                pending.pop()
+                done.add(path[-1])
+                on_path.discard(path.pop())
+            elif name in on_path:
+                return path[path.index(name) :] + [name]
+            elif name not in done:
+                path.append(name)
+                on_path.add(name)
+                pending.append(iter(graph.get(name, ())))
+    return None
+
+
+def prerequisites(graph: Mapping[str, Iterable[str]], name: str) -> List[str]:
+    """Return every action ``name`` depends on, directly or not, each after its own
+    prerequisites. The graph must be acyclic."""
+    order: List[str] = []
+    seen = {name}
+    pending = [(name, iter(graph.get(name, ())))]
+    while pending:
+        current, requirements = pending[-1]
+        requirement = next(requirements, None)
+        if requirement is None:
+            pending.pop()
+            if current != name:
+                order.append(current)
+        elif requirement not in seen:
+            seen.add(requirement)
+            pending.append((requirement, iter(graph.get(requirement, ()))))
+    return order
+
+
+def action_items(menu, names: Optional[Iterable[str]] = None) -> Dict[str, Tuple[object, object]]:
+    """Map the action names of a menu tree to the first item running each, and the
+    actions object of that item's menu.
+
+    Lazy submenus are built on the way, so when ``names`` are given the walk stops as
+    soon as all of them are found.
+    """
+    wanted = None if names is None else set(names)
+    items: Dict[str, Tuple[object, object]] = {}
+    pending = [menu]
+    while pending:
+        if wanted is not None and wanted <= items.keys():
+            break
+        current = pending.pop()
+        for item in current.items:
+            if item.submenu:
+                pending.append(item.submenu)
+            elif item.action and item.action not in items:
+                items[item.action] = (item, current.actions)
+    return items
+
+
+def resolve_prerequisites(
+    menu, action: str, requires: Iterable[str], known: Dict[str, Tuple[object, object]]
+) -> List[Tuple[object, object]]:
+    """Return the (item, actions) pairs of every action ``action`` depends on, directly
+    or not, each after its own prerequisites.
+
+    Args:
+        menu: The root of the menu tree the required actions are looked up in.
+        action: The name of the action.
+        requires: The names of the actions it requires directly.
+        known: The (item, actions) pairs of the actions found so far, by name. Only the
+               missing ones are looked up, and they are added to it.
+
+    Raises:
+        ValueError: If some of the required actions are not in the menu tree.
+    """
+    while True:
+        graph = {name: item.requires or () for name, (item, _) in known.items()}
+        graph[action] = requires
+        names = prerequisites(graph, action)
+        missing = [name for name in names if name not in known]
+        if not missing:
+            return [known[name] for name in names]
+        found = action_items(menu, missing)
+        unknown = [name for name in missing if name not in found]
+        if unknown:
+            raise ValueError(f"{action} requires actions not in the menu: {', '.join(unknown)}")
+        for name, entry in found.items():
+            known.setdefault(name, entry)
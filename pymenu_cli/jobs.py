@@ -0,0 +1,252 @@
+"""Scheduling action runs as jobs.
+
+Every action started from the TUI becomes a ``Job``. A ``JobScheduler`` runs
+at most ``limit`` jobs at once and starts the others in the order they were
+submitted as running jobs finish. Each job keeps its own output, so the
+output of one run can be viewed on its own while others are still writing.
+Jobs submitted together form a ``Batch``, of which at most the batch's own
+limit run at once. A job may also require other jobs: it waits until they
+are done, and is skipped if any of them fails, is cancelled or is skipped.
+"""
+
+from __future__ import annotations
+
+import itertools
+import shlex
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Iterable, List, Optional, Tuple
+
+from pymenu_cli.metrics import RunMetrics
+from pymenu_cli.models.menu_item import MenuItem
+
+MAX_JOBS = 4
+JOB_HISTORY = 100
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+SKIPPED = "skipped"
+
+
+@dataclass(eq=False)
+class Job:  # pylint: disable=too-many-instance-attributes
+    """One run of an action.
+
+    Attributes:
+        id (int): Sequential number of the job, starting at 1.
+        item (MenuItem): The menu item whose action runs.
+        actions (object): The object holding the action functions.
+        state (str): One of QUEUED, RUNNING, DONE, FAILED, CANCELLED or SKIPPED.
+        submitted_at (float): ``time.monotonic()`` when the job was submitted.
+        started_at (Optional[float]): When the job started running.
+        finished_at (Optional[float]): When the job finished, failed or was cancelled.
+        output (List[Tuple[bool, str]]): The (is_error, text) chunks the job has written.
+        worker (Optional[object]): The worker running the job, while it runs.
+        metrics (Optional[RunMetrics]): What the run cost, once it has completed.
+        batch (Optional[Batch]): The batch the job was submitted in, if any.
+        requires (List[Job]): The jobs that must be done before this one starts.
+    """
+
+    id: int
+    item: MenuItem
+    actions: object
+    state: str = QUEUED
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    output: List[Tuple[bool, str]] = field(default_factory=list)
+    worker: Optional[object] = None
+    metrics: Optional[RunMetrics] = None
+    batch: Optional["Batch"] = None
+    requires: List["Job"] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        """The name of the job's action, or the command line of its command."""
+        if self.item.command:
+            return shlex.join(self.item.command)
+        return self.item.action
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is queued or running."""
+        return self.state in (QUEUED, RUNNING)
+
+    def duration(self, now: Optional[float] = None) -> Optional[float]:
+        """Return how long the job has been running, or ran, in seconds; None while queued."""
+        if self.started_at is None:
+            return None
+        end = self.finished_at
+        if end is None:
+            end = time.monotonic() if now is None else now
+        return end - self.started_at
+
+
+@dataclass(eq=False)
+class Batch:
+    """Jobs submitted together, of which at most ``limit`` run at once.
+
+    Attributes:
+        id (int): Sequential number of the batch, starting at 1.
+        limit (int): The maximum number of the batch's jobs running at once.
+        jobs (List[Job]): The jobs of the batch, in the order they were submitted.
+    """
+
+    id: int
+    limit: int
+    jobs: List[Job] = field(default_factory=list)
+
+    @property
+    def running(self) -> int:
+        """The number of the batch's jobs that are running."""
+        return sum(job.state == RUNNING for job in self.jobs)
+
+    @property
+    def is_done(self) -> bool:
+        """Whether every job of the batch has finished, failed or been cancelled."""
+        return not any(job.is_active for job in self.jobs)
+
+    def duration(self) -> Optional[float]:
+        """Return the seconds from the first job starting to the last one finishing, if
+        any job ran and the batch is done."""
+        started = [job.started_at for job in self.jobs if job.started_at is not None]
+        if not started or not self.is_done:
+            return None
+        return max(job.finished_at for job in self.jobs) - min(started)
+
+
+class JobScheduler:
+    """Runs at most ``limit`` jobs at once, starting queued jobs first in, first out.
+
+    The scheduler only keeps the books: ``start_ready`` returns the jobs that
+    may start now and the caller runs them, then reports back with ``finish``.
+    """
+
+    def __init__(self, limit: int = MAX_JOBS, history: int = JOB_HISTORY) -> None:
+        """
+        Args:
+            limit: The maximum number of jobs running at once.
+            history: The number of finished jobs to keep.
+
+        Raises:
+            ValueError: If ``limit`` is less than 1.
+        """
+        if limit < 1:
+            raise ValueError(f"The job limit must be at least 1, not {limit}")
+        self.limit = limit
+        self._history = history
+        self._ids = itertools.count(1)
+        self._batch_ids = itertools.count(1)
+        self._jobs: List[Job] = []
+        self._queue: Deque[Job] = deque()
+        self._running: List[Job] = []
+
+    @property
+    def jobs(self) -> List[Job]:
+        """Every job still known to the scheduler, oldest first."""
+        return list(self._jobs)
+
+    @property
+    def running(self) -> List[Job]:
+        """The running jobs, oldest first."""
+        return list(self._running)
+
+    @property
+    def queued(self) -> List[Job]:
+        """The queued jobs, in the order they will start."""
+        return list(self._queue)
+
+    def submit(self, item: MenuItem, actions: object) -> Job:
+        """Queue a run of an item's action and return its job."""
+        job = Job(next(self._ids), item, actions)
+        self._jobs.append(job)
+        self._queue.append(job)
+        return job
+
+    def submit_batch(self, entries: Iterable[Tuple[MenuItem, object]], limit: int) -> Batch:
+        """Queue a run of each (item, actions) pair as one batch and return it.
+
+        Raises:
+            ValueError: If ``limit`` is less than 1.
+        """
+        if limit < 1:
+            raise ValueError(f"The batch limit must be at least 1, not {limit}")
+        batch = Batch(next(self._batch_ids), limit)
+        for item, actions in entries:
+            job = self.submit(item, actions)
+            job.batch = batch
+            batch.jobs.append(job)
+        return batch
+
+    def start_ready(self) -> List[Job]:
+        """Mark as many queued jobs running as the limits allow, and return them.
+
+        A job whose batch is at its limit, or whose required jobs are not all done yet,
+        stays queued without holding up the jobs behind it.
+        """
+        started = []
+        held: Deque[Job] = deque()
+        while self._queue and len(self._running) < self.limit:
+            job = self._queue.popleft()
+            if (job.batch is not None and job.batch.running >= job.batch.limit) or any(
+                required.state != DONE for required in job.requires
+            ):
+                held.append(job)
+                continue
+            job.state = RUNNING
+            job.started_at = time.monotonic()
+            self._running.append(job)
+            started.append(job)
+        held.extend(self._queue)
+        self._queue = held
+        return started
+
+    def finish(self, job: Job, state: str = DONE) -> List[Job]:
+        """Record that a job stopped, and forget the oldest finished jobs beyond the history.
+
+        Returns:
+            The queued jobs skipped because they require, directly or not, a job that did
+            not end up done.
+        """
+        if job in self._running:
+            self._running.remove(job)
+        elif job in self._queue:
+            self._queue.remove(job)
+        else:
+            return []
+        self._stop(job, state)
+        skipped = []
+        if state != DONE:
+            # Required jobs are submitted first, so one pass reaches indirect dependents
+            for queued in list(self._queue):
+                if any(
+                    required.state in (FAILED, CANCELLED, SKIPPED) for required in queued.requires
+                ):
+                    self._queue.remove(queued)
+                    self._stop(queued, SKIPPED)
+                    skipped.append(queued)
+        finished = [known for known in self._jobs if not known.is_active]
+        for old in finished[: max(0, len(finished) - self._history)]:
+            self._jobs.remove(old)
+        return skipped
+
+    @staticmethod
+    def _stop(job: Job, state: str) -> None:
+        job.state = state
+        job.finished_at = time.monotonic()
+        job.worker = None
+
+    def get(self, job_id: int) -> Optional[Job]:
+        """Return the job with the given id, if it is still known."""
+        for job in self._jobs:
+            if job.id == job_id:
+                return job
+        return None
+
+    def active_for(self, item: Optional[MenuItem]) -> List[Job]:
+        """Return the queued and running jobs of a menu item, oldest first."""
+        return [job for job in self._jobs if job.item is item and job.is_active]
@@ -0,0 +1,250 @@
+"""Latency and resource metrics of action runs.
+
+Every run started from the TUI or from classic mode is measured for wall time,
+CPU time and the growth of the process's peak resident set size, and recorded
+in per-action histograms. ``MetricsRegistry.to_openmetrics`` renders them in
+the OpenMetrics text format.
+
+CPU time is only reported where it can be attributed to the run: that of the
+thread running a thread action, that of the worker process running a
+process-isolated action, and, in classic mode, where one run happens at a
+time, that of the whole menu process plus its reaped children. Async actions
+and commands in the TUI share the process with other jobs, so their CPU time
+is left out rather than mixed with everything else.
+
+The peak RSS delta is how much the run raised a high-water mark, which stays
+at zero once an earlier run has peaked higher: that of the worker process
+running a process-isolated action, that of the menu's reaped children for a
+command, and, in classic mode, those of the menu process and of its reaped
+children. Thread and async actions in the TUI share the menu process with
+other jobs, so their peak RSS delta is left out.
+"""
+
+import contextlib
+import sys
+import threading
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Upper bounds of the histogram buckets
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+BYTES_BUCKETS = tuple(1 << shift for shift in range(10, 32, 2))  # 1 KiB to 1 GiB
+
+_FAMILIES = (
+    ("pymenu_action_wall_seconds", "seconds", "Wall-clock time of action runs.", SECONDS_BUCKETS),
+    ("pymenu_action_cpu_seconds", "seconds", "CPU time of action runs.", SECONDS_BUCKETS),
+    (
+        "pymenu_action_peak_rss_delta_bytes",
+        "bytes",
+        "Growth of the peak resident set size during action runs.",
+        BYTES_BUCKETS,
+    ),
+)
+
+
+class RunMetrics(NamedTuple):
+    """What one action run cost.
+
+    Attributes:
+        wall (float): Wall-clock seconds.
+        cpu (Optional[float]): CPU seconds, or None where they cannot be attributed to the run.
+        rss_delta (Optional[int]): Bytes the peak RSS grew by, or None where unknown.
+    """
+
+    wall: float
+    cpu: Optional[float]
+    rss_delta: Optional[int]
+
+    def describe(self) -> str:
+        """Return a one-line summary, e.g. ``⏱ 1.20s wall · 0.80s CPU · +12.0 MiB peak RSS``."""
+        parts = [f"⏱ {self.wall:.2f}s wall"]
+        if self.cpu is not None:
+            parts.append(f"{self.cpu:.2f}s CPU")
+        if self.rss_delta is not None:
+            parts.append(f"+{_format_bytes(self.rss_delta)} peak RSS")
+        return " · ".join(parts)
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def peak_rss(children: bool = False) -> Optional[int]:
+    """Return the peak resident set size of this process in bytes, or None where unknown.
+
+    Args:
+        children: Return the largest peak of the child processes that were reaped instead.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    peak = peak.ru_maxrss
+    # Linux reports kibibytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def peak_rss_growth(since: Optional[int], children: bool = False) -> Optional[int]:
+    """Return how many bytes a peak returned by ``peak_rss`` grew by, or None where unknown.
+
+    Args:
+        since: What ``peak_rss`` returned at the start.
+        children: Whether ``since`` is the peak of the reaped child processes.
+    """
+    peak = peak_rss(children)
+    return None if peak is None or since is None else peak - since
+
+
+def cpu_time() -> float:
+    """Return the CPU seconds used by this process and its reaped children."""
+    cpu = time.process_time()
+    if resource is not None:
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu += children.ru_utime + children.ru_stime
+    return cpu
+
+
+class Measurement:  # pylint: disable=too-few-public-methods
+    """The metrics of a run in progress; ``result`` is set when the run ends."""
+
+    def __init__(self, process_wide: bool = True) -> None:
+        """
+        Args:
+            process_wide: Whether the CPU time and the peak RSS growth of the whole
+                          process and of its reaped children are the run's own when
+                          ``stop`` is not given figures of the run's own. Only true
+                          when nothing else runs at the same time.
+        """
+        self._wall = time.perf_counter()
+        self._cpu = cpu_time() if process_wide else None
+        self._rss = (peak_rss(), peak_rss(children=True)) if process_wide else None
+        self.result: Optional[RunMetrics] = None
+
+    def stop(self, cpu: Optional[float] = None, rss_delta: Optional[int] = None) -> RunMetrics:
+        """End the measurement.
+
+        Args:
+            cpu: The CPU seconds of the run, if known more precisely than the
+                 process-wide figure, e.g. from the thread or process that ran it.
+            rss_delta: The bytes the peak RSS grew by during the run, if known more
+                       precisely than the process-wide figure, e.g. from the process
+                       that ran it.
+        """
+        if cpu is None and self._cpu is not None:
+            cpu = cpu_time() - self._cpu
+        if rss_delta is None and self._rss is not None:
+            own = peak_rss_growth(self._rss[0])
+            children = peak_rss_growth(self._rss[1], children=True)
+            if own is not None and children is not None:
+                rss_delta = own + children
+        self.result = RunMetrics(time.perf_counter() - self._wall, cpu, rss_delta)
+        return self.result
+
+
+@contextlib.contextmanager
+def measure() -> Iterator[Measurement]:
+    """Measure the code run in the ``with`` block; the metrics are in ``result`` afterwards."""
+    measurement = Measurement()
+    try:
+        yield measurement
+    finally:
+        measurement.stop()
+
+
+class Histogram:
+    """A cumulative histogram with fixed bucket bounds, as in OpenMetrics."""
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # The last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count a value in the first bucket whose bound is at least the value."""
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                break
+        else:
+            index = len(self.bounds)
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return (upper bound, number of values at most that bound) pairs, ending with +Inf."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class MetricsRegistry:
+    """Per-action histograms of wall time, CPU time and peak RSS growth. Thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[str, Histogram]] = {}
+
+    def record(self, action: str, metrics: RunMetrics) -> None:
+        """Add the metrics of one run of an action to its histograms."""
+        values = (metrics.wall, metrics.cpu, metrics.rss_delta)
+        with self._lock:
+            for (family, _, _, bounds), value in zip(_FAMILIES, values):
+                if value is None:
+                    continue
+                per_action = self._histograms.setdefault(family, {})
+                histogram = per_action.get(action)
+                if histogram is None:
+                    histogram = per_action[action] = Histogram(bounds)
+                histogram.observe(value)
+
+    def histogram(self, family: str, action: str) -> Optional[Histogram]:
+        """Return the histogram of a metric family for an action, if it has any values."""
+        with self._lock:
+            return self._histograms.get(family, {}).get(action)
+
+    def to_openmetrics(self) -> str:
+        """Render every histogram in the OpenMetrics text exposition format."""
+        lines = []
+        with self._lock:
+            for family, unit, help_text, _ in _FAMILIES:
+                lines.append(f"# TYPE {family} histogram")
+                lines.append(f"# UNIT {family} {unit}")
+                lines.append(f"# HELP {family} {help_text}")
+                for action, histogram in sorted(self._histograms.get(family, {}).items()):
+                    label = f'action="{_escape_label(action)}"'
+                    for bound, count in histogram.cumulative():
+                        lines.append(
+                            f'{family}_bucket{{{label},le="{_format_bound(bound)}"}} {count}'
+                        )
+                    lines.append(f"{family}_count{{{label}}} {histogram.count}")
+                    lines.append(f"{family}_sum{{{label}}} {histogram.sum!r}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_openmetrics(self, path: str) -> None:
+        """Write the histograms to a file in the OpenMetrics text format."""
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_openmetrics())
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    if bound == float("inf"):
+        return "+Inf"
+    return repr(float(bound))
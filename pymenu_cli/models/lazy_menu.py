@@ -0,0 +1,119 @@
+"""This module defines the LazyMenu class, a menu whose items are built on first access."""
+
+import threading
+from typing import Callable, Dict, List, Optional
+
+from pymenu_cli.models.menu import Menu
+from pymenu_cli.models.menu_item import MenuItem
+
+_LOAD_LOCK = threading.RLock()
+
+
+class LazyMenu(Menu):
+    """A menu whose items are materialized the first time they are needed.
+
+    The title, color, banner and actions are available immediately. The items
+    are built by the loader on the first access to ``items`` (or ``add_item``)
+    and memoized, so a tree of lazy menus only pays for the menus that are
+    actually visited.
+
+    Attributes:
+        __m_loader (Optional[Callable[[], List[MenuItem]]]): Builds the items.
+                                                             None once loaded.
+        __m_items_data (Optional[List[Dict]]): The JSON data the items are built from, if any.
+        __m_listeners (List[Callable[[LazyMenu], None]]): Called once the items are built.
+    """
+
+    def __init__(
+        self,
+        i_title: str,
+        i_loader: Callable[[], List[MenuItem]],
+        i_config: Optional[Dict] = None,
+        i_items_data: Optional[List[Dict]] = None,
+    ):
+        """
+        Initialize the LazyMenu instance.
+
+        Args:
+            i_title (str): The title of the menu.
+            i_loader (Callable[[], List[MenuItem]]): Returns the items of the menu.
+            i_config (Optional[Dict]): Optional settings for actions, color, and banner.
+            i_items_data (Optional[List[Dict]]): The JSON data the loader builds the items
+                                                 from, to look through them without building.
+        """
+        super().__init__(i_title, i_config)
+        self.__m_loader = i_loader
+        self.__m_items_data = i_items_data
+        self.__m_listeners: List[Callable[["LazyMenu"], None]] = []
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Whether the items of the menu have been built.
+
+        Returns:
+            bool: True once the loader has run.
+        """
+        return self.__m_loader is None
+
+    @property
+    def items_data(self) -> Optional[List[Dict]]:
+        """
+        Gets the JSON data the items are built from, without building them.
+
+        Returns:
+            Optional[List[Dict]]: The data of the items, or None if the loader has none.
+        """
+        return self.__m_items_data
+
+    @property
+    def items(self) -> List[MenuItem]:
+        """
+        Gets the items in the menu, building them on first access.
+
+        Returns:
+            List[MenuItem]: A list of items in the menu.
+        """
+        self._materialize()
+        return super().items
+
+    def add_item(self, item: MenuItem) -> None:
+        """Adds an item to the menu after the loaded items.
+
+        Args:
+            item (MenuItem): The item to add.
+        """
+        self._materialize()
+        super().add_item(item)
+
+    def add_load_listener(self, listener: Callable[["LazyMenu"], None]) -> bool:
+        """Registers a function to call with this menu once its items are built.
+
+        The listener is called in the thread that builds the items, after they are built.
+        Lazy submenus among them do not inherit it.
+
+        Args:
+            listener (Callable[[LazyMenu], None]): The function to call.
+
+        Returns:
+            bool: False, and the listener is not registered, if the items are already built.
+        """
+        with _LOAD_LOCK:
+            if self.__m_loader is None:
+                return False
+            self.__m_listeners.append(listener)
+            return True
+
+    def _materialize(self) -> None:
+        if self.__m_loader is None:
+            return
+        with _LOAD_LOCK:
+            loader = self.__m_loader
+            if loader is None:
+                return
+            for item in loader():
+                super().add_item(item)
+            self.__m_loader = None
+            listeners, self.__m_listeners = self.__m_listeners, []
+        for listener in listeners:
+            listener(self)
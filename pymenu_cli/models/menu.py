@@ -3,8 +3,9 @@ This module defines the Menu class, which represents a text-based menu system.
 """
 
 # pylint: disable=import-outside-toplevel
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union
 
+from pymenu_cli.metrics import MetricsRegistry
 from pymenu_cli.models.menu_item import MenuItem
 
 
@@ -17,8 +18,11 @@ class Menu:
         __m_actions (Optional[object]): An object containing callable actions.
         __m_color (Optional[Dict]): The color settings for the menu title.
         __m_banner (Optional[Dict]): The banner for the menu.
+        __m_parent (Optional[Menu]): The menu whose item opens this menu, if any.
     """
 
+    PATH_SEPARATOR = "/"
+
     def __init__(self, i_title: str, i_config: Optional[Dict] = None):
         """
         Initialize the Menu instance.
@@ -34,6 +38,9 @@ class Menu:
         self.__m_actions = i_config.get("actions")
         self.__m_color = i_config.get("color")
         self.__m_banner = i_config.get("banner")
+        self.__m_parent: Optional[Menu] = None
+        for item in self.__m_items:
+            self._adopt(item)
 
     @property
     def title(self) -> str:
@@ -85,6 +92,54 @@ class Menu:
         """
         return self.__m_banner
 
+    @property
+    def parent(self) -> Optional["Menu"]:
+        """
+        Gets the menu that contains the item opening this menu.
+
+        Returns:
+            Optional[Menu]: The parent menu, or None for a root menu.
+        """
+        return self.__m_parent
+
+    def ancestors(self) -> List["Menu"]:
+        """
+        Gets the chain of menus from the root down to this menu, in O(depth).
+
+        Returns:
+            List[Menu]: The root menu first and this menu last.
+        """
+        chain = [self]
+        while chain[-1].parent is not None:
+            chain.append(chain[-1].parent)
+        chain.reverse()
+        return chain
+
+    def find(self, path: Union[str, Sequence[str]]) -> Optional[MenuItem]:
+        """
+        Finds an item by the titles leading to it from this menu.
+
+        Args:
+            path (Union[str, Sequence[str]]): Item titles, one per level, as a sequence
+                                              or joined with ``PATH_SEPARATOR``,
+                                              e.g. ``"Tools/Settings/General"``.
+
+        Returns:
+            Optional[MenuItem]: The first item matching the path, or None if there is none.
+        """
+        if isinstance(path, str):
+            path = path.split(self.PATH_SEPARATOR)
+        menu: Optional[Menu] = self
+        item = None
+        for title in path:
+            if menu is None:
+                return None
+            item = next((item for item in menu.items if item.title == title), None)
+            if item is None:
+                return None
+            menu = item.submenu
+        return item
+
     def add_item(self, item: MenuItem) -> None:
         """Adds an item to the menu.
 
@@ -92,24 +147,62 @@ class Menu:
             item (MenuItem): The item to add.
         """
         self.__m_items.append(item)
-
-    def display(self, classic: bool = False, theme: str = "dark") -> None:
+        self._adopt(item)
+
+    def _adopt(self, item: MenuItem) -> None:
+        """Make this menu the parent of the item's submenu."""
+        if item.submenu is not None:
+            item.submenu.__m_parent = self  # pylint: disable=protected-access
+
+    def display(  # pylint: disable=too-many-arguments
+        self,
+        classic: bool = False,
+        theme: str = "dark",
+        execution: str = "thread",
+        action_timeout: Optional[float] = None,
+        max_jobs: int = 4,
+        *,
+        batch_limit: Optional[int] = None,
+        metrics_file: Optional[str] = None,
+    ) -> None:
         """Display the menu.
 
         Args:
             classic: If True, use the classic input() display mode.
             theme: Theme name ('dark' or 'light'). Only used in TUI mode.
+            execution: Where actions run unless their item overrides it ('thread' or
+                       'process'). Only used in TUI mode.
+            action_timeout: Seconds after which a process-isolated action is killed,
+                            unless its item sets a timeout. Only used in TUI mode.
+            max_jobs: The number of actions that may run at once. Only used in TUI mode.
+            batch_limit: The number of marked actions run together that may run at once.
+                         Defaults to ``max_jobs``. Only used in TUI mode.
+            metrics_file: If given, the histograms of the time and memory used by every
+                          run are written to this file in OpenMetrics text format on exit.
         """
-        if classic:
-            # Lazy import to avoid circular dependency
-            from pymenu_cli.classic import classic_display
-
-            classic_display(self)
-            return
-        from pymenu_cli.app import MenuApp  # Lazy import to avoid circular dependency
-
-        app = MenuApp(self, theme=theme)
-        app.run()
+        metrics = MetricsRegistry()
+        try:
+            if classic:
+                # Lazy import to avoid circular dependency
+                from pymenu_cli.classic import classic_display
+
+                classic_display(self, metrics)
+                return
+            from pymenu_cli.app import MenuApp  # Lazy import to avoid circular dependency
+
+            app = MenuApp(
+                self,
+                theme=theme,
+                execution=execution,
+                action_timeout=action_timeout,
+                max_jobs=max_jobs,
+                batch_limit=batch_limit,
+                metrics=metrics,
+            )
+            app.run()
+        finally:
+            if metrics_file is not None:
+                metrics.write_openmetrics(metrics_file)
 
     def print_banner(self) -> None:
         """Print the banner. Delegates to classic module."""
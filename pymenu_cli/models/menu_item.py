@@ -1,9 +1,9 @@
 """This module defines the MenuItem class, which represents an item in a menu."""
 
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 
 
-class MenuItem:
+class MenuItem:  # pylint: disable=too-many-instance-attributes
     """
     Represents an item in a menu.
 
@@ -12,14 +12,26 @@ class MenuItem:
         __m_action (Optional[str]): The action associated with the menu item.
         __m_submenu (Optional['Menu']): A submenu associated with the menu item.
         __m_color (Optional[dict]): The color settings for the menu item title.
+        __m_execution (Optional[str]): Where the action runs ('thread' or 'process').
+        __m_timeout (Optional[float]): Seconds after which a process-isolated action is killed.
+        __m_cache (Optional['CachePolicy']): How long the output of the action is replayed.
+        __m_command (Optional[Tuple[str, ...]]): A program and its arguments run instead of
+                                                 an action.
+        __m_requires (Optional[Tuple[str, ...]]): The actions that must succeed first.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         i_title: str,
         i_action: Optional[str] = None,
         i_submenu: Optional["Menu"] = None,
         i_color: Optional[dict] = None,
+        *,
+        i_execution: Optional[str] = None,
+        i_timeout: Optional[float] = None,
+        i_cache: Optional["CachePolicy"] = None,
+        i_command: Optional[Sequence[str]] = None,
+        i_requires: Optional[Sequence[str]] = None,
     ):
         """
         Args:
@@ -27,11 +39,29 @@ class MenuItem:
             i_action (Optional[str]): The action associated with the menu item. Defaults to None.
             i_submenu (Optional['Menu']): A submenu associated with the menu item. Defaults to None.
             i_color (Optional[dict]): The color settings for the menu item title. Defaults to None.
+            i_execution (Optional[str]): Where the action runs: 'thread' or 'process'.
+                                         Defaults to None, which uses the app's default.
+            i_timeout (Optional[float]): Seconds after which the action is killed when it
+                                         runs in a process. Defaults to None (no limit).
+            i_cache (Optional['CachePolicy']): Replay the output of the last successful run
+                                               instead of running the action again while it
+                                               is fresh. Defaults to None (always run).
+            i_command (Optional[Sequence[str]]): A program and its arguments to run in a
+                                                 subprocess instead of an action.
+                                                 Defaults to None.
+            i_requires (Optional[Sequence[str]]): The names of the actions that must run,
+                                                  and succeed, before this item's action.
+                                                  Defaults to None.
         """
         self.__m_title = i_title
         self.__m_action = i_action
         self.__m_submenu = i_submenu
         self.__m_color = i_color
+        self.__m_execution = i_execution
+        self.__m_timeout = i_timeout
+        self.__m_cache = i_cache
+        self.__m_command = tuple(i_command) if i_command is not None else None
+        self.__m_requires = tuple(i_requires) if i_requires else None
 
     @property
     def title(self) -> str:
@@ -72,3 +102,63 @@ class MenuItem:
             Optional['Menu']: The submenu associated with the menu item.
         """
         return self.__m_submenu
+
+    @property
+    def execution(self) -> Optional[str]:
+        """
+        Gets where the action of the menu item runs.
+
+        Returns:
+            Optional[str]: 'thread', 'process', or None to use the app's default.
+        """
+        return self.__m_execution
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """
+        Gets the timeout of the action of the menu item.
+
+        Returns:
+            Optional[float]: Seconds after which a process-isolated action is killed, or None.
+        """
+        return self.__m_timeout
+
+    @property
+    def cache(self) -> Optional["CachePolicy"]:
+        """
+        Gets the caching policy of the action of the menu item.
+
+        Returns:
+            Optional['CachePolicy']: How long the output of the action is replayed, or None.
+        """
+        return self.__m_cache
+
+    @property
+    def command(self) -> Optional[Tuple[str, ...]]:
+        """
+        Gets the command run by the menu item.
+
+        Returns:
+            Optional[Tuple[str, ...]]: The program and its arguments, or None for an action.
+        """
+        return self.__m_command
+
+    @property
+    def requires(self) -> Optional[Tuple[str, ...]]:
+        """
+        Gets the prerequisites of the action of the menu item.
+
+        Returns:
+            Optional[Tuple[str, ...]]: The names of the actions that must succeed first, or None.
+        """
+        return self.__m_requires
+
+    @property
+    def is_runnable(self) -> bool:
+        """
+        Checks whether selecting the menu item runs something.
+
+        Returns:
+            bool: True if the item has an action or a command, and no submenu.
+        """
+        return not self.__m_submenu and bool(self.__m_action or self.__m_command)
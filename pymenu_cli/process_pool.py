@@ -0,0 +1,327 @@
+"""Running actions in a pool of warm worker processes.
+
+Each worker process imports the actions module once, when it starts, and
+then runs one action at a time for as long as it lives, so an action only
+pays the import cost of the module on the worker's first job. An action that
+hangs, crashes or exceeds its timeout only takes its own worker down: the
+worker is killed and replaced, and the menu process keeps running.
+
+Workers are started with the ``forkserver`` method where it exists, so they
+are forked from a clean server process rather than from the multi-threaded
+UI process, and with ``spawn`` elsewhere.
+"""
+
+# pylint: disable=import-outside-toplevel
+import asyncio
+import contextlib
+import inspect
+import io
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, NamedTuple, Optional, TextIO
+
+from pymenu_cli.actions import DeferredActions
+from pymenu_cli.metrics import cpu_time, peak_rss, peak_rss_growth
+from pymenu_cli.pymenu import load_actions_module
+
+PROCESS_WORKERS = 2
+POLL_INTERVAL = 0.05
+
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _has_file_descriptor(stream) -> bool:
+    try:
+        return stream.fileno() >= 0
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _start_helper_processes() -> None:
+    """Start the forkserver and resource tracker processes, with a usable stderr.
+
+    Both hand ``sys.stderr``'s file descriptor to the helper process they start,
+    and a running TUI replaces sys.stderr with a stream that has none.
+    """
+    if os.name != "posix" or _has_file_descriptor(sys.stderr):
+        return
+    from multiprocessing import forkserver, resource_tracker
+
+    stderr, sys.stderr = sys.stderr, sys.__stderr__
+    try:
+        resource_tracker.ensure_running()
+        if _START_METHOD == "forkserver":
+            forkserver.ensure_running()
+    finally:
+        sys.stderr = stderr
+
+
+def actions_file(actions: object) -> Optional[str]:
+    """Return the path of the file an actions object was loaded from, or None."""
+    if isinstance(actions, DeferredActions):
+        return actions._path
+    path = getattr(actions, "__file__", None)  # A loaded actions module
+    return path if isinstance(path, str) else None
+
+
+class _PipeStream(io.TextIOBase):
+    """Sends what a worker process writes back to the parent, a line at a time."""
+
+    def __init__(self, conn, is_error: bool) -> None:
+        super().__init__()
+        self._conn = conn
+        self._is_error = is_error
+        self._partial = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        head, newline, self._partial = (self._partial + text).rpartition("\n")
+        if newline:
+            self._conn.send(("out", self._is_error, head + newline))
+        return len(text)
+
+    def send_partial(self) -> None:
+        """Send the unfinished last line, if any."""
+        if self._partial:
+            self._conn.send(("out", self._is_error, self._partial))
+            self._partial = ""
+
+
+def _worker_main(conn, actions_path: str) -> None:
+    """Run in a worker process: import the actions module, then run actions until told to stop."""
+    load_error = None
+    try:
+        # Output of the module body was already shown when the menu process imported it
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            actions = load_actions_module(actions_path)
+    except Exception:  # pylint: disable=broad-exception-caught
+        actions = None
+        load_error = traceback.format_exc()
+    conn.send(("ready",))
+
+    stdout = sys.stdout = _PipeStream(conn, False)
+    stderr = sys.stderr = _PipeStream(conn, True)
+    while True:
+        try:
+            name = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if name is None:
+            return
+        error = load_error
+        started = cpu_time()
+        started_rss = peak_rss()
+        if error is None:
+            try:
+                result = getattr(actions, name)()
+                if inspect.isawaitable(result):
+                    asyncio.run(result)
+            except Exception:  # pylint: disable=broad-exception-caught
+                error = traceback.format_exc()
+        stdout.send_partial()
+        stderr.send_partial()
+        conn.send(("done", error, cpu_time() - started, peak_rss_growth(started_rss)))
+
+
+class PoolRun(NamedTuple):
+    """The outcome of running an action in a worker process.
+
+    Attributes:
+        error (Optional[str]): An error message or traceback if the action failed.
+        cpu_time (Optional[float]): CPU seconds the worker, and the children it reaped,
+                                    used for the action; None if the worker was killed.
+        rss_delta (Optional[int]): Bytes the worker's peak RSS grew by during the action;
+                                   None if the worker was killed or where unknown.
+    """
+
+    error: Optional[str]
+    cpu_time: Optional[float] = None
+    rss_delta: Optional[int] = None
+
+
+class _Worker(NamedTuple):
+    process: multiprocessing.Process
+    conn: object
+
+
+class ProcessPool:
+    """A fixed number of worker processes with the actions module already imported.
+
+    ``run`` blocks until the action finishes, so it is meant to be called from
+    a thread; runs beyond the number of workers wait for a worker to be free,
+    and can be cancelled while they wait.
+    """
+
+    def __init__(self, actions_path: str, workers: int = PROCESS_WORKERS) -> None:
+        """
+        Args:
+            actions_path: The path to the actions Python file.
+            workers: The number of worker processes.
+        """
+        self.actions_path = actions_path
+        self.size = workers
+        self._context = multiprocessing.get_context(_START_METHOD)
+        self._idle: queue.Queue = queue.Queue()
+        # Every live worker, and whether it has imported the actions module yet
+        self._workers: Dict[_Worker, bool] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the worker processes, unless they are already running."""
+        with self._lock:
+            if self._workers or self._closed:
+                return
+            _start_helper_processes()
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.actions_path),
+            name="pymenu-action-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self._workers[worker] = False
+        return worker
+
+    def _replace(self, worker: _Worker) -> None:
+        """Kill a worker and start a new one in its place."""
+        worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+        with self._lock:
+            self._workers.pop(worker, None)
+            if not self._closed:
+                self._idle.put(self._spawn())
+
+    def _acquire(self, cancel_event: Optional[threading.Event]) -> Optional[_Worker]:
+        """Wait for an idle worker, or return None if the run is cancelled first.
+
+        Raises:
+            RuntimeError: If the pool is shut down while waiting.
+        """
+        while True:
+            if self._closed:
+                raise RuntimeError("The process pool has been shut down")
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            try:
+                worker = self._idle.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if worker is None:
+                self._idle.put(None)  # Wake up the next waiting run as well
+                raise RuntimeError("The process pool has been shut down")
+            return worker
+
+    def _wait_ready(self, worker: _Worker, cancel_event: Optional[threading.Event]) -> bool:
+        """Wait until a new worker has imported the actions module.
+
+        Returns:
+            bool: False if the run was cancelled first.
+        """
+        while not self._workers.get(worker):
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            if worker.conn.poll(POLL_INTERVAL):
+                worker.conn.recv()  # ("ready",)
+                with self._lock:
+                    if worker in self._workers:
+                        self._workers[worker] = True
+        return True
+
+    def run(
+        self,
+        name: str,
+        stdout: TextIO,
+        stderr: TextIO,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> PoolRun:
+        """
+        Runs an action in a worker process and waits for it.
+
+        Args:
+            name (str): The name of the action to run.
+            stdout (TextIO): Receives the action's stdout as it is written.
+            stderr (TextIO): Receives the action's stderr as it is written.
+            timeout (Optional[float]): Seconds after which the worker is killed, counted from
+                                       when it has imported the actions module.
+            cancel_event (Optional[threading.Event]): Set by the caller to kill the worker.
+
+        Returns:
+            PoolRun: The error message or traceback if the action failed, and the CPU time
+                     the worker reported.
+
+        Raises:
+            RuntimeError: If the pool has been shut down, or is shut down while the run
+                          waits for a free worker.
+        """
+        self.start()
+        worker = self._acquire(cancel_event)
+        if worker is None:
+            return PoolRun(None)
+        try:
+            if not self._wait_ready(worker, cancel_event):
+                self._idle.put(worker)  # Still importing; the next run waits for it
+                return PoolRun(None)
+            deadline = None if timeout is None else time.monotonic() + timeout
+            worker.conn.send(name)
+            while True:
+                wait = POLL_INTERVAL
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        self._replace(worker)
+                        return PoolRun(
+                            f"TimeoutError: {name} did not finish within {timeout:g}s;"
+                            " its worker process was killed"
+                        )
+                if cancel_event is not None and cancel_event.is_set():
+                    self._replace(worker)
+                    return PoolRun(None)
+                if not worker.conn.poll(wait):
+                    continue
+                message = worker.conn.recv()
+                if message[0] == "done":
+                    self._idle.put(worker)
+                    return PoolRun(*message[1:])
+                _, is_error, text = message
+                (stderr if is_error else stdout).write(text)
+        except (EOFError, OSError):
+            worker.process.join(1)
+            exit_code = worker.process.exitcode
+            self._replace(worker)
+            return PoolRun(
+                f"The worker process running {name} exited unexpectedly (exit code {exit_code})"
+            )
+
+    def shutdown(self) -> None:
+        """Stop every worker process, killing those that are still running an action."""
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        self._idle.put(None)  # Wake up the runs waiting for a free worker
+        for worker in workers:
+            with contextlib.suppress(OSError):
+                worker.conn.send(None)
+        for worker in workers:
+            worker.process.join(POLL_INTERVAL)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+            worker.conn.close()
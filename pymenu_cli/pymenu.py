@@ -1,21 +1,51 @@
 """Load and display menus from JSON files with associated Python actions."""
 
+# pylint: disable=import-outside-toplevel
 import argparse
+import contextlib
+import functools
 import importlib.util
 import json
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Set
 
+from pymenu_cli.actions import DeferredActions
+from pymenu_cli.dag import find_cycle
+from pymenu_cli.models.lazy_menu import LazyMenu
 from pymenu_cli.models.menu import Menu
 from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.results import CachePolicy
 
+EXECUTION_MODES = ("thread", "process")
 
-def load_menu(file_path: str, actions_path: str) -> Menu:
+
+def load_menu(  # pylint: disable=too-many-arguments
+    file_path: str,
+    actions_path: str,
+    *,
+    use_cache: bool = False,
+    cache_dir: Optional[str] = None,
+    lazy: bool = False,
+    streaming: bool = False,
+    defer_actions: bool = False,
+) -> Menu:
     """
     Loads a menu from a JSON file.
 
     Args:
         file_path (str): The path to the JSON file.
         actions_path (str): The path to the actions Python file.
+        use_cache (bool): If True, reuse a compiled snapshot of the menu tree while the
+                          JSON file is unchanged, and write a new one otherwise.
+        cache_dir (Optional[str]): Directory for snapshots. Defaults to a hidden file
+                                   next to the JSON file. Implies use_cache.
+        lazy (bool): If True, submenu items are built on first access. Ignored when the
+                     menu is served from a snapshot, which is always fully built.
+        streaming (bool): If True, build the menu while parsing the file instead of
+                          loading the whole JSON document first. Cannot be combined
+                          with lazy.
+        defer_actions (bool): If True, the actions module is only imported on first use
+                              and every action named in the menu is checked against
+                              the top-level functions of the actions file up front.
 
     Returns:
         Menu: The loaded menu.
@@ -24,77 +54,347 @@ def load_menu(file_path: str, actions_path: str) -> Menu:
         FileNotFoundError: If the menu JSON file is not found.
         json.JSONDecodeError: If the menu JSON file is not in the correct format.
         FileNotFoundError: If the actions Python file is not found.
+        ValueError: If both lazy and streaming are requested, if an item requires
+                    actions that are not in the menu or that depend on each other
+                    in a cycle, or if defer_actions is set and the menu names
+                    actions missing from the actions file.
     """
+    if lazy and streaming:
+        raise ValueError("Lazy and streaming menu loading cannot be combined")
+
+    key = None
+    menu_data = None
+    if use_cache or cache_dir is not None:
+        from pymenu_cli import cache  # Lazy import to keep hashlib/tempfile off the cold path
+
+        with _menu_file_errors(file_path):
+            key = cache.menu_file_key(file_path)
+    elif not streaming:
+        menu_data = _read_menu_data(file_path)
+
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            menu_data = json.load(file)
+        actions = load_actions_module(actions_path, deferred=defer_actions)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Actions Python file not found: {actions_path}") from exc
+
+    menu = None
+    if key is not None:
+        menu = cache.load_snapshot(key, actions, cache_dir)
+    if menu is None:
+        if streaming:
+            from pymenu_cli.streaming import stream_menu  # Lazy import to avoid circular dependency
+
+            with _menu_file_errors(file_path):
+                menu = stream_menu(file_path, actions)
+            _check_requirements(_menu_requirements(menu))
+        else:
+            if menu_data is None:
+                menu_data = _read_menu_data(file_path)
+            menu = create_menu_from_data(menu_data, actions, lazy=lazy and key is None)
+        if key is not None:
+            cache.save_snapshot(menu, key, cache_dir)
+
+    if defer_actions:
+        _check_action_names(actions, menu, menu_data)
+    return menu
+
+
+@contextlib.contextmanager
+def _menu_file_errors(file_path: str) -> Iterator[None]:
+    """Re-raise errors about the menu JSON file in load_menu's format."""
+    try:
+        yield
     except FileNotFoundError as exc:
         raise FileNotFoundError(f"Menu JSON file not found: {file_path}") from exc
     except json.JSONDecodeError as exc:
         raise json.JSONDecodeError(f"Invalid JSON format in menu file: {exc.msg}", exc.doc, exc.pos)
 
-    try:
-        actions = load_actions_module(actions_path)
-    except FileNotFoundError as exc:
-        raise FileNotFoundError(f"Actions Python file not found: {actions_path}") from exc
 
-    return create_menu_from_data(menu_data, actions)
+def _read_menu_data(file_path: str) -> Dict:
+    with _menu_file_errors(file_path):
+        with open(file_path, "r", encoding="utf-8") as file:
+            return json.load(file)
 
 
-def create_menu_from_data(menu_data: Dict, actions: object) -> Menu:
+def create_menu_from_data(menu_data: Dict, actions: object, lazy: bool = False) -> Menu:
     """
     Creates a menu from dictionary data.
 
     Args:
         menu_data (dict): The menu data.
         actions (object): An object containing callable actions.
+        lazy (bool): If True, submenus are LazyMenu instances whose items are only
+                     built when they are first accessed.
 
     Returns:
         Menu: The created menu.
+
+    Raises:
+        ValueError: If an item is invalid, or items require actions that are not in the
+                    menu or that depend on each other in a cycle.
     """
-    config = {
+    _check_requirements(_data_requirements(menu_data))
+    return _create_menu(menu_data, actions, lazy)
+
+
+def _create_menu(menu_data: Dict, actions: object, lazy: bool = False) -> Menu:
+    menu = Menu(i_title=menu_data["title"], i_config=_menu_config(menu_data, actions))
+    for item in _create_menu_items(menu_data["items"], actions, lazy):
+        menu.add_item(item)
+    return menu
+
+
+def _menu_config(menu_data: Dict, actions: object) -> Dict:
+    return {
         "items": [],
         "actions": actions,
         "color": menu_data.get("color"),
         "banner": menu_data.get("banner"),
     }
 
-    menu = Menu(i_title=menu_data["title"], i_config=config)
 
-    for item_data in menu_data["items"]:
+def _create_menu_items(items_data: List[Dict], actions: object, lazy: bool) -> List[MenuItem]:
+    items = []
+    for item_data in items_data:
+        submenu = None
         if "submenu" in item_data:
-            submenu = create_menu_from_data(item_data["submenu"], actions)
-            menu.add_item(
-                MenuItem(item_data["title"], i_submenu=submenu, i_color=item_data.get("color"))
-            )
-        else:
-            menu.add_item(
-                MenuItem(
-                    item_data["title"],
-                    i_action=item_data.get("action"),
-                    i_color=item_data.get("color"),
+            if lazy:
+                submenu = _create_lazy_menu(item_data["submenu"], actions)
+            else:
+                submenu = _create_menu(item_data["submenu"], actions)
+        items.append(_create_menu_item(item_data, submenu))
+    return items
+
+
+def _create_lazy_menu(menu_data: Dict, actions: object) -> LazyMenu:
+    loader = functools.partial(_create_menu_items, menu_data["items"], actions, True)
+    return LazyMenu(
+        menu_data["title"],
+        loader,
+        i_config=_menu_config(menu_data, actions),
+        i_items_data=menu_data["items"],
+    )
+
+
+def _create_menu_item(item_data: Dict, submenu: Optional[Menu] = None) -> MenuItem:
+    """Create a MenuItem from its JSON data and its already built submenu, if any.
+
+    Raises:
+        ValueError: If the item has an unknown execution mode, an invalid timeout,
+                    an invalid cache block, an invalid command or invalid requirements.
+    """
+    if submenu is not None:
+        return MenuItem(item_data["title"], i_submenu=submenu, i_color=item_data.get("color"))
+    return MenuItem(item_data["title"], i_color=item_data.get("color"), **_item_options(item_data))
+
+
+def _item_options(item_data: Dict) -> Dict:
+    """Return the MenuItem keyword arguments of an action or command item's JSON data.
+
+    Raises:
+        ValueError: If the item has an unknown execution mode, an invalid timeout,
+                    an invalid cache block, an invalid command or invalid requirements.
+    """
+    execution = item_data.get("execution")
+    if execution is not None and execution not in EXECUTION_MODES:
+        raise ValueError(
+            f"Unknown execution mode for {item_data['title']!r}: {execution!r}"
+            f" (expected one of: {', '.join(EXECUTION_MODES)})"
+        )
+    timeout = item_data.get("timeout")
+    if timeout is not None and not _is_positive(timeout):
+        raise ValueError(f"Invalid timeout for {item_data['title']!r}: {timeout!r}")
+    return {
+        "i_action": item_data.get("action"),
+        "i_execution": execution,
+        "i_timeout": timeout,
+        "i_cache": _cache_policy(item_data),
+        "i_command": _command(item_data),
+        "i_requires": _requires(item_data),
+    }
+
+
+def _is_positive(value: object, types: tuple = (int, float)) -> bool:
+    """Return True if a JSON value is a positive number of the given types, booleans excluded."""
+    return not isinstance(value, bool) and isinstance(value, types) and value > 0
+
+
+def _command(item_data: Dict) -> Optional[List[str]]:
+    """Return the program and arguments of an item's ``"command"``, if it has one.
+
+    Raises:
+        ValueError: If the command is not a non-empty list of strings, or the item
+                    also has an action.
+    """
+    command = item_data.get("command")
+    if command is None:
+        return None
+    if (
+        not isinstance(command, list)
+        or not command
+        or not all(isinstance(arg, str) for arg in command)
+    ):
+        raise ValueError(
+            f"Invalid command for {item_data['title']!r}: {command!r}"
+            " (expected a list of strings: program and arguments)"
+        )
+    if item_data.get("action"):
+        raise ValueError(f"{item_data['title']!r} has both an action and a command")
+    return command
+
+
+def _requires(item_data: Dict) -> Optional[List[str]]:
+    """Return the names of the actions an item ``"requires"``, if any.
+
+    Raises:
+        ValueError: If they are not a list of action names, or the item has no action.
+    """
+    requires = item_data.get("requires")
+    if requires is None:
+        return None
+    if not isinstance(requires, list) or not all(
+        isinstance(name, str) and name for name in requires
+    ):
+        raise ValueError(
+            f"Invalid requires for {item_data['title']!r}: {requires!r}"
+            " (expected a list of action names)"
+        )
+    if requires and not item_data.get("action"):
+        raise ValueError(f"{item_data['title']!r} requires actions but has no action of its own")
+    return requires
+
+
+def _cache_policy(item_data: Dict) -> Optional[CachePolicy]:
+    """Return the caching policy of an item's ``"cache"`` block, if it has one.
+
+    Raises:
+        ValueError: If the block is not an object with a positive ``ttl``.
+    """
+    cache = item_data.get("cache")
+    if cache is None:
+        return None
+    if not isinstance(cache, dict) or set(cache) - {"ttl"} or not _is_positive(cache.get("ttl")):
+        raise ValueError(
+            f"Invalid cache for {item_data['title']!r}: {cache!r}" ' (expected {"ttl": seconds})'
+        )
+    return CachePolicy(cache["ttl"])
+
+
+def _check_requirements(graph: Dict[str, List[str]]) -> None:
+    """Raise ValueError if actions require unknown actions, or require each other in a cycle."""
+    unknown = sorted({name for names in graph.values() for name in names} - set(graph))
+    if unknown:
+        raise ValueError(f"Required actions not found in the menu: {', '.join(unknown)}")
+    cycle = find_cycle(graph)
+    if cycle is not None:
+        raise ValueError(f"Action requirements form a cycle: {' -> '.join(cycle)}")
+
+
+def _data_requirements(menu_data: Dict) -> Dict[str, List[str]]:
+    """Validate every item of the menu data, including those of lazy submenus that are not
+    built yet, and map every action to the actions it requires.
+
+    Raises:
+        ValueError: If an item is invalid.
+    """
+    graph: Dict[str, List[str]] = {}
+    pending = [menu_data]
+    while pending:
+        for item_data in pending.pop()["items"]:
+            if "submenu" in item_data:
+                pending.append(item_data["submenu"])
+                continue
+            options = _item_options(item_data)
+            if options["i_action"]:
+                requires = graph.setdefault(options["i_action"], [])
+                requires.extend(
+                    name for name in options["i_requires"] or () if name not in requires
                 )
-            )
+    return graph
 
-    return menu
+
+def _menu_requirements(menu: Menu) -> Dict[str, List[str]]:
+    """Map every action of a built menu tree to the actions it requires."""
+    graph: Dict[str, List[str]] = {}
+    pending = [menu]
+    while pending:
+        for item in pending.pop().items:
+            if item.submenu:
+                pending.append(item.submenu)
+            elif item.action:
+                requires = graph.setdefault(item.action, [])
+                requires.extend(name for name in item.requires or () if name not in requires)
+    return graph
 
 
-def load_actions_module(actions_path: str) -> object:
+def _check_action_names(actions: DeferredActions, menu: Menu, menu_data: Optional[Dict]) -> None:
+    """Raise ValueError if the menu names actions the actions file does not define."""
+    if menu_data is not None:
+        names = _data_action_names(menu_data)
+    else:
+        names = _menu_action_names(menu)
+    missing = sorted(names - actions._names)
+    if missing:
+        raise ValueError(f"Actions not found in {actions._path}: {', '.join(missing)}")
+
+
+def _data_action_names(menu_data: Dict) -> Set[str]:
+    names = set()
+    pending = [menu_data]
+    while pending:
+        for item_data in pending.pop()["items"]:
+            if "submenu" in item_data:
+                pending.append(item_data["submenu"])
+            elif item_data.get("action"):
+                names.add(item_data["action"])
+    return names
+
+
+def _menu_action_names(menu: Menu) -> Set[str]:
+    names = set()
+    pending = [menu]
+    while pending:
+        for item in pending.pop().items:
+            if item.submenu:
+                pending.append(item.submenu)
+            elif item.action:
+                names.add(item.action)
+    return names
+
+
+def load_actions_module(actions_path: str, deferred: bool = False) -> object:
     """
     Loads an actions module from a file.
 
     Args:
         actions_path (str): The path to the actions Python file.
+        deferred (bool): If True, return a DeferredActions that only imports the module
+                         on first use.
 
     Returns:
         object: The loaded actions module.
     """
+    if deferred:
+        return DeferredActions(actions_path)
     spec = importlib.util.spec_from_file_location("actions", actions_path)
     actions = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(actions)
     return actions
 
 
+def _positive(convert):
+    """Return an argparse type that converts a value and rejects values below or at zero."""
+
+    def parse(value: str):
+        number = convert(value)
+        if number <= 0:
+            raise argparse.ArgumentTypeError(f"must be greater than 0, not {value}")
+        return number
+
+    parse.__name__ = convert.__name__  # Shown in argparse's "invalid ... value" message
+    return parse
+
+
 def main() -> None:
     """Main function to parse arguments and display the menu."""
     parser = argparse.ArgumentParser(description="pymenu-cli - Create interactive CLI menus")
@@ -112,16 +412,99 @@ def main() -> None:
         default="dark",
         help="Color theme for TUI mode (default: dark)",
     )
+    loading = parser.add_mutually_exclusive_group()
+    loading.add_argument(
+        "--lazy",
+        action="store_true",
+        default=False,
+        help="Build submenus only when they are first opened",
+    )
+    loading.add_argument(
+        "--streaming",
+        action="store_true",
+        default=False,
+        help="Build the menu while parsing the JSON file to reduce peak memory",
+    )
+    parser.add_argument(
+        "--defer-actions",
+        action="store_true",
+        default=False,
+        help="Import the actions module on first use after checking its function names",
+    )
+    parser.add_argument(
+        "--execution",
+        choices=EXECUTION_MODES,
+        default="thread",
+        help="Where actions run unless their menu item says otherwise (default: thread)",
+    )
+    parser.add_argument(
+        "--action-timeout",
+        type=_positive(float),
+        default=None,
+        help="Kill process-isolated actions that run longer than this many seconds",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=_positive(int),
+        default=4,
+        help="How many actions may run at once; later ones wait in a queue (default: 4)",
+    )
+    parser.add_argument(
+        "--batch-limit",
+        type=_positive(int),
+        default=None,
+        help="How many marked actions run with 'Run selected' may run at once "
+        "(default: --max-jobs)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        default=None,
+        help="Write the time and memory used by every action run to this file, "
+        "in OpenMetrics text format, on exit",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=False,
+        help="Reuse a compiled snapshot of the menu while the JSON file is unchanged",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory for menu snapshots (implies --cache)",
+    )
     args = parser.parse_args()
 
     if args.menu and args.actions:
         try:
-            main_menu = load_menu(args.menu, args.actions)
-            main_menu.display(classic=args.classic, theme=args.theme)
+            main_menu = load_menu(
+                args.menu,
+                args.actions,
+                use_cache=args.cache,
+                cache_dir=args.cache_dir,
+                lazy=args.lazy,
+                streaming=args.streaming,
+                defer_actions=args.defer_actions,
+            )
         except FileNotFoundError as e:
             print(f"Error: {str(e)}")
         except json.JSONDecodeError as e:
             print(f"Error: {str(e)}")
+        except ValueError as e:
+            print(f"Error: {str(e)}")
+        else:
+            # Outside the try, so errors raised while the menu runs keep their traceback
+            main_menu.display(
+                classic=args.classic,
+                theme=args.theme,
+                execution=args.execution,
+                action_timeout=args.action_timeout,
+                max_jobs=args.max_jobs,
+                batch_limit=args.batch_limit,
+                metrics_file=args.metrics_file,
+            )
     else:
         parser.print_help()
 
@@ -0,0 +1,83 @@
+"""Caching the output of action runs.
+
+A menu item with a ``"cache"`` block has the output of its last successful
+run replayed for ``ttl`` seconds instead of running its action again. Actions
+take no arguments, so a result is keyed by the action alone. Results are kept
+in a single least-recently-used cache shared by every item, which holds at
+most ``MAX_ENTRIES`` results. An item only ever has one result stored, so
+there is no bound per item.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, NamedTuple, Optional, Tuple
+
+MAX_ENTRIES = 128
+
+
+class CachePolicy(NamedTuple):
+    """How long the result of an item's action is kept.
+
+    Attributes:
+        ttl (float): Seconds during which the result is replayed.
+    """
+
+    ttl: float
+
+
+class CachedResult(NamedTuple):
+    """The output of a successful action run, as (is_error, text) chunks."""
+
+    output: Tuple[Tuple[bool, str], ...]
+    stored_at: float
+    policy: CachePolicy
+
+    def age(self, now: float) -> float:
+        """Return how many seconds ago the result was stored."""
+        return now - self.stored_at
+
+
+class ResultCache:
+    """A bounded least-recently-used cache of action output with per-entry expiry."""
+
+    def __init__(
+        self, clock: Callable[[], float] = time.monotonic, max_entries: int = MAX_ENTRIES
+    ) -> None:
+        """
+        Args:
+            clock: Returns the current time in seconds; ``time.monotonic`` by default.
+            max_entries: The number of results the cache holds at most.
+        """
+        self._clock = clock
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CachedResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def now(self) -> float:
+        """Return the current time of the cache's clock."""
+        return self._clock()
+
+    def get(self, key: Hashable) -> Optional[CachedResult]:
+        """Return the result stored under ``key``, or None if there is none or it expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.age(self._clock()) >= entry.policy.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, output: Iterable[Tuple[bool, str]], policy: CachePolicy) -> None:
+        """Store the output of a run, evicting the least recently used results beyond the
+        cache's bound."""
+        self._entries[key] = CachedResult(tuple(output), self._clock(), policy)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget the result stored under ``key``, if any."""
+        self._entries.pop(key, None)
@@ -0,0 +1,473 @@
+"""Running actions away from the UI event loop.
+
+``call_action`` resolves and calls an action with its output captured, and is
+meant to run in a worker thread. Coroutine actions are awaited instead, by
+``call_async_action`` on the event loop, so many of them can run at once
+without a thread each. ``call_command`` runs a command item's program as an
+asyncio subprocess on the event loop, likewise without a thread or an import
+of the actions file. A run can be cancelled from another thread
+through its ``threading.Event``: the UI stops waiting for it at once, and an
+action that checks ``is_cancelled()`` can also stop early. Python threads
+cannot be interrupted, so an action that never checks runs to completion in
+the background and its result is discarded.
+
+Given an ``OutputSink``, ``call_action`` streams the action's output instead
+of returning it: complete lines are queued as they are written, and the UI is
+notified once per batch so it can drain them at most once per frame.
+
+Output is captured per thread or task rather than by swapping ``sys.stdout``
+for each run: ``sys.stdout`` and ``sys.stderr`` are replaced by streams that
+write to the output of the action running in the current context, found
+through a ``ContextVar``. Concurrent actions therefore never see each other's
+output, and writes from elsewhere pass through. An application installs the
+streams once with ``install_output_capture``; otherwise they are installed
+while at least one action runs. Threads an action starts itself do not
+inherit its context, so their output passes through unless they are started
+with ``contextvars.copy_context().run``.
+"""
+
+import asyncio
+import codecs
+import contextlib
+import inspect
+import io
+import sys
+import threading
+import time
+import traceback
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+from pymenu_cli.actions import DeferredActions
+from pymenu_cli.metrics import peak_rss, peak_rss_growth
+
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar(
+    "pymenu_cancel_event", default=None
+)
+_output: ContextVar[Optional[object]] = ContextVar("pymenu_output", default=None)
+
+
+@dataclass
+class ActionResult:
+    """The outcome of running an action.
+
+    Attributes:
+        stdout (str): Everything the action wrote to stdout.
+        stderr (str): Everything the action wrote to stderr.
+        error (Optional[str]): The formatted traceback if the action raised, otherwise None.
+        exit_code (Optional[int]): The exit code of a command; None for actions.
+        cpu_time (Optional[float]): CPU seconds used by the thread or worker process that
+                                    ran the action, when it ran in one.
+        rss_delta (Optional[int]): Bytes the peak RSS of the worker process that ran the
+                                   action grew by, or for a command, how much it raised
+                                   the largest peak RSS of the menu's reaped children;
+                                   None elsewhere.
+    """
+
+    stdout: str = ""
+    stderr: str = ""
+    error: Optional[str] = None
+    exit_code: Optional[int] = None
+    cpu_time: Optional[float] = None
+    rss_delta: Optional[int] = None
+
+
+class _SinkStream(io.TextIOBase):
+    """A text stream that forwards complete lines to an OutputSink."""
+
+    def __init__(self, sink: "OutputSink", is_error: bool) -> None:
+        super().__init__()
+        self._sink = sink
+        self._is_error = is_error
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        # pylint: disable-next=protected-access
+        self._sink._write(self._is_error, text)
+        return len(text)
+
+
+class OutputSink:
+    """Collects the output of a running action, from any thread, as batches of lines.
+
+    ``stdout`` and ``stderr`` are file-like streams. Complete lines are queued,
+    with consecutive lines of the same stream merged into one chunk, and a
+    trailing partial line is held back until its newline arrives or the sink
+    is closed. ``notify`` is called from the writing thread when the queue
+    goes from empty to non-empty, so the consumer schedules one ``drain`` per
+    batch however many lines are written in the meantime.
+    """
+
+    def __init__(self, notify: Optional[Callable[[], None]] = None) -> None:
+        self._notify = notify
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[bool, List[str]]] = []
+        self._partial = {False: "", True: ""}
+        self._closed = False
+        self.wrote = False
+        self._streams = (_SinkStream(self, False), _SinkStream(self, True))
+
+    @property
+    def stdout(self) -> io.TextIOBase:
+        """The stream to redirect stdout to."""
+        return self._streams[0]
+
+    @property
+    def stderr(self) -> io.TextIOBase:
+        """The stream to redirect stderr to; its lines are marked as errors."""
+        return self._streams[1]
+
+    def _write(self, is_error: bool, text: str) -> None:
+        with self._lock:
+            if self._closed or not text:
+                return
+            self.wrote = True
+            head, newline, self._partial[is_error] = (self._partial[is_error] + text).rpartition(
+                "\n"
+            )
+            if not newline:
+                return
+            notify = self._queue(is_error, head)
+        if notify and self._notify is not None:
+            self._notify()
+
+    def _queue(self, is_error: bool, text: str) -> bool:
+        """Queue a chunk of lines; return True if the queue was empty. Caller holds the lock."""
+        was_empty = not self._pending
+        if self._pending and self._pending[-1][0] == is_error:
+            self._pending[-1][1].append(text)
+        else:
+            self._pending.append((is_error, [text]))
+        return was_empty
+
+    def close(self) -> None:
+        """Queue any partial lines and ignore everything written afterwards."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for is_error in (False, True):
+                if self._partial[is_error]:
+                    self._queue(is_error, self._partial[is_error])
+                    self._partial[is_error] = ""
+
+    def drain(self) -> List[Tuple[bool, str]]:
+        """Return the queued output as (is_error, text) chunks, oldest first, and clear it."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return [(is_error, "\n".join(lines)) for is_error, lines in pending]
+
+
+class _Buffers(NamedTuple):
+    """In-memory output of an action run without a sink."""
+
+    stdout: io.StringIO
+    stderr: io.StringIO
+
+
+class _RoutedStream:
+    """Stands in for sys.stdout or sys.stderr, writing to the current action's output."""
+
+    def __init__(self, fallback: TextIO, is_error: bool) -> None:
+        self.fallback = fallback
+        self._is_error = is_error
+
+    def _target(self) -> TextIO:
+        output = _output.get()
+        if output is None:
+            return self.fallback
+        return output.stderr if self._is_error else output.stdout
+
+    def write(self, text: str) -> int:
+        """Write to the output of the action running in this context, if any."""
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        """Flush the stream being written to."""
+        self._target().flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self.fallback, name)
+
+
+class _OutputRouter:
+    """Installs routed streams on sys.stdout and sys.stderr while it has at least one user."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._users = 0
+        self._streams: Optional[Tuple[_RoutedStream, _RoutedStream]] = None
+
+    def acquire(self) -> None:
+        """Start routing output, unless it is already routed."""
+        with self._lock:
+            if self._users == 0:
+                self._streams = (_RoutedStream(sys.stdout, False), _RoutedStream(sys.stderr, True))
+                sys.stdout, sys.stderr = self._streams
+            self._users += 1
+
+    @property
+    def is_installed(self) -> bool:
+        """Whether the routed streams are installed."""
+        return self._streams is not None
+
+    def release(self) -> None:
+        """Stop routing output once its last user is done."""
+        with self._lock:
+            self._users -= 1
+            if self._users == 0:
+                stdout, stderr = self._streams
+                # Leave the streams alone if something else replaced them in the meantime
+                if sys.stdout is stdout:
+                    sys.stdout = stdout.fallback
+                if sys.stderr is stderr:
+                    sys.stderr = stderr.fallback
+                self._streams = None
+
+
+_router = _OutputRouter()
+
+
+def install_output_capture() -> None:
+    """Route ``sys.stdout`` and ``sys.stderr`` to the running actions until uninstalled.
+
+    Meant to be called once when an application starts, so that running an
+    action only sets a context variable. Writes made outside of any action
+    go to the streams that were installed before. Calls may be nested; each
+    must be matched by a call to ``uninstall_output_capture``.
+    """
+    _router.acquire()
+
+
+def uninstall_output_capture() -> None:
+    """Undo ``install_output_capture``, restoring the previous streams after the last call."""
+    _router.release()
+
+
+def output_capture_installed() -> bool:
+    """Return True if ``sys.stdout`` and ``sys.stderr`` are currently routed to actions."""
+    return _router.is_installed
+
+
+@contextlib.contextmanager
+def _capture(output) -> Iterator[None]:
+    """Send what the current thread or task prints to ``output.stdout`` and ``output.stderr``."""
+    _router.acquire()
+    token = _output.set(output)
+    try:
+        yield
+    finally:
+        _output.reset(token)
+        _router.release()
+
+
+def _result(output, error: Optional[str], exit_code: Optional[int] = None) -> ActionResult:
+    if isinstance(output, OutputSink):
+        output.close()
+        return ActionResult(error=error, exit_code=exit_code)
+    return ActionResult(output.stdout.getvalue(), output.stderr.getvalue(), error, exit_code)
+
+
+def is_async_action(actions: object, name: str) -> bool:
+    """Return True if the action is a coroutine function.
+
+    Deferred actions are answered from the scanned source, without importing the module.
+    """
+    if isinstance(actions, DeferredActions) and not actions._is_loaded:
+        return name in actions._async_names
+    return inspect.iscoroutinefunction(getattr(actions, name, None))
+
+
+def is_cancelled() -> bool:
+    """Return True if the action running in the current thread has been cancelled.
+
+    Long-running actions can poll this to stop early.
+    """
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+def call_action(
+    actions: object,
+    name: str,
+    cancel_event: Optional[threading.Event] = None,
+    sink: Optional[OutputSink] = None,
+) -> ActionResult:
+    """
+    Calls an action with its stdout and stderr captured.
+
+    Args:
+        actions (object): The object holding the action functions.
+        name (str): The name of the action to call.
+        cancel_event (Optional[threading.Event]): Set by the caller to cancel the run.
+        sink (Optional[OutputSink]): Streams the output here while the action runs
+                                     instead of returning it. Closed when the action returns.
+
+    Returns:
+        ActionResult: The captured output, the traceback if the action raised, and the
+                      CPU time of the run. ``stdout`` and ``stderr`` are empty when a
+                      sink is given.
+    """
+    output = _Buffers(io.StringIO(), io.StringIO()) if sink is None else sink
+    error = None
+    token = _cancel_event.set(cancel_event)
+    started = time.thread_time()
+    try:
+        with _capture(output):
+            action_fn = getattr(actions, name)
+            action_fn()
+    except Exception:  # pylint: disable=broad-exception-caught
+        error = traceback.format_exc()
+    finally:
+        _cancel_event.reset(token)
+    result = _result(output, error)
+    result.cpu_time = time.thread_time() - started
+    return result
+
+
+async def call_async_action(
+    actions: object, name: str, sink: Optional[OutputSink] = None
+) -> ActionResult:
+    """
+    Awaits a coroutine action with its stdout and stderr captured.
+
+    Output is captured for the current task only, so several async actions
+    can run concurrently on the same event loop. Cancelling the task cancels
+    the action.
+
+    Args:
+        actions (object): The object holding the action functions.
+        name (str): The name of the coroutine function to await.
+        sink (Optional[OutputSink]): Streams the output here while the action runs
+                                     instead of returning it. Closed when the action returns.
+
+    Returns:
+        ActionResult: The captured output, and the traceback if the action raised.
+                      ``stdout`` and ``stderr`` are empty when a sink is given.
+    """
+    output = _Buffers(io.StringIO(), io.StringIO()) if sink is None else sink
+    error = None
+    try:
+        if isinstance(actions, DeferredActions) and not actions._is_loaded:
+            # Import the actions module without blocking the event loop
+            await asyncio.to_thread(actions._load)
+        with _capture(output):
+            await getattr(actions, name)()
+    except Exception:  # pylint: disable=broad-exception-caught
+        error = traceback.format_exc()
+    return _result(output, error)
+
+
+def call_process_action(  # pylint: disable=too-many-arguments
+    pool,
+    name: str,
+    cancel_event: Optional[threading.Event] = None,
+    sink: Optional[OutputSink] = None,
+    timeout: Optional[float] = None,
+) -> ActionResult:
+    """
+    Runs an action in a worker process of a ``ProcessPool`` with its output captured.
+
+    Meant to run in a worker thread. Cancelling kills the worker process.
+
+    Args:
+        pool (ProcessPool): The pool whose worker runs the action.
+        name (str): The name of the action to run.
+        cancel_event (Optional[threading.Event]): Set by the caller to cancel the run.
+        sink (Optional[OutputSink]): Streams the output here while the action runs
+                                     instead of returning it. Closed when the action returns.
+        timeout (Optional[float]): Seconds after which the worker process is killed.
+
+    Returns:
+        ActionResult: The captured output, and the traceback or timeout message if the
+                      action failed. ``stdout`` and ``stderr`` are empty when a sink is given.
+    """
+    output = _Buffers(io.StringIO(), io.StringIO()) if sink is None else sink
+    run = pool.run(name, output.stdout, output.stderr, timeout, cancel_event)
+    result = _result(output, run.error)
+    result.cpu_time = run.cpu_time
+    result.rss_delta = run.rss_delta
+    return result
+
+
+# Bytes read from a command's pipes at a time
+_PIPE_CHUNK = 1 << 16
+
+
+async def _pump(reader: asyncio.StreamReader, stream: TextIO) -> None:
+    """Copy a command's output pipe to a stream until the pipe is closed."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = await reader.read(_PIPE_CHUNK)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            stream.write(text)
+        if not chunk:
+            return
+
+
+async def _kill(process: "asyncio.subprocess.Process") -> None:
+    try:
+        process.kill()
+    except ProcessLookupError:
+        pass  # It has already exited
+    await process.wait()
+
+
+async def call_command(
+    command: Sequence[str], sink: Optional[OutputSink] = None, timeout: Optional[float] = None
+) -> ActionResult:
+    """
+    Runs a program in a subprocess with its stdout and stderr captured.
+
+    The subprocess is driven by the event loop, so no thread is used. Cancelling
+    the task kills the subprocess.
+
+    Args:
+        command (Sequence[str]): The program and its arguments. No shell is involved.
+        sink (Optional[OutputSink]): Streams the output here while the program runs
+                                     instead of returning it. Closed when it exits.
+        timeout (Optional[float]): Seconds after which the subprocess is killed.
+
+    Returns:
+        ActionResult: The captured output and the exit code, with an error message if the
+                      program could not be started, failed or timed out, and how much it
+                      raised the peak RSS of the reaped children. ``stdout`` and
+                      ``stderr`` are empty when a sink is given.
+    """
+    output = _Buffers(io.StringIO(), io.StringIO()) if sink is None else sink
+    started_rss = peak_rss(children=True)
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as error:
+        return _result(output, f"{type(error).__name__}: {error}")
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                _pump(process.stdout, output.stdout),
+                _pump(process.stderr, output.stderr),
+                process.wait(),
+            ),
+            timeout,
+        )
+    except asyncio.TimeoutError:
+        await _kill(process)
+        error = f"TimeoutError: {command[0]} did not finish within {timeout:g}s and was killed"
+    except asyncio.CancelledError:
+        await _kill(process)
+        raise
+    else:
+        error = None
+        if process.returncode != 0:
+            error = f"{command[0]} exited with code {process.returncode}"
+    result = _result(output, error, process.returncode)
+    result.rss_delta = peak_rss_growth(started_rss, children=True)
+    return result
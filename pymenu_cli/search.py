@@ -0,0 +1,480 @@
+"""Global search over every item of a menu tree.
+
+A query matches an item when its characters appear in order (not necessarily
+next to each other) in the item's path, like in fzf. Matches are ranked so
+that only the best ``limit`` results are sorted and shown:
+
+1. titles that start with the query,
+2. titles that contain the query at a word boundary,
+3. titles that contain the query anywhere,
+4. titles that contain the query as a subsequence, by ``fuzzy_score``,
+5. paths that contain the query as a subsequence, by ``fuzzy_score``.
+
+Titles that contain the query are looked up in an inverted index of title
+trigrams, which only verifies the items that contain the query's rarest
+trigram; shorter titles rank first within the first three tiers. Paths are
+only scanned for scattered matches when those titles do not fill the
+``limit`` results. ``IncrementalSearch`` narrows the previous scattered
+matches as a query is typed, and can be cancelled from another thread
+between chunks.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+NGRAM_SIZE = 3
+SEARCH_LIMIT = 200
+CHUNK_SIZE = 16384
+
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_SEGMENT = 10
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+
+PATH_SEPARATOR = "›"
+_BOUNDARY_CHARS = " \t-_./:\\"
+
+
+class SearchCancelled(Exception):
+    """Raised when a search is abandoned because a newer query superseded it."""
+
+
+@dataclass
+class SearchResult:
+    """A search result entry from the global menu index.
+
+    Entries for the items of lazy submenus that are not built yet have no
+    ``item`` or ``menu``: they carry the ``title`` and ``kind`` of the item
+    for display, and ``resolve`` builds the submenus leading to it.
+
+    Attributes:
+        item (object): The menu item, or None until resolved.
+        path (str): The titles of the menus leading to the item, and its own.
+        menu (object): The menu holding the item, or None until resolved.
+        title (str): The title of the item.
+        kind (str): "submenu", "command" or "action", or "" for an item that does nothing.
+        locate (Optional[Callable[[], Tuple[object, object]]]): Builds and returns the
+                                                                item and its menu.
+    """
+
+    item: Any
+    path: str
+    menu: Any
+    title: str = ""
+    kind: str = ""
+    locate: Optional[Callable[[], Tuple[object, object]]] = None
+
+    def __post_init__(self) -> None:
+        item = self.item
+        if item is None:
+            return
+        self.title = item.title
+        if item.submenu:
+            self.kind = "submenu"
+        elif item.command:
+            self.kind = "command"
+        elif item.action:
+            self.kind = "action"
+
+    @property
+    def is_runnable(self) -> bool:
+        """Whether the item runs an action or a command."""
+        return self.kind in ("action", "command")
+
+    def resolve(self) -> None:
+        """Build the item and its menu if the entry does not have them yet."""
+        if self.item is None and self.locate is not None:
+            self.item, self.menu = self.locate()
+            self.locate = None
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> Iterable[str]:
+    """Return the distinct character n-grams of a string."""
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+def _char_bonus(text: str, pos: int) -> int:
+    """Return the bonus for matching the character of ``text`` at ``pos``."""
+    if pos == 0 or text[pos - 1] == PATH_SEPARATOR:
+        return BONUS_SEGMENT
+    if text[pos - 1] in _BOUNDARY_CHARS:
+        if pos >= 2 and text[pos - 2] == PATH_SEPARATOR:
+            return BONUS_SEGMENT
+        return BONUS_BOUNDARY
+    return 0
+
+
+def fuzzy_score(query: str, text: str) -> Optional[int]:
+    """
+    Scores ``query`` as a subsequence of ``text``, fzf style.
+
+    Both strings are expected to be casefolded already. Every matched character
+    scores ``SCORE_MATCH``, plus a bonus when it starts a path segment or a word
+    (multiplied for the first character of the query) or directly follows the
+    previous match. Gaps between matched characters are penalized. The match
+    is the shortest window that ends at the leftmost complete match.
+
+    Args:
+        query (str): The characters to find, in order.
+        text (str): The text to search.
+
+    Returns:
+        Optional[int]: The score, or None if ``query`` is not a subsequence of ``text``.
+    """
+    pos = -1
+    for char in query:
+        pos = text.find(char, pos + 1)
+        if pos < 0:
+            return None
+    # Walk back from the end of the match to the latest possible start
+    pos += 1
+    for char in reversed(query):
+        pos = text.rfind(char, 0, pos)
+
+    score = 0
+    prev = pos - 1
+    bonus = 0
+    for index, char in enumerate(query):
+        pos = text.find(char, prev + 1)
+        if index == 0:
+            bonus = _char_bonus(text, pos) * BONUS_FIRST_CHAR_MULTIPLIER
+        elif pos == prev + 1:
+            # A consecutive match keeps the bonus of the chunk it extends
+            bonus = max(bonus, _char_bonus(text, pos), BONUS_CONSECUTIVE)
+        else:
+            score += SCORE_GAP_START + SCORE_GAP_EXTENSION * (pos - prev - 2)
+            bonus = _char_bonus(text, pos)
+        score += SCORE_MATCH + bonus
+        prev = pos
+    return score
+
+
+def _subsequence_pattern(query: str) -> re.Pattern:
+    """Compile a regex that finds ``query`` as a subsequence without backtracking."""
+    parts = [re.escape(query[0])]
+    for char in query[1:]:
+        escaped = re.escape(char)
+        parts.append(f"[^{escaped}]*{escaped}")
+    return re.compile("".join(parts))
+
+
+def _partition(result_ids: Iterable[int], predicate: Callable[[int], object]):
+    """Split ids into those that satisfy the predicate and the rest, keeping order."""
+    matching, rest = [], []
+    for result_id in result_ids:
+        (matching if predicate(result_id) else rest).append(result_id)
+    return matching, rest
+
+
+@dataclass
+class SearchPage:
+    """The best results for a query, out of ``total`` matches.
+
+    ``total`` only counts the titles that contain the query when ``exact`` is
+    False, as the paths were not scanned for scattered matches.
+    """
+
+    results: List[SearchResult]
+    total: int
+    exact: bool = True
+
+
+class SearchIndex:
+    """Fuzzy search over the titles and paths of search results.
+
+    Results are identified by their position in the sequence the index was
+    built from, followed by those added with ``extend``. Titles and paths are
+    casefolded once, when they are added.
+    """
+
+    def __init__(self, results: Sequence[SearchResult]) -> None:
+        self._results: List[SearchResult] = []
+        self._titles: List[str] = []
+        self._paths: List[str] = []
+        self._postings: Dict[str, array] = {}
+        self.extend(results)
+
+    def extend(self, results: Iterable[SearchResult]) -> None:
+        """Add results to the index, with ids following the existing ones.
+
+        Matches computed before the results were added do not include them.
+        """
+        start = len(self._results)
+        self._results.extend(results)
+        new = self._results[start:]
+        self._titles.extend(sr.title.casefold() for sr in new)
+        self._paths.extend(sr.path.casefold() for sr in new)
+        for result_id in range(start, len(self._results)):
+            for gram in ngrams(self._titles[result_id]):
+                posting = self._postings.get(gram)
+                if posting is None:
+                    posting = self._postings[gram] = array("l")
+                posting.append(result_id)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> List[SearchResult]:
+        """Return the best ``limit`` results for the query, best first."""
+        ranked = self.rank_titles(query, self.search_ids(query), limit)
+        if len(ranked) < limit:
+            ranked += self.rank_fuzzy(query, self.match_ids(query), limit - len(ranked))
+        return self.results(ranked)
+
+    def search_ids(self, query: str, cancelled: Optional[Callable[[], bool]] = None) -> List[int]:
+        """
+        Returns the ids of the results whose title contains the query, in order.
+
+        Queries of at least ``NGRAM_SIZE`` characters only check the items that
+        contain the query's rarest trigram; shorter ones check every title.
+
+        Args:
+            query (str): The search query.
+            cancelled (Optional[Callable[[], bool]]): Checked every ``CHUNK_SIZE`` ids.
+
+        Returns:
+            List[int]: The matching ids.
+
+        Raises:
+            SearchCancelled: If ``cancelled`` returns True before the search is done.
+        """
+        query = query.casefold()
+        titles = self._titles
+        if len(query) < NGRAM_SIZE:
+            candidates: Sequence[int] = range(len(titles))
+        else:
+            postings = []
+            for gram in ngrams(query):
+                posting = self._postings.get(gram)
+                if posting is None:
+                    return []
+                postings.append(posting)
+            # Every match contains all query n-grams, so the rarest one bounds the
+            # candidates; verifying them with a substring test is cheaper than merging
+            # the longer posting lists, and also checks that the n-grams are contiguous.
+            candidates = min(postings, key=len)
+        if cancelled is None:
+            return [result_id for result_id in candidates if query in titles[result_id]]
+        matched: List[int] = []
+        for start in range(0, len(candidates), CHUNK_SIZE):
+            if cancelled():
+                raise SearchCancelled(query)
+            chunk = candidates[start : start + CHUNK_SIZE]
+            matched.extend(result_id for result_id in chunk if query in titles[result_id])
+        return matched
+
+    def match_ids(
+        self,
+        query: str,
+        result_ids: Optional[Sequence[int]] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[int]:
+        """
+        Returns the ids of the results whose path contains the query as a subsequence.
+
+        Args:
+            query (str): The search query.
+            result_ids (Optional[Sequence[int]]): Only check these ids, in this order.
+                                                  Defaults to every result.
+            cancelled (Optional[Callable[[], bool]]): Checked every ``CHUNK_SIZE`` ids.
+
+        Returns:
+            List[int]: The matching ids, in the order they were checked.
+
+        Raises:
+            SearchCancelled: If ``cancelled`` returns True before the search is done.
+        """
+        query = query.casefold()
+        paths = self._paths
+        if result_ids is None:
+            result_ids = range(len(paths))
+        matches = _subsequence_pattern(query).search
+        if cancelled is None:
+            return [result_id for result_id in result_ids if matches(paths[result_id])]
+        matched: List[int] = []
+        for start in range(0, len(result_ids), CHUNK_SIZE):
+            if cancelled():
+                raise SearchCancelled(query)
+            chunk = result_ids[start : start + CHUNK_SIZE]
+            matched.extend(result_id for result_id in chunk if matches(paths[result_id]))
+        return matched
+
+    def rank_titles(
+        self,
+        query: str,
+        result_ids: Sequence[int],
+        limit: int = SEARCH_LIMIT,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[int]:
+        """
+        Returns the best ``limit`` of the results whose title contains the query.
+
+        Titles that start with the query come first, then those that contain
+        it at a word boundary, then the rest, shorter titles first within each
+        tier. Tiers are only split until ``limit`` ids are ranked, and each one
+        goes through a bounded heap, so a short query with a huge number of
+        matches never sorts all of them.
+
+        Args:
+            query (str): The search query.
+            result_ids (Sequence[int]): The ids returned by ``search_ids`` for the query.
+            limit (int): The maximum number of ids to return.
+            cancelled (Optional[Callable[[], bool]]): Checked before each tier.
+
+        Returns:
+            List[int]: The ids of the best matches.
+
+        Raises:
+            SearchCancelled: If ``cancelled`` returns True before the ranking is done.
+        """
+        query = query.casefold()
+        titles = self._titles
+        ranked: List[int] = []
+
+        def title_length(result_id: int) -> int:
+            return len(titles[result_id])
+
+        rest = result_ids
+        boundary = re.compile(f"[{re.escape(_BOUNDARY_CHARS)}]{re.escape(query)}").search
+        for in_tier in (
+            lambda result_id: titles[result_id].startswith(query),
+            lambda result_id: boundary(titles[result_id]),
+        ):
+            if cancelled is not None and cancelled():
+                raise SearchCancelled(query)
+            tier, rest = _partition(rest, in_tier)
+            ranked.extend(heapq.nsmallest(limit - len(ranked), tier, key=title_length))
+            if len(ranked) >= limit:
+                return ranked
+        ranked.extend(heapq.nsmallest(limit - len(ranked), rest, key=title_length))
+        return ranked
+
+    def rank_fuzzy(
+        self,
+        query: str,
+        result_ids: Sequence[int],
+        limit: int = SEARCH_LIMIT,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[int]:
+        """
+        Returns the best ``limit`` of the scattered matches of a query, best first.
+
+        Matches whose title contains the query are skipped, as ``rank_titles``
+        ranks them. Scattered matches in the title come before matches that
+        need the rest of the path, each tier by ``fuzzy_score``.
+
+        Args:
+            query (str): The search query.
+            result_ids (Sequence[int]): The ids returned by ``match_ids`` for the query.
+            limit (int): The maximum number of ids to return.
+            cancelled (Optional[Callable[[], bool]]): Checked before each tier.
+
+        Returns:
+            List[int]: The ids of the best matches.
+
+        Raises:
+            SearchCancelled: If ``cancelled`` returns True before the ranking is done.
+        """
+        query = query.casefold()
+        titles = self._titles
+        if cancelled is not None and cancelled():
+            raise SearchCancelled(query)
+        pattern = _subsequence_pattern(query).search
+        tier, rest = _partition(
+            (result_id for result_id in result_ids if query not in titles[result_id]),
+            lambda result_id: pattern(titles[result_id]),
+        )
+        ranked = heapq.nlargest(
+            limit, tier, key=lambda result_id: fuzzy_score(query, titles[result_id])
+        )
+        if len(ranked) < limit:
+            if cancelled is not None and cancelled():
+                raise SearchCancelled(query)
+            ranked.extend(
+                heapq.nlargest(
+                    limit - len(ranked),
+                    rest,
+                    key=lambda result_id: fuzzy_score(query, self._paths[result_id]),
+                )
+            )
+        return ranked
+
+    def results(self, result_ids: Iterable[int]) -> List[SearchResult]:
+        """Return the results for a sequence of result ids."""
+        return [self._results[result_id] for result_id in result_ids]
+
+
+class IncrementalSearch:
+    """Answers a query as it is typed, reusing the matches of its prefixes.
+
+    Every scattered match of a query also matches each of its prefixes, so when a
+    character is appended only the previous matches are filtered. The matches
+    of the current query's prefixes are kept on a stack, so deleting
+    characters pops back to a cached set instead of searching again.
+    """
+
+    def __init__(self, index: SearchIndex, limit: int = SEARCH_LIMIT) -> None:
+        self._index = index
+        self._limit = limit
+        self._stack: List[Tuple[str, List[int]]] = []
+
+    @property
+    def index(self) -> SearchIndex:
+        """The index being searched."""
+        return self._index
+
+    def search(self, query: str, cancelled: Optional[Callable[[], bool]] = None) -> SearchPage:
+        """
+        Returns the best results for the query, best first.
+
+        Titles that contain the query are looked up in the trigram index; the
+        paths are only scanned for scattered matches when those titles do not
+        fill the page.
+
+        Args:
+            query (str): The search query.
+            cancelled (Optional[Callable[[], bool]]): Checked between chunks and tiers.
+
+        Returns:
+            SearchPage: The best results and the number of matches.
+
+        Raises:
+            SearchCancelled: If ``cancelled`` returns True before the search is done.
+        """
+        index = self._index
+        title_ids = index.search_ids(query, cancelled)
+        ranked = index.rank_titles(query, title_ids, self._limit, cancelled)
+        if len(ranked) >= self._limit:
+            return SearchPage(index.results(ranked), len(title_ids), exact=False)
+        result_ids = self.match_ids(query, cancelled)
+        ranked += index.rank_fuzzy(query, result_ids, self._limit - len(ranked), cancelled)
+        return SearchPage(index.results(ranked), len(result_ids))
+
+    def match_ids(self, query: str, cancelled: Optional[Callable[[], bool]] = None) -> List[int]:
+        """Return the ids of all the subsequence matches of the query, in tree order.
+
+        Raises:
+            SearchCancelled: If ``cancelled`` returns True before the search is done.
+        """
+        query = query.casefold()
+        stack = self._stack
+        while stack and not query.startswith(stack[-1][0]):
+            stack.pop()
+        if stack and stack[-1][0] == query:
+            return stack[-1][1]
+        previous = stack[-1][1] if stack else None
+        result_ids = self._index.match_ids(query, previous, cancelled)
+        stack.append((query, result_ids))
+        return result_ids
+
+    def reset(self) -> None:
+        """Forget the cached matches."""
+        self._stack.clear()
@@ -0,0 +1,222 @@
+"""Streaming loader that builds menus while parsing the menu JSON file.
+
+``json.load`` materializes the whole document as dicts before a single
+``Menu`` is built, so peak memory is roughly twice the final tree.
+``stream_menu`` tokenizes a memory-mapped file incrementally instead and
+creates each ``Menu`` and ``MenuItem`` as soon as its JSON object is complete.
+Only small values such as colors and banners are held as plain dicts.
+"""
+
+import json
+import mmap
+import os
+import re
+from typing import Dict, Iterator, Optional
+
+from pymenu_cli.models.menu import Menu
+from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.pymenu import (
+    _create_menu_item,
+    _create_menu_items,
+    _menu_config,
+    create_menu_from_data,
+)
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"(?:[^"\\\x00-\x1f]|\\[^\x00-\x1f])*')
+_NUMBER = re.compile(rb"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+_LITERALS = {ord("t"): (b"true", True), ord("f"): (b"false", False), ord("n"): (b"null", None)}
+
+# An object without arrays whose values may themselves be flat objects, e.g. a
+# leaf item with a color. Those are decoded in one go by the C json decoder.
+_STRING_BODY = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_OTHER = rb'[^{}\[\]"]*'
+_FLAT_OBJECT = re.compile(
+    rb"\{"
+    + _OTHER
+    + rb"(?:(?:"
+    + _STRING_BODY
+    + rb"|\{"
+    + _OTHER
+    + rb"(?:"
+    + _STRING_BODY
+    + _OTHER
+    + rb")*\})"
+    + _OTHER
+    + rb")*\}",
+    re.DOTALL,
+)
+
+_DECODER = json.JSONDecoder()
+
+_QUOTE = ord('"')
+_BACKSLASH = b"\\"
+
+
+def stream_menu(file_path: str, actions: object) -> Menu:
+    """
+    Builds a menu directly from a JSON file without loading the whole document.
+
+    Args:
+        file_path (str): The path to the JSON file.
+        actions (object): An object containing callable actions.
+
+    Returns:
+        Menu: The created menu.
+
+    Raises:
+        FileNotFoundError: If the menu JSON file is not found.
+        json.JSONDecodeError: If the menu JSON file is not valid JSON.
+    """
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _MenuParser(buf, actions).parse()
+
+
+class _MenuParser:  # pylint: disable=too-few-public-methods
+    """Recursive-descent parser over a byte buffer that knows the menu schema."""
+
+    def __init__(self, buf, actions: object) -> None:
+        self._buf = buf
+        self._pos = 0
+        self._end = len(buf)
+        self._actions = actions
+
+    def parse(self) -> Menu:
+        """Parse the whole buffer as one menu object."""
+        if self._peek() == ord("{"):
+            menu = self._menu()
+        else:
+            # Valid JSON that is not a menu fails the same way as in create_menu_from_data
+            menu = create_menu_from_data(self._value(), self._actions)
+        if self._peek() is not None:
+            raise self._error("Extra data")
+        return menu
+
+    def _menu(self) -> Menu:
+        fields: Dict = {}
+        items = None
+        for key in self._members():
+            if key == "items" and self._peek() == ord("["):
+                items = [self._item() for _ in self._elements()]
+            else:
+                fields[key] = self._value()
+        title = fields["title"]
+        if items is None:
+            items = _create_menu_items(fields["items"], self._actions, False)
+        config = _menu_config(fields, self._actions)
+        config["items"] = items
+        return Menu(i_title=title, i_config=config)
+
+    def _item(self) -> MenuItem:
+        if self._peek() != ord("{"):
+            return _create_menu_item(self._value())
+        match = _FLAT_OBJECT.match(self._buf, self._pos)
+        if match is not None:
+            try:
+                fields, _ = _DECODER.raw_decode(match.group().decode("utf-8"))
+            except json.JSONDecodeError:
+                pass  # Parse it token by token to report the error position
+            else:
+                if "submenu" not in fields:
+                    self._pos = match.end()
+                    return _create_menu_item(fields)
+        fields = {}
+        submenu = None
+        for key in self._members():
+            if key == "submenu" and self._peek() == ord("{"):
+                submenu = self._menu()
+            else:
+                fields[key] = self._value()
+        return _create_menu_item(fields, submenu)
+
+    def _value(self):
+        char = self._peek()
+        if char == ord("{"):
+            return {key: self._value() for key in self._members()}
+        if char == ord("["):
+            return [self._value() for _ in self._elements()]
+        if char == _QUOTE:
+            return self._string()
+        if char in _LITERALS:
+            literal, value = _LITERALS[char]
+            if self._buf[self._pos : self._pos + len(literal)] == literal:
+                self._pos += len(literal)
+                return value
+        match = _NUMBER.match(self._buf, self._pos)
+        if match is None:
+            raise self._error("Expecting value")
+        self._pos = match.end()
+        if match.group(1) or match.group(2):
+            return float(match.group())
+        return int(match.group())
+
+    def _members(self) -> Iterator[str]:
+        """Yield the keys of an object, leaving the position at each value."""
+        self._pos += 1
+        if self._peek() == ord("}"):
+            self._pos += 1
+            return
+        while True:
+            if self._peek() != _QUOTE:
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self._string()
+            if self._peek() != ord(":"):
+                raise self._error("Expecting ':' delimiter")
+            self._pos += 1
+            self._peek()
+            yield key
+            char = self._peek()
+            self._pos += 1
+            if char == ord("}"):
+                return
+            if char != ord(","):
+                self._pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def _elements(self) -> Iterator[None]:
+        """Yield once per array element, leaving the position at each element."""
+        self._pos += 1
+        if self._peek() == ord("]"):
+            self._pos += 1
+            return
+        while True:
+            self._peek()
+            yield None
+            char = self._peek()
+            self._pos += 1
+            if char == ord("]"):
+                return
+            if char != ord(","):
+                self._pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def _string(self) -> str:
+        start = self._pos
+        match = _STRING.match(self._buf, start)
+        end = match.end()
+        if end >= self._end:
+            raise self._error("Unterminated string starting at", start)
+        if self._buf[end] != _QUOTE:
+            raise self._error("Invalid control character at", end)
+        self._pos = end + 1
+        raw = self._buf[start : end + 1]
+        if _BACKSLASH not in raw:
+            return raw[1:-1].decode("utf-8")
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise self._error(exc.msg, start + exc.pos) from None
+
+    def _peek(self):
+        """Skip whitespace and return the next byte, or None at the end of the buffer."""
+        self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+        if self._pos >= self._end:
+            return None
+        return self._buf[self._pos]
+
+    def _error(self, msg: str, pos: Optional[int] = None) -> json.JSONDecodeError:
+        doc = self._buf[: self._pos if pos is None else pos].decode("utf-8", "replace")
+        return json.JSONDecodeError(msg, doc, len(doc))
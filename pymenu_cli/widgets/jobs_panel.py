@@ -0,0 +1,116 @@
+"""Jobs panel widget listing queued, running and finished action runs."""
+
+from __future__ import annotations
+
+from rich.text import Text
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.message import Message
+from textual.widgets import OptionList
+from textual.widgets.option_list import Option, OptionDoesNotExist
+
+from pymenu_cli.jobs import CANCELLED, DONE, FAILED, QUEUED, RUNNING, SKIPPED, Job, JobScheduler
+
+# How often the durations of running jobs are redrawn, in seconds
+REFRESH_INTERVAL = 0.5
+
+_STATE_MARKS = {
+    QUEUED: ("…", "dim"),
+    RUNNING: ("⏳", "yellow"),
+    DONE: ("✓", "green"),
+    FAILED: ("✗", "red"),
+    CANCELLED: ("⊘", "dim"),
+    SKIPPED: ("↷", "dim"),
+}
+
+
+class JobsPanel(Vertical):
+    """Lists the jobs of a JobScheduler, newest first, with their state and duration.
+
+    The panel stays hidden until the first job is submitted. Selecting a job
+    asks the app to show only that job's output; Escape goes back to all output.
+    """
+
+    class JobSelected(Message):
+        """Posted when the user picks a job, or None to show the output of every job."""
+
+        def __init__(self, job_id: int | None) -> None:
+            super().__init__()
+            self.job_id = job_id
+
+    BINDINGS = [Binding("escape", "show_all", "All output", show=True)]
+
+    DEFAULT_CSS = """
+    JobsPanel {
+        height: auto;
+        max-height: 8;
+        display: none;
+    }
+    JobsPanel OptionList {
+        height: auto;
+        max-height: 8;
+    }
+    """
+
+    def __init__(self, scheduler: JobScheduler) -> None:
+        super().__init__(id="jobs-panel")
+        self.scheduler = scheduler
+
+    def compose(self):
+        """Compose the panel with the list of jobs."""
+        yield OptionList(id="jobs-list")
+
+    def on_mount(self) -> None:
+        """Redraw the durations of running jobs while they run."""
+        self.set_interval(REFRESH_INTERVAL, self._tick)
+
+    def _tick(self) -> None:
+        if self.scheduler.running:
+            self.refresh_jobs()
+
+    @staticmethod
+    def render_job(job: Job) -> Text:
+        """Return the row of a job: its id, state, action name and duration."""
+        mark, style = _STATE_MARKS[job.state]
+        row = Text(no_wrap=True)
+        row.append(f"#{job.id} ", style="dim")
+        row.append(f"{mark} ", style=style)
+        row.append(job.name)
+        duration = job.duration()
+        if duration is None:
+            row.append(f"  {job.state}", style="dim")
+        else:
+            row.append(f"  {job.state} {duration:.1f}s", style="dim")
+        return row
+
+    def refresh_jobs(self) -> None:
+        """Rebuild the list from the scheduler, keeping the highlighted job, if any."""
+        jobs = self.scheduler.jobs
+        self.display = bool(jobs)
+        option_list = self.query_one(OptionList)
+        highlighted = self.highlighted_job
+        option_list.clear_options()
+        option_list.add_options(
+            Option(self.render_job(job), id=str(job.id)) for job in reversed(jobs)
+        )
+        option_list.highlighted = 0 if jobs else None
+        if highlighted is not None:
+            try:
+                option_list.highlighted = option_list.get_option_index(str(highlighted))
+            except OptionDoesNotExist:
+                pass  # The job was dropped from the history; highlight the newest one
+
+    @property
+    def highlighted_job(self) -> int | None:
+        """The id of the highlighted job, if any."""
+        option = self.query_one(OptionList).highlighted_option
+        return None if option is None else int(option.id)
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Ask for the output of the selected job."""
+        event.stop()
+        self.post_message(self.JobSelected(int(event.option.id)))
+
+    def action_show_all(self) -> None:
+        """Ask for the output of every job."""
+        self.post_message(self.JobSelected(None))
@@ -5,43 +5,71 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from rich.text import Text
-from textual.containers import Vertical
+from textual.geometry import Region, Size
 from textual.message import Message
 from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from pymenu_cli.search import SearchResult
 
 
 @dataclass
-class SearchResult:
-    """A search result entry from the global menu index."""
+class RenderCounters:
+    """Counts the rendering work done by a MenuListPanel.
+
+    Attributes:
+        lines (int): Rows returned from ``render_line``.
+        formats (int): Rows styled from scratch because they were not in the row cache.
+    """
+
+    lines: int = 0
+    formats: int = 0
 
-    item: object
-    path: str
-    menu: object
+    def reset(self) -> None:
+        """Set both counters back to zero."""
+        self.lines = 0
+        self.formats = 0
 
 
-class MenuListPanel(Vertical, can_focus=True):
+# pylint: disable-next=too-many-instance-attributes,too-many-public-methods
+class MenuListPanel(ScrollView, can_focus=True, inherit_bindings=False):
     """Displays the current menu's items as a navigable list.
 
     Supports two modes:
     - Normal: shows items from the current menu
     - Search: shows global search results from all menus
+
+    The list is virtualized with Textual's line API: only the rows inside the
+    viewport are rendered, so moving the cursor costs the same for ten items
+    as for a hundred thousand. Styled rows are cached per item and highlight
+    state, and a cursor move only repaints the two rows it changes.
+
+    Space marks or unmarks the highlighted action, so that several actions,
+    from any menu, can be run together; marks stay while navigating.
     """
 
     class MenuItemSelected(Message):
-        """Posted when the user selects a menu item."""
+        """Posted when the user selects a menu item.
+
+        ``refresh`` is True when the user asked to run the action even if its
+        cached output is still fresh.
+        """
 
-        def __init__(self, item, menu=None) -> None:
+        def __init__(self, item, menu=None, refresh: bool = False) -> None:
             super().__init__()
             self.item = item
             self.menu = menu
+            self.refresh = refresh
 
     DEFAULT_CSS = """
     MenuListPanel {
         height: 1fr;
+        overflow-x: hidden;
     }
     """
 
-    cursor_index: reactive[int] = reactive(0)
+    cursor_index: reactive[int] = reactive(0, repaint=False)
 
     def __init__(self, menu) -> None:
         super().__init__(id="menu-panel")
@@ -49,6 +77,13 @@ class MenuListPanel(Vertical, can_focus=True):
         self._filter_query = ""
         self._filtered_indices: list[int] = []
         self._search_results: list[SearchResult] | None = None
+        self._search_total = 0
+        self._search_exact = True
+        self._search_status: str | None = None
+        self._row_cache: dict[tuple[int, bool, bool, bool], Strip] = {}
+        self._running_items: set[int] = set()
+        self._marked: dict[int, tuple[object, object]] = {}
+        self.render_counters = RenderCounters()
         self._update_filtered()
 
     @property
@@ -68,6 +103,11 @@ class MenuListPanel(Vertical, can_focus=True):
         """Whether the panel is currently showing search results."""
         return self._search_results is not None
 
+    @property
+    def page_size(self) -> int:
+        """Return the number of rows that fit in the viewport."""
+        return max(1, self.scrollable_content_region.height)
+
     def _update_filtered(self) -> None:
         if not self._filter_query:
             self._filtered_indices = list(range(len(self.menu.items)))
@@ -81,25 +121,49 @@ class MenuListPanel(Vertical, can_focus=True):
         else:
             self.cursor_index = 0
 
+    def _rows_changed(self) -> None:
+        """Resize the scrollable area to the new rows and repaint the viewport."""
+        self._row_cache.clear()
+        self.virtual_size = Size(0, len(self._footer_rows()) + self.visible_item_count)
+        self._scroll_to_cursor()
+        self.refresh()
+
     def filter_items(self, query: str) -> None:
         """Filter current menu items (local filter, no search results)."""
         self._filter_query = query
         self._search_results = None
         self._update_filtered()
-        self.refresh()
+        self._rows_changed()
+
+    def set_search_results(
+        self, results: list[SearchResult], total: int | None = None, exact: bool = True
+    ) -> None:
+        """Switch to search results mode with global results.
 
-    def set_search_results(self, results: list[SearchResult]) -> None:
-        """Switch to search results mode with global results."""
+        ``total`` is the number of matches when ``results`` only holds the best of them,
+        and only a lower bound when ``exact`` is False.
+        """
         self._search_results = results
+        self._search_total = len(results) if total is None else total
+        self._search_exact = exact
+        self._search_status = None
         self.cursor_index = 0
-        self.refresh()
+        self._rows_changed()
+
+    def set_search_status(self, status: str) -> None:
+        """Switch to search results mode with no results and a status line, e.g. while indexing."""
+        self._search_results = []
+        self._search_total = 0
+        self._search_status = status
+        self.cursor_index = 0
+        self._rows_changed()
 
     def clear_search(self) -> None:
         """Exit search mode and show current menu items."""
         self._search_results = None
         self._filter_query = ""
         self._update_filtered()
-        self.refresh()
+        self._rows_changed()
 
     def set_menu(self, menu) -> None:
         """Replace the current menu and reset filter/search state."""
@@ -108,55 +172,184 @@ class MenuListPanel(Vertical, can_focus=True):
         self._search_results = None
         self.cursor_index = 0
         self._update_filtered()
-        self.refresh()
-
-    def render(self) -> Text:
+        self._rows_changed()
+
+    def on_mount(self) -> None:
+        """Size the scrollable area once the panel is mounted."""
+        self._rows_changed()
+
+    def render_line(self, y: int) -> Strip:
+        """Render one row of the viewport."""
+        width = self.size.width
+        style = self.rich_style
+        strip = self._row_strip(self.scroll_offset.y + y)
+        if strip is None:
+            return Strip.blank(width, style)
+        self.render_counters.lines += 1
+        return strip.crop_extend(0, width, style).apply_style(style)
+
+    def _row_strip(self, row: int) -> Strip | None:
+        """Return the styled segments of a row of the list, or None past the last row."""
+        count = self.visible_item_count
+        if row >= count:
+            footer = self._footer_rows()
+            if row - count < len(footer):
+                return Strip(footer[row - count].render(self.app.console))
+            return None
         if self._search_results is not None:
-            return self._render_search_results()
-        return self._render_menu_items()
-
-    def _render_menu_items(self) -> Text:
-        result = Text()
-        for list_idx, item_idx in enumerate(self._filtered_indices):
-            item = self.menu.items[item_idx]
-            is_highlighted = list_idx == self.cursor_index
-            if is_highlighted:
-                prefix = "❯ "
-                style = "bold reverse"
+            entry = self._search_results[row]
+        else:
+            entry = self.menu.items[self._filtered_indices[row]]
+        item = entry.item if self._search_results is not None else entry
+        # The cache is cleared whenever the rows change, so ids stay unique while cached
+        key = (
+            id(entry),
+            row == self.cursor_index,
+            id(item) in self._running_items,
+            id(item) in self._marked,
+        )
+        strip = self._row_cache.get(key)
+        if strip is None:
+            if self._search_results is not None:
+                text = self._render_search_result(entry, *key[1:])
             else:
-                prefix = "  "
-                style = ""
-            result.append(f"{prefix}{item.title}", style=style)
-            if item.submenu:
-                result.append("  → submenu", style="dim" if not is_highlighted else style)
-            elif item.action:
-                result.append("  ⚡ action", style="dim" if not is_highlighted else style)
-            result.append("\n")
+                text = self._render_menu_item(entry, *key[1:])
+            strip = self._row_cache[key] = Strip(text.render(self.app.console))
+            self.render_counters.formats += 1
+        return strip
+
+    def refresh_row(self, row: int) -> None:
+        """Repaint a single row of the list if it is inside the viewport."""
+        y = row - self.scroll_offset.y
+        if 0 <= y < self.size.height:
+            self.refresh(Region(0, y, self.size.width, 1))
+
+    def _footer_rows(self) -> list[Text]:
+        """Return the status rows shown after the search results."""
+        if self._search_results is None:
+            return []
+        if self._search_status is not None:
+            return [Text(f"  {self._search_status}", style="dim")]
+        if not self._search_results:
+            return [Text("  No results found", style="dim")]
+        hidden = self._search_total - len(self._search_results)
+        if not self._search_exact:
+            more = f"at least {hidden} more" if hidden > 0 else "more"
+            return [Text(f"  … {more} matches, refine the search", style="dim")]
+        if hidden > 0:
+            return [Text(f"  … {hidden} more matches, refine the search", style="dim")]
+        return []
+
+    @staticmethod
+    def _render_menu_item(
+        item, is_highlighted: bool, is_running: bool, is_marked: bool = False
+    ) -> Text:
+        result = Text(no_wrap=True)
+        if is_highlighted:
+            prefix = "❯ "
+            style = "bold reverse"
+        else:
+            prefix = "  "
+            style = ""
+        if is_marked:
+            result.append(prefix, style=style)
+            result.append("◉ ", style="bold cyan" if not is_highlighted else style)
+            prefix = ""
+        result.append(f"{prefix}{item.title}", style=style)
+        if item.submenu:
+            result.append("  → submenu", style="dim" if not is_highlighted else style)
+        elif is_running:
+            result.append("  ⏳ running", style="yellow" if not is_highlighted else style)
+        elif item.command:
+            result.append("  $ command", style="dim" if not is_highlighted else style)
+        elif item.action:
+            result.append("  ⚡ action", style="dim" if not is_highlighted else style)
         return result
 
-    def _render_search_results(self) -> Text:
-        result = Text()
-        if not self._search_results:
-            result.append("  No results found\n", style="dim")
-            return result
-        for idx, sr in enumerate(self._search_results):
-            is_highlighted = idx == self.cursor_index
-            if is_highlighted:
-                prefix = "❯ "
-                style = "bold reverse"
-            else:
-                prefix = "  "
-                style = ""
-            result.append(f"{prefix}{sr.item.title}", style=style)
-            if sr.item.submenu:
-                result.append("  → submenu", style="dim" if not is_highlighted else style)
-            elif sr.item.action:
-                result.append("  ⚡", style="dim" if not is_highlighted else style)
-            # Show the path in dim below the item
-            result.append(f"  ({sr.path})", style="dim" if not is_highlighted else style)
-            result.append("\n")
+    @staticmethod
+    def _render_search_result(
+        sr: SearchResult, is_highlighted: bool, is_running: bool, is_marked: bool = False
+    ) -> Text:
+        result = Text(no_wrap=True)
+        if is_highlighted:
+            prefix = "❯ "
+            style = "bold reverse"
+        else:
+            prefix = "  "
+            style = ""
+        if is_marked:
+            result.append(prefix, style=style)
+            result.append("◉ ", style="bold cyan" if not is_highlighted else style)
+            prefix = ""
+        result.append(f"{prefix}{sr.title}", style=style)
+        if sr.kind == "submenu":
+            result.append("  → submenu", style="dim" if not is_highlighted else style)
+        elif is_running:
+            result.append("  ⏳", style="yellow" if not is_highlighted else style)
+        elif sr.kind == "command":
+            result.append("  $", style="dim" if not is_highlighted else style)
+        elif sr.kind == "action":
+            result.append("  ⚡", style="dim" if not is_highlighted else style)
+        # Show the path in dim next to the item
+        result.append(f"  ({sr.path})", style="dim" if not is_highlighted else style)
         return result
 
+    @property
+    def selected_item(self) -> object | None:
+        """Return the menu item under the cursor, or None if the list is empty or the
+        item is a search result in a lazy submenu that is not built yet."""
+        selected = self._get_selected_item()
+        if isinstance(selected, SearchResult):
+            return selected.item
+        return selected
+
+    @property
+    def selected_is_runnable(self) -> bool:
+        """Whether the item under the cursor runs an action or a command, without building it."""
+        selected = self._get_selected_item()
+        if isinstance(selected, SearchResult):
+            return selected.is_runnable
+        return selected is not None and selected.is_runnable
+
+    def set_running(self, item, running: bool) -> None:
+        """Show or clear the running indicator of an item."""
+        if running:
+            self._running_items.add(id(item))
+        else:
+            self._running_items.discard(id(item))
+        # Only the rows in the viewport are repainted, mostly from the row cache
+        self.refresh()
+
+    @property
+    def marked_items(self) -> list[tuple[object, object]]:
+        """Return the marked items with the menus they belong to, in the order they were marked."""
+        return list(self._marked.values())
+
+    def toggle_mark(self) -> None:
+        """Mark the highlighted item if it runs an action or a command, or unmark it."""
+        selected = self._get_selected_item()
+        if isinstance(selected, SearchResult):
+            if not selected.is_runnable:
+                return
+            selected.resolve()
+            item, menu = selected.item, selected.menu
+        else:
+            item, menu = selected, self.menu
+        if item is None or not item.is_runnable:
+            return
+        if self._marked.pop(id(item), None) is None:
+            self._marked[id(item)] = (item, menu)
+        self.refresh_row(self.cursor_index)
+
+    def clear_marks(self) -> None:
+        """Unmark every item."""
+        self._marked.clear()
+        self.refresh()
+
+    def key_space(self) -> None:
+        """Mark or unmark the highlighted item for running it with the other marked ones."""
+        self.toggle_mark()
+
     def _get_selected_item(self) -> object | None:
         if self._search_results is not None:
             if not self._search_results or self.cursor_index >= len(self._search_results):
@@ -172,17 +365,38 @@ class MenuListPanel(Vertical, can_focus=True):
             return len(self._search_results) - 1
         return len(self._filtered_indices) - 1
 
+    def watch_cursor_index(self, old_index: int, new_index: int) -> None:
+        """Keep the cursor row inside the viewport and repaint the rows it left and entered."""
+        if not self.is_mounted:
+            return
+        top = self.scroll_offset.y
+        self._scroll_to_cursor()
+        if self.scroll_offset.y == top:
+            # Scrolling repaints the whole viewport; otherwise only two rows changed
+            self.refresh_row(old_index)
+            self.refresh_row(new_index)
+
+    def _scroll_to_cursor(self) -> None:
+        if not self.is_mounted:
+            return
+        top = self.scroll_offset.y
+        if self.cursor_index < top:
+            self.scroll_to(y=self.cursor_index, animate=False, immediate=True)
+        elif self.cursor_index >= top + self.page_size:
+            self.scroll_to(y=self.cursor_index - self.page_size + 1, animate=False, immediate=True)
+
+    def _move_cursor(self, index: int) -> None:
+        index = max(0, min(index, self._max_index()))
+        if index != self.cursor_index:
+            self.cursor_index = index
+
     def key_down(self) -> None:
         """Move the cursor down one item."""
-        if self.cursor_index < self._max_index():
-            self.cursor_index += 1
-            self.refresh()
+        self._move_cursor(self.cursor_index + 1)
 
     def key_up(self) -> None:
         """Move the cursor up one item."""
-        if self.cursor_index > 0:
-            self.cursor_index -= 1
-            self.refresh()
+        self._move_cursor(self.cursor_index - 1)
 
     def key_j(self) -> None:
         """Vim-style alias for key_down."""
@@ -192,12 +406,35 @@ class MenuListPanel(Vertical, can_focus=True):
         """Vim-style alias for key_up."""
         self.key_up()
 
+    def key_pagedown(self) -> None:
+        """Move the cursor down one page."""
+        self._move_cursor(self.cursor_index + self.page_size)
+
+    def key_pageup(self) -> None:
+        """Move the cursor up one page."""
+        self._move_cursor(self.cursor_index - self.page_size)
+
+    def key_home(self) -> None:
+        """Move the cursor to the first item."""
+        self._move_cursor(0)
+
+    def key_end(self) -> None:
+        """Move the cursor to the last item."""
+        self._move_cursor(self._max_index())
+
     def key_enter(self) -> None:
         """Select the currently highlighted item and post a MenuItemSelected message."""
+        self.select_highlighted()
+
+    def select_highlighted(self, refresh: bool = False) -> None:
+        """Post a MenuItemSelected message for the highlighted item, if any."""
         selected = self._get_selected_item()
         if selected is None:
             return
         if isinstance(selected, SearchResult):
-            self.post_message(self.MenuItemSelected(selected.item, menu=selected.menu))
+            selected.resolve()
+            self.post_message(
+                self.MenuItemSelected(selected.item, menu=selected.menu, refresh=refresh)
+            )
         else:
-            self.post_message(self.MenuItemSelected(selected))
+            self.post_message(self.MenuItemSelected(selected, refresh=refresh))
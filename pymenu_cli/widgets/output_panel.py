@@ -1,12 +1,22 @@
 """Output panel widget for displaying action stdout/stderr."""
 
+from __future__ import annotations
+
+from collections import deque
+
 from rich.text import Text
 from textual.containers import Vertical
 from textual.widgets import RichLog
 
+OUTPUT_HISTORY = 10_000
+
 
 class OutputPanel(Vertical):
-    """A scrollable log panel for action output."""
+    """A scrollable log panel for action output.
+
+    Every line is tagged with the job that wrote it, if any, so the panel can
+    show the output of all jobs interleaved or of a single job.
+    """
 
     DEFAULT_CSS = """
     OutputPanel {
@@ -17,24 +27,67 @@ class OutputPanel(Vertical):
 
     def __init__(self) -> None:
         super().__init__(id="output-panel")
+        self._entries: deque[tuple[int | None, Text | str]] = deque(maxlen=OUTPUT_HISTORY)
+        self._job_filter: int | None = None
 
     def compose(self):
         """Compose the output panel with a scrollable RichLog widget."""
         yield RichLog(highlight=True, markup=True, id="output-log")
 
-    def append_output(self, text: str) -> None:
+    @property
+    def job_filter(self) -> int | None:
+        """The id of the job whose output is shown, or None when all output is shown."""
+        return self._job_filter
+
+    def _write(self, content: Text | str, job_id: int | None) -> None:
+        self._entries.append((job_id, content))
+        if self._job_filter is None or job_id == self._job_filter:
+            self.query_one("#output-log", RichLog).write(content)
+
+    def append_output(self, text: str, job_id: int | None = None) -> None:
         """Append a plain-text line to the output log."""
-        log = self.query_one("#output-log", RichLog)
-        log.write(text)
+        self._write(text, job_id)
 
-    def append_error(self, text: str) -> None:
+    def append_error(self, text: str, job_id: int | None = None) -> None:
         """Append an error message in bold red to the output log."""
-        log = self.query_one("#output-log", RichLog)
-        error_text = Text(text, style="bold red")
-        log.write(error_text)
+        self._write(Text(text, style="bold red"), job_id)
+
+    def append_note(self, text: str, job_id: int | None = None) -> None:
+        """Append a dim line of information about a run, such as what it cost."""
+        self._write(Text(text, style="dim"), job_id)
+
+    def append_summary(self, title: str, rows: list[Text]) -> None:
+        """Append a bold title followed by indented rows, e.g. the outcome of a batch."""
+        self._write(Text(title, style="bold"), None)
+        for row in rows:
+            self._write(Text("  ").append_text(row), None)
 
-    def append_action_header(self, action_name: str) -> None:
+    def append_action_header(
+        self, action_name: str, job_id: int | None = None, note: str | None = None
+    ) -> None:
         """Append a cyan action header line showing the action being executed."""
+        self._write_header(f"$ {action_name}()", job_id, note)
+
+    def append_command_header(
+        self, command_line: str, job_id: int | None = None, note: str | None = None
+    ) -> None:
+        """Append a cyan header line showing the command being run."""
+        self._write_header(f"$ {command_line}", job_id, note)
+
+    def _write_header(self, title: str, job_id: int | None, note: str | None) -> None:
+        header = Text(title, style="bold cyan")
+        if job_id is not None:
+            header.append(f"  #{job_id}", style="dim")
+        if note is not None:
+            header.append(f"  {note}", style="dim")
+        self._write(header, job_id)
+
+    def show_job(self, job_id: int | None, title: str | None = None) -> None:
+        """Show only the output of one job, or of every job when ``job_id`` is None."""
+        self._job_filter = job_id
+        self.border_title = title if job_id is not None else None
         log = self.query_one("#output-log", RichLog)
-        header = Text(f"$ {action_name}()", style="bold cyan")
-        log.write(header)
+        log.clear()
+        for entry_job, content in self._entries:
+            if job_id is None or entry_job == job_id:
+                log.write(content)
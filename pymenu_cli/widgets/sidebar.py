@@ -8,7 +8,13 @@ from textual.widgets import Tree
 
 
 class MenuSidebar(Vertical):
-    """A sidebar that displays the full menu tree."""
+    """A sidebar that displays the menu tree.
+
+    Tree nodes are created the first time their parent is expanded, so
+    startup time and memory depend on the expanded part of the tree only.
+    With ``lazy_root`` the root starts collapsed and even the top-level
+    nodes wait for it to be expanded.
+    """
 
     class SidebarItemSelected(Message):
         """Posted when a sidebar menu node is selected."""
@@ -24,26 +30,53 @@ class MenuSidebar(Vertical):
     }
     """
 
-    def __init__(self, root_menu) -> None:
+    def __init__(self, root_menu, lazy_root: bool = False) -> None:
+        """
+        Args:
+            root_menu: The root menu of the tree.
+            lazy_root: Start with the root collapsed and create its children on expansion.
+        """
         super().__init__(id="sidebar")
         self.root_menu = root_menu
         self._active_menu = root_menu
+        self._lazy_root = lazy_root
+        self._populated: set[int] = set()
+        self._node_count = 1
 
     def compose(self):
         tree = Tree(self.root_menu.title, id="sidebar-tree")
         tree.root.data = self.root_menu
-        self._build_tree(tree.root, self.root_menu)
-        tree.root.expand()
+        if not self._lazy_root:
+            self._populate(tree.root)
+            tree.root.expand()
         yield tree
 
-    def _build_tree(self, node, menu) -> None:
-        for item in menu.items:
+    @property
+    def node_count(self) -> int:
+        """Return the number of tree nodes created so far, including the root."""
+        return self._node_count
+
+    def _populate(self, node) -> None:
+        """Create the child nodes of a menu node, once."""
+        if node.id in self._populated:
+            return
+        self._populated.add(node.id)
+        items = node.data.items
+        self._node_count += len(items)
+        for item in items:
             if item.submenu:
-                child = node.add(item.title, data=item.submenu)
-                self._build_tree(child, item.submenu)
+                node.add(item.title, data=item.submenu)
             else:
                 node.add_leaf(item.title, data=item)
 
+    @on(Tree.NodeExpanded)
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Create the children of a menu node the first time it is expanded."""
+        from pymenu_cli.models.menu import Menu  # Lazy import to avoid circular dependency
+
+        if isinstance(event.node.data, Menu):
+            self._populate(event.node)
+
     def set_active(self, menu) -> None:
         """Update the currently active menu reference in the sidebar."""
         self._active_menu = menu
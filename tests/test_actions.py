@@ -0,0 +1,145 @@
+"""Tests for deferred actions module loading."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pymenu_cli.actions import DeferredActions, scan_action_names
+from pymenu_cli.app import MenuApp
+from pymenu_cli.pymenu import load_actions_module, load_menu, main
+from pymenu_cli.runner import call_action, is_async_action
+
+ACTIONS_SOURCE = """
+import os
+
+MARKER = os.environ.get("PYMENU_TEST_MARKER")
+if MARKER:
+    open(MARKER, "a").close()
+
+def action1():
+    print("one")
+
+async def action2():
+    pass
+
+class Helper:
+    def method(self):
+        pass
+
+def _outer():
+    def nested():
+        pass
+"""
+
+
+def _write_actions(tmp_path):
+    actions_file = tmp_path / "actions.py"
+    actions_file.write_text(ACTIONS_SOURCE, encoding="utf-8")
+    return str(actions_file)
+
+
+def test_scan_action_names(tmp_path):
+    names = scan_action_names(_write_actions(tmp_path))
+    assert names == {"action1", "action2", "_outer"}
+
+
+def test_deferred_actions_know_async_names(tmp_path):
+    actions = DeferredActions(_write_actions(tmp_path))
+    assert actions._async_names == {"action2"}
+
+
+def test_deferred_actions_import_on_first_use(tmp_path, monkeypatch):
+    marker = tmp_path / "imported"
+    monkeypatch.setenv("PYMENU_TEST_MARKER", str(marker))
+
+    actions = load_actions_module(_write_actions(tmp_path), deferred=True)
+    assert isinstance(actions, DeferredActions)
+    assert not actions._is_loaded
+    assert not marker.exists()
+
+    assert callable(actions.action1)
+    assert actions._is_loaded
+    assert marker.exists()
+    with pytest.raises(AttributeError):
+        actions.missing_action  # pylint: disable=pointless-statement
+
+
+def test_deferred_actions_preload(tmp_path):
+    actions = DeferredActions(_write_actions(tmp_path))
+    actions._preload()
+    actions._preload_thread.join(timeout=5)  # pylint: disable=protected-access
+    assert actions._is_loaded
+
+
+def test_deferred_actions_do_not_hide_actions_named_like_their_api(tmp_path):
+    actions_file = tmp_path / "actions.py"
+    actions_file.write_text(
+        "def load():\n    print('load action')\n\nasync def preload():\n    pass\n"
+    )
+    actions = DeferredActions(str(actions_file))
+    assert is_async_action(actions, "preload")
+    assert call_action(actions, "load").stdout == "load action\n"
+    assert actions._is_loaded
+
+
+def test_deferred_actions_missing_file():
+    with pytest.raises(FileNotFoundError):
+        DeferredActions("invalid_path.py")
+
+
+def _write_menu(tmp_path, action_names):
+    menu_file = tmp_path / "menu.json"
+    menu_data = {
+        "title": "Main Menu",
+        "items": [
+            {"title": "Item 1", "action": action_names[0]},
+            {
+                "title": "Sub",
+                "submenu": {
+                    "title": "Sub",
+                    "items": [{"title": name, "action": name} for name in action_names[1:]],
+                },
+            },
+        ],
+    }
+    menu_file.write_text(json.dumps(menu_data), encoding="utf-8")
+    return str(menu_file)
+
+
+@pytest.mark.parametrize("options", [{}, {"streaming": True}, {"use_cache": True}])
+def test_load_menu_defer_actions_validates_names(tmp_path, options):
+    actions_file = _write_actions(tmp_path)
+
+    menu = load_menu(
+        _write_menu(tmp_path, ["action1", "action2"]), actions_file, defer_actions=True, **options
+    )
+    assert not menu.actions._is_loaded
+
+    with pytest.raises(ValueError, match="missing_one, missing_two"):
+        load_menu(
+            _write_menu(tmp_path, ["action1", "missing_two", "missing_one"]),
+            actions_file,
+            defer_actions=True,
+            **options,
+        )
+
+
+def test_main_reports_missing_actions(tmp_path, capsys):
+    actions_file = _write_actions(tmp_path)
+    menu_file = _write_menu(tmp_path, ["action1", "missing"])
+    argv = ["pymenu-cli", "-m", menu_file, "-a", actions_file, "--defer-actions"]
+    with patch("sys.argv", argv):
+        main()
+    assert "Actions not found" in capsys.readouterr().out
+
+
+async def test_app_preloads_deferred_actions(tmp_path):
+    menu = load_menu(
+        _write_menu(tmp_path, ["action1"]), _write_actions(tmp_path), defer_actions=True
+    )
+    app = MenuApp(menu)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        menu.actions._preload_thread.join(timeout=5)  # pylint: disable=protected-access
+        assert menu.actions._is_loaded
@@ -1,10 +1,15 @@
 """Tests for the MenuApp TUI application."""
 
+import asyncio
+import os
+import threading
+import time
 from unittest.mock import Mock
 
 from pymenu_cli.app import MenuApp
 from pymenu_cli.models.menu import Menu
 from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.search import SearchPage
 
 
 def _make_menu():
@@ -98,6 +103,7 @@ async def test_app_action_execution():
         panel = app.query_one(MenuListPanel)
         panel.focus()
         await pilot.press("enter")
+        await app.workers.wait_for_complete()
         await pilot.pause()
 
         menu.actions.action1.assert_called_once()
@@ -118,6 +124,164 @@ async def test_app_search_focus():
         assert inp.has_focus
 
 
+async def test_app_search_runs_in_worker_and_applies_latest_query():
+    menu = _make_menu()
+    app = MenuApp(menu, search_debounce=0.01)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        await pilot.press("slash", "d", "i", "s")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        panel = app.query_one(MenuListPanel)
+        assert panel.is_searching
+        assert [sr.item.title for sr in panel._search_results] == ["Display"]
+
+
+async def test_app_search_ignores_stale_results():
+    menu = _make_menu()
+    app = MenuApp(menu)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        app._search_query = "item"
+        app._apply_search_results("settings", SearchPage([], 0))
+        assert not app.query_one(MenuListPanel).is_searching
+
+
+async def test_app_debounces_search_without_starting_workers():
+    menu = _make_menu()
+    app = MenuApp(menu, search_debounce=0.2)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        await _wait_until(lambda: app.index_ready)
+        await pilot.press("slash", "d", "i", "s")
+        assert not [worker for worker in app.workers if worker.group == "search"]
+
+        panel = app.query_one(MenuListPanel)
+        await _wait_until(lambda: panel.is_searching)
+        assert [sr.item.title for sr in panel._search_results] == ["Display"]
+
+
+async def test_app_clearing_search_cancels_pending_search():
+    menu = _make_menu()
+    app = MenuApp(menu, search_debounce=0.5)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        await pilot.press("slash", "d", "escape")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert not app.query_one(MenuListPanel).is_searching
+
+
+async def test_app_builds_search_index_after_first_paint(monkeypatch):
+    index_delay = 1.0
+    build_global_index = MenuApp._build_global_index
+
+    def slow_build_global_index(self):
+        time.sleep(index_delay)
+        return build_global_index(self)
+
+    monkeypatch.setattr(MenuApp, "_build_global_index", slow_build_global_index)
+    menu = _make_menu()
+    app = MenuApp(menu, search_debounce=0)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        while app.time_to_first_paint is None:
+            await pilot.pause()
+        assert app.time_to_first_paint < index_delay
+        assert not app.index_ready
+
+        await pilot.press("slash", "d", "i", "s")
+        panel = app.query_one(MenuListPanel)
+        assert panel.is_searching
+        assert "Indexing…" in panel.render_line(0).text
+
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert app.index_ready
+        assert [sr.item.title for sr in panel._search_results] == ["Display"]
+
+
+async def test_app_search_paths_include_every_containing_menu():
+    actions = Mock()
+    deep = Menu("Deep Menu", i_config={"actions": actions})
+    deep.add_item(MenuItem("Hidden Gem", i_action="gem"))
+    tools = Menu("Tools Menu", i_config={"actions": actions})
+    tools.add_item(MenuItem("Deep", i_submenu=deep))
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    menu.add_item(MenuItem("Tools", i_submenu=tools))
+    app = MenuApp(menu)
+    async with app.run_test():
+        await _wait_until(lambda: app.index_ready)
+        paths = {sr.item.title: sr.path for sr in app._global_index}
+        assert paths["Tools"] == "Main Menu › Tools"
+        assert paths["Deep"] == "Main Menu › Tools Menu › Deep"
+        assert paths["Hidden Gem"] == "Main Menu › Tools Menu › Deep Menu › Hidden Gem"
+
+
+async def test_app_searches_lazy_submenus_without_building_them():
+    from pymenu_cli.pymenu import create_menu_from_data
+    from pymenu_cli.widgets.menu_list import MenuListPanel
+
+    deep = {"title": "Deep", "items": [{"title": "Hidden Gem", "action": "gem"}]}
+    tools = {"title": "Tools", "items": [{"title": "Deeper", "submenu": deep}]}
+    menu_data = {"title": "Main Menu", "items": [{"title": "Tools", "submenu": tools}]}
+    menu = create_menu_from_data(menu_data, Mock(), lazy=True)
+    tools_menu = menu.items[0].submenu
+    app = MenuApp(menu, search_debounce=0)
+    async with app.run_test() as pilot:
+        await _wait_until(lambda: app.index_ready)
+        await pilot.press("slash", *"deeper")
+        panel = app.query_one(MenuListPanel)
+        await _wait_until(lambda: panel.is_searching and panel._search_results)
+        [result] = panel._search_results
+        assert (result.title, result.path) == ("Deeper", "Main Menu › Tools › Deeper")
+        assert not tools_menu.is_loaded
+
+        panel.focus()
+        await pilot.press("enter")
+        await pilot.pause()
+        assert [m.title for m in app._menu_stack] == ["Main Menu", "Tools", "Deep"]
+        assert tools_menu.is_loaded
+        assert [sr.title for sr in app._global_index] == ["Tools", "Deeper", "Hidden Gem"]
+
+
+async def test_app_indexes_lazy_submenus_once_they_are_built():
+    from pymenu_cli.models.lazy_menu import LazyMenu
+    from pymenu_cli.widgets.menu_list import MenuListPanel
+
+    actions = Mock()
+    deep = LazyMenu("Deep", lambda: [MenuItem("Hidden Gem", i_action="gem")])
+    tools = LazyMenu(
+        "Tools",
+        lambda: [MenuItem("Display", i_action="display"), MenuItem("Deep", i_submenu=deep)],
+        i_config={"actions": actions},
+    )
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    menu.add_item(MenuItem("Tools", i_submenu=tools))
+    app = MenuApp(menu, search_debounce=0)
+    async with app.run_test() as pilot:
+        await _wait_until(lambda: app.index_ready)
+        assert not tools.is_loaded
+
+        await pilot.press("enter")
+        await _wait_until(lambda: len(app._global_index) == 3)  # pylint: disable=protected-access
+        assert not deep.is_loaded
+
+        await pilot.press("slash", "d", "i", "s")
+        panel = app.query_one(MenuListPanel)
+        await _wait_until(lambda: panel.is_searching and panel._search_results)
+        assert [sr.item.title for sr in panel._search_results] == ["Display"]
+        assert panel._search_results[0].path == "Main Menu › Tools › Display"
+
+
 async def test_app_theme_toggle():
     menu = _make_menu()
     app = MenuApp(menu)
@@ -126,3 +290,500 @@ async def test_app_theme_toggle():
         await pilot.press("t")
         await pilot.pause()
         assert app.app_theme != initial_theme
+
+
+async def test_app_sidebar_jump_follows_parent_links():
+    root = _make_menu()
+    deep = Menu("Deep")
+    deep.add_item(MenuItem("Leaf", i_action="action1"))
+    settings = root.items[1].submenu
+    settings.add_item(MenuItem("Deep", i_submenu=deep))
+    app = MenuApp(root)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.breadcrumb import BreadcrumbBar
+        from pymenu_cli.widgets.sidebar import MenuSidebar
+
+        app.post_message(MenuSidebar.SidebarItemSelected(deep))
+        await pilot.pause()
+        assert app._menu_stack == [root, settings, deep]
+        assert app._cursor_stack == [0, 0, 0]
+        assert app.current_menu is deep
+        assert "Deep" in app.query_one(BreadcrumbBar).render_path()
+
+
+class _BlockingActions:
+    """Actions whose ``slow`` blocks until released, recording what it observed."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.saw_cancel = threading.Event()
+
+    def slow(self):
+        from pymenu_cli.runner import is_cancelled
+
+        self.started.set()
+        print("working")
+        while not self.release.wait(0.01):
+            if is_cancelled():
+                self.saw_cancel.set()
+                return
+
+
+def _make_blocking_menu(actions):
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    menu.add_item(MenuItem("Slow", i_action="slow"))
+    menu.add_item(MenuItem("Other", i_action="slow"))
+    return menu
+
+
+def _output_text(app):
+    from textual.widgets import RichLog
+
+    return "\n".join(line.text for line in app.query_one(RichLog).lines)
+
+
+async def test_app_runs_actions_off_the_event_loop():
+    actions = _BlockingActions()
+    app = MenuApp(_make_blocking_menu(actions))
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        panel = app.query_one(MenuListPanel)
+        await pilot.press("enter")
+        assert await asyncio.to_thread(actions.started.wait, 5)
+        await pilot.pause()
+        assert "⏳ running" in panel.render_line(0).text
+
+        # The UI keeps handling keys while the action runs
+        await pilot.press("down")
+        assert panel.cursor_index == 1
+
+        # Output is streamed while the action is still running
+        await asyncio.sleep(0.1)
+        assert "working" in _output_text(app)
+
+        actions.release.set()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert "⚡ action" in panel.render_line(0).text
+
+        # The run is measured, recorded and summarised after its output
+        job = app._jobs.jobs[0]  # pylint: disable=protected-access
+        assert job.metrics.wall > 0
+        assert app.metrics.histogram("pymenu_action_wall_seconds", "slow").count == 1
+        assert _output_text(app).splitlines()[-1] == job.metrics.describe()
+
+
+async def test_app_cancel_action():
+    actions = _BlockingActions()
+    app = MenuApp(_make_blocking_menu(actions))
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        await pilot.press("enter")
+        assert await asyncio.to_thread(actions.started.wait, 5)
+        await pilot.press("x")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        # Output streamed before the cancellation stays, followed by the cancel note
+        assert _output_text(app).endswith("working\n✗ slow cancelled")
+        assert "⚡ action" in app.query_one(MenuListPanel).render_line(0).text
+        assert await asyncio.to_thread(actions.saw_cancel.wait, 5)
+
+
+async def test_app_coalesces_streamed_output(monkeypatch):
+    from pymenu_cli.widgets.output_panel import OutputPanel
+
+    class ChattyActions:
+        @staticmethod
+        def chatty():
+            for i in range(5000):
+                print(f"line {i}")
+                if i % 500 == 0:
+                    time.sleep(0.01)
+
+    writes = []
+    original = OutputPanel.append_output
+    monkeypatch.setattr(
+        OutputPanel,
+        "append_output",
+        lambda self, text, job_id=None: writes.append(text) or original(self, text, job_id),
+    )
+    menu = Menu("Main Menu", i_config={"actions": ChattyActions()})
+    menu.add_item(MenuItem("Chatty", i_action="chatty"))
+    app = MenuApp(menu)
+    async with app.run_test() as pilot:
+        await pilot.press("enter")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+    assert "\n".join(writes).splitlines() == [f"line {i}" for i in range(5000)]
+    assert len(writes) < 100
+
+
+async def test_app_runs_async_actions_concurrently_on_the_event_loop():
+    release = asyncio.Event()
+
+    class AsyncActions:
+        @staticmethod
+        async def first():
+            print("first started")
+            await release.wait()
+            print("first done")
+
+        @staticmethod
+        async def second():
+            print("second started")
+            await release.wait()
+            print("second done")
+
+    menu = Menu("Main Menu", i_config={"actions": AsyncActions()})
+    menu.add_item(MenuItem("First", i_action="first"))
+    menu.add_item(MenuItem("Second", i_action="second"))
+    app = MenuApp(menu)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        panel = app.query_one(MenuListPanel)
+        await pilot.press("enter", "down", "enter")
+        await asyncio.sleep(0.1)
+        assert "⏳ running" in panel.render_line(0).text
+        assert "⏳ running" in panel.render_line(1).text
+        assert app._action_pool is None  # pylint: disable=protected-access
+
+        release.set()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        lines = _output_text(app).splitlines()
+
+    assert lines.index("first started") < lines.index("first done")
+    assert lines.index("second started") < lines.index("second done")
+    assert lines.index("second started") < lines.index("first done")
+
+
+async def test_app_runs_process_actions_with_timeouts(tmp_path):
+    from pymenu_cli.pymenu import load_actions_module
+
+    actions_file = tmp_path / "actions.py"
+    actions_file.write_text(
+        "import os, time\n"
+        "def where():\n    print(f'pid {os.getpid()}')\n"
+        "def hang():\n    time.sleep(60)\n",
+        encoding="utf-8",
+    )
+    menu = Menu("Main Menu", i_config={"actions": load_actions_module(str(actions_file))})
+    menu.add_item(MenuItem("Where", i_action="where"))
+    menu.add_item(MenuItem("Hang", i_action="hang", i_timeout=0.5))
+    menu.add_item(MenuItem("Local", i_action="where", i_execution="thread"))
+    app = MenuApp(menu, execution="process", process_workers=1)
+    async with app.run_test() as pilot:
+        await pilot.press("enter")
+        await app.workers.wait_for_complete()
+        await pilot.press("down", "enter")
+        await app.workers.wait_for_complete()
+        await pilot.press("down", "enter")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        lines = _output_text(app).splitlines()
+
+    pids = [line for line in lines if line.startswith("pid ")]
+    assert pids[0] != f"pid {os.getpid()}"
+    assert pids[1] == f"pid {os.getpid()}"
+    assert any(line.startswith("TimeoutError: hang did not finish within 0.5s") for line in lines)
+
+
+class _GatedActions:
+    """Thread actions that each print their name, then wait for their own gate.
+
+    The action named by ``fail`` raises once its gate opens.
+    """
+
+    def __init__(self, *names):
+        self.gates = {name: threading.Event() for name in names}
+        self.started = []
+        self.fail = None
+
+    def __getattr__(self, name):
+        gate = self.gates[name]
+
+        def action():
+            self.started.append(name)
+            print(f"{name} output")
+            gate.wait(5)
+            if name == self.fail:
+                raise RuntimeError(f"{name} failed")
+
+        return action
+
+
+async def _wait_until(condition, timeout=5):
+    for _ in range(int(timeout / 0.02)):
+        if condition():
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("condition not met")
+
+
+async def test_app_schedules_jobs_with_a_concurrency_limit():
+    from pymenu_cli.jobs import DONE, QUEUED, RUNNING
+    from pymenu_cli.widgets.jobs_panel import JobsPanel
+    from pymenu_cli.widgets.output_panel import OutputPanel
+
+    actions = _GatedActions("a", "b", "c")
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    for name in "abc":
+        menu.add_item(MenuItem(name.upper(), i_action=name))
+    app = MenuApp(menu, max_jobs=2)
+    async with app.run_test() as pilot:
+        await pilot.press("enter", "down", "enter", "down", "enter")
+        await _wait_until(lambda: len(actions.started) == 2)
+        jobs = app._jobs.jobs  # pylint: disable=protected-access
+        assert [job.state for job in jobs] == [RUNNING, RUNNING, QUEUED]
+        assert app.query_one(JobsPanel).display
+
+        actions.gates["b"].set()
+        await _wait_until(lambda: actions.started == ["a", "b", "c"])
+        assert jobs[1].state == DONE
+        assert jobs[1].output == [(False, "b output")]
+
+        # Each job's output can be shown on its own
+        await pilot.pause()
+        app.post_message(JobsPanel.JobSelected(jobs[0].id))
+        await pilot.pause()
+        assert _output_text(app).splitlines() == ["$ a()  #1", "a output"]
+        assert app.query_one(OutputPanel).job_filter == jobs[0].id
+        app.post_message(JobsPanel.JobSelected(None))
+        await pilot.pause()
+        assert "b output" in _output_text(app)
+
+        actions.gates["a"].set()
+        actions.gates["c"].set()
+        await app.workers.wait_for_complete()
+
+
+async def test_app_cancels_queued_jobs():
+    from pymenu_cli.jobs import CANCELLED
+
+    actions = _GatedActions("a", "b")
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    menu.add_item(MenuItem("A", i_action="a"))
+    menu.add_item(MenuItem("B", i_action="b"))
+    app = MenuApp(menu, max_jobs=1)
+    async with app.run_test() as pilot:
+        await pilot.press("enter", "down", "enter")
+        await _wait_until(lambda: actions.started == ["a"])
+        await pilot.press("x")
+        await pilot.pause()
+        queued = app._jobs.jobs[1]  # pylint: disable=protected-access
+        assert queued.state == CANCELLED
+        assert "✗ b cancelled" in _output_text(app)
+
+        actions.gates["a"].set()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+    assert actions.started == ["a"]
+
+
+async def test_app_installs_output_capture_for_its_lifetime():
+    import sys
+
+    from pymenu_cli.runner import output_capture_installed
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def worker(label):
+        for i in range(3):
+            barrier.wait()
+            print(f"{label} {i}")
+
+    actions = Mock(a=lambda: worker("a"), b=lambda: worker("b"))
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    menu.add_item(MenuItem("A", i_action="a"))
+    menu.add_item(MenuItem("B", i_action="b"))
+    stdout = sys.stdout
+    app = MenuApp(menu, max_jobs=2)
+    async with app.run_test() as pilot:
+        assert output_capture_installed()
+        routed = sys.stdout
+        await pilot.press("enter", "down", "enter")
+        await _wait_until(lambda: len(app._jobs.jobs) == 2)  # pylint: disable=protected-access
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        first, second = app._jobs.jobs  # pylint: disable=protected-access
+        # The actions printed in lockstep, yet each job only has its own lines
+        assert "\n".join(text for _, text in first.output) == "a 0\na 1\na 2"
+        assert "\n".join(text for _, text in second.output) == "b 0\nb 1\nb 2"
+        assert sys.stdout is routed
+    assert sys.stdout is stdout
+    assert not output_capture_installed()
+
+
+async def test_app_replays_cached_results_until_refreshed():
+    from pymenu_cli.results import CachePolicy
+
+    calls = []
+
+    def status():
+        calls.append(None)
+        print(f"status {len(calls)}")
+
+    menu = Menu("Main Menu", i_config={"actions": Mock(status=status)})
+    menu.add_item(MenuItem("Status", i_action="status", i_cache=CachePolicy(ttl=60)))
+    app = MenuApp(menu)
+    async with app.run_test() as pilot:
+        await pilot.press("enter")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        await pilot.press("enter")
+        await pilot.pause()
+        assert len(calls) == 1
+        lines = _output_text(app).splitlines()
+        assert lines[-2].startswith("$ status()  cached (age ")
+        assert lines[-1] == "status 1"
+
+        await pilot.press("r")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert len(calls) == 2
+        await pilot.press("enter")
+        await pilot.pause()
+        assert len(calls) == 2
+        assert _output_text(app).splitlines()[-1] == "status 2"
+
+
+async def test_app_runs_command_items_and_cancels_them_with_escape():
+    import sys
+
+    from pymenu_cli.jobs import CANCELLED, FAILED
+
+    script = "import time; print('up', flush=True); time.sleep(30)"
+    menu = Menu("Main Menu", i_config={"actions": Mock()})
+    menu.add_item(MenuItem("Fail", i_command=[sys.executable, "-c", "raise SystemExit(2)"]))
+    menu.add_item(MenuItem("Sleep", i_command=[sys.executable, "-c", script]))
+    app = MenuApp(menu)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        assert "$ command" in app.query_one(MenuListPanel).render_line(0).text
+        await pilot.press("enter")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        failed = app._jobs.jobs[0]  # pylint: disable=protected-access
+        assert failed.state == FAILED
+        assert _output_text(app).splitlines()[-2].endswith("exited with code 2")
+        assert _output_text(app).splitlines()[-1].startswith("⏱ ")
+
+        await pilot.press("down", "enter")
+        await _wait_until(lambda: "up" in _output_text(app))
+        await pilot.press("escape")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        sleeper = app._jobs.jobs[1]  # pylint: disable=protected-access
+        assert sleeper.state == CANCELLED
+        assert sleeper.name.endswith("time.sleep(30)'")
+        assert _output_text(app).endswith("up\n✗ " + sleeper.name + " cancelled")
+
+
+async def test_app_runs_marked_actions_as_a_batch():
+    from pymenu_cli.jobs import DONE, FAILED, QUEUED, RUNNING
+
+    actions = _GatedActions("a", "b", "c")
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    for name in "abc":
+        menu.add_item(MenuItem(name.upper(), i_action=name))
+    app = MenuApp(menu, batch_limit=2)
+    async with app.run_test() as pilot:
+        from pymenu_cli.widgets.menu_list import MenuListPanel
+
+        await pilot.press("s")
+        assert not app._jobs.jobs  # pylint: disable=protected-access
+
+        await pilot.press("space", "down", "down", "space", "up", "space", "s")
+        await _wait_until(lambda: len(actions.started) == 2)
+        batch_jobs = app._jobs.jobs  # pylint: disable=protected-access
+        assert [job.name for job in batch_jobs] == ["a", "c", "b"]
+        assert [job.state for job in batch_jobs] == [RUNNING, RUNNING, QUEUED]
+        assert app.query_one(MenuListPanel).marked_items == []
+
+        actions.gates["c"].set()
+        await _wait_until(lambda: len(actions.started) == 3)
+        actions.fail = "b"
+        actions.gates["a"].set()
+        actions.gates["b"].set()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert [job.state for job in batch_jobs] == [DONE, DONE, FAILED]
+
+        summary = _output_text(app).splitlines()[-4:]
+        assert summary[0].startswith("Batch #1 of 3 finished in ")
+        assert summary[0].endswith(": 2 done, 1 failed")
+        assert summary[1].startswith("  #1 ✓ a  done ")
+        assert summary[3].startswith("  #3 ✗ b  failed ")
+
+
+async def test_app_runs_required_actions_first():
+    from pymenu_cli.jobs import DONE, FAILED, QUEUED, RUNNING, SKIPPED
+
+    actions = _GatedActions("build", "migrate", "deploy")
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    menu.add_item(MenuItem("Deploy", i_action="deploy", i_requires=["build", "migrate"]))
+    menu.add_item(MenuItem("Build", i_action="build"))
+    menu.add_item(MenuItem("Migrate", i_action="migrate"))
+    app = MenuApp(menu)
+    async with app.run_test() as pilot:
+        await pilot.press("enter")
+        # Independent prerequisites run in parallel
+        await _wait_until(lambda: len(actions.started) == 2)
+        build, migrate, deploy = app._jobs.jobs  # pylint: disable=protected-access
+        assert [build.state, migrate.state, deploy.state] == [RUNNING, RUNNING, QUEUED]
+        assert "… deploy waits for build, migrate" in _output_text(app)
+
+        actions.gates["build"].set()
+        actions.gates["migrate"].set()
+        await _wait_until(lambda: len(actions.started) == 3)
+        actions.gates["deploy"].set()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert [build.state, migrate.state, deploy.state] == [DONE, DONE, DONE]
+        assert actions.started == ["build", "migrate", "deploy"]
+
+        actions.started.clear()
+        actions.fail = "migrate"
+        await pilot.press("enter")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        build, migrate, deploy = app._jobs.jobs[3:]  # pylint: disable=protected-access
+        assert [build.state, migrate.state, deploy.state] == [DONE, FAILED, SKIPPED]
+        assert actions.started == ["build", "migrate"]
+        assert "↷ deploy skipped: migrate failed" in _output_text(app)
+        assert "Batch #2 of 3 finished in " in _output_text(app)
+
+
+async def test_app_runs_the_prerequisites_of_marked_actions():
+    from pymenu_cli.jobs import DONE, FAILED, SKIPPED
+
+    actions = _GatedActions("build", "migrate", "deploy", "lint")
+    menu = Menu("Main Menu", i_config={"actions": actions})
+    menu.add_item(MenuItem("Build", i_action="build"))
+    menu.add_item(MenuItem("Deploy", i_action="deploy", i_requires=["build", "migrate"]))
+    menu.add_item(MenuItem("Lint", i_action="lint"))
+    menu.add_item(MenuItem("Migrate", i_action="migrate"))
+    app = MenuApp(menu, batch_limit=4)
+    async with app.run_test() as pilot:
+        await pilot.press("space", "down", "space", "down", "space", "s")
+        await _wait_until(lambda: len(actions.started) == 3)
+        jobs = app._jobs.jobs  # pylint: disable=protected-access
+        # Build is marked and required, so it runs once
+        assert [job.name for job in jobs] == ["build", "migrate", "deploy", "lint"]
+        assert jobs[2].requires == jobs[:2]
+        assert "deploy" not in actions.started
+
+        actions.fail = "migrate"
+        for gate in actions.gates.values():
+            gate.set()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert [job.state for job in jobs] == [DONE, FAILED, SKIPPED, DONE]
+        assert "↷ deploy skipped: migrate failed" in _output_text(app)
@@ -0,0 +1,131 @@
+"""Tests for the on-disk menu snapshot cache."""
+
+import json
+import os
+from unittest.mock import patch
+
+from pymenu_cli.cache import load_snapshot, menu_file_key, save_snapshot, snapshot_path
+from pymenu_cli.models.menu import Menu
+from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.pymenu import load_menu
+from pymenu_cli.results import CachePolicy
+
+MENU_DATA = {
+    "title": "Main Menu",
+    "items": [
+        {"title": "Item 1", "action": "action1"},
+        {"title": "Settings", "submenu": {"title": "Settings", "items": [{"title": "Display"}]}},
+    ],
+}
+
+
+def _write_files(tmp_path, menu_data=None):
+    menu_file = tmp_path / "menu.json"
+    actions_file = tmp_path / "actions.py"
+    menu_file.write_text(json.dumps(menu_data or MENU_DATA), encoding="utf-8")
+    actions_file.write_text("def action1(): pass", encoding="utf-8")
+    return str(menu_file), str(actions_file)
+
+
+def test_menu_file_key_changes_with_content(tmp_path):
+    menu_file, _ = _write_files(tmp_path)
+    key = menu_file_key(menu_file)
+    assert key[0] == os.path.abspath(menu_file)
+    assert key[2] == os.path.getsize(menu_file)
+
+    _write_files(tmp_path, {"title": "Other", "items": []})
+    assert menu_file_key(menu_file) != key
+
+
+def test_snapshot_path_default_and_cache_dir(tmp_path):
+    menu_file, _ = _write_files(tmp_path)
+    assert os.path.dirname(snapshot_path(menu_file)) == str(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    assert os.path.dirname(snapshot_path(menu_file, cache_dir)) == cache_dir
+
+
+def test_snapshot_roundtrip_reattaches_actions(tmp_path):
+    menu_file, _ = _write_files(tmp_path)
+    key = menu_file_key(menu_file)
+    actions = object()
+    menu = Menu("Main", i_config={"actions": actions})
+
+    assert save_snapshot(menu, key)
+
+    new_actions = object()
+    loaded = load_snapshot(key, new_actions)
+    assert loaded.title == "Main"
+    assert loaded.actions is new_actions
+
+
+def test_snapshot_keeps_execution_options(tmp_path):
+    menu_file, _ = _write_files(tmp_path)
+    key = menu_file_key(menu_file)
+    menu = Menu("Main")
+    menu.add_item(
+        MenuItem(
+            "Build",
+            i_action="build",
+            i_execution="process",
+            i_timeout=2.5,
+            i_cache=CachePolicy(30),
+        )
+    )
+
+    assert save_snapshot(menu, key)
+
+    item = load_snapshot(key, None).items[0]
+    assert (item.action, item.execution, item.timeout) == ("build", "process", 2.5)
+    assert item.cache == CachePolicy(30)
+
+    menu = Menu("Main")
+    menu.add_item(MenuItem("List", i_command=["ls", "-l"]))
+    assert save_snapshot(menu, key)
+    assert load_snapshot(key, None).items[0].command == ("ls", "-l")
+
+    menu = Menu("Main")
+    menu.add_item(MenuItem("Deploy", i_action="deploy", i_requires=["build"]))
+    assert save_snapshot(menu, key)
+    assert load_snapshot(key, None).items[0].requires == ("build",)
+
+
+def test_load_snapshot_rejects_stale_key(tmp_path):
+    menu_file, _ = _write_files(tmp_path)
+    key = menu_file_key(menu_file)
+    save_snapshot(Menu("Main"), key)
+
+    stale = key[:3] + ("0" * 64,)
+    assert load_snapshot(stale, None) is None
+
+
+def test_load_snapshot_ignores_corrupt_file(tmp_path):
+    menu_file, _ = _write_files(tmp_path)
+    key = menu_file_key(menu_file)
+    with open(snapshot_path(menu_file), "wb") as file:
+        file.write(b"not a snapshot")
+    assert load_snapshot(key, None) is None
+
+
+def test_load_menu_reuses_snapshot(tmp_path):
+    menu_file, actions_file = _write_files(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+
+    cold = load_menu(menu_file, actions_file, cache_dir=cache_dir)
+    assert os.path.exists(snapshot_path(menu_file, cache_dir))
+
+    with patch("pymenu_cli.pymenu.create_menu_from_data") as mock_create:
+        warm = load_menu(menu_file, actions_file, cache_dir=cache_dir)
+        mock_create.assert_not_called()
+
+    assert warm.title == cold.title
+    assert warm.items[1].submenu.items[0].title == "Display"
+    assert callable(getattr(warm.items[1].submenu.actions, "action1"))
+
+
+def test_load_menu_invalidates_snapshot_on_change(tmp_path):
+    menu_file, actions_file = _write_files(tmp_path)
+    load_menu(menu_file, actions_file, use_cache=True)
+
+    _write_files(tmp_path, {"title": "Changed", "items": []})
+    menu = load_menu(menu_file, actions_file, use_cache=True)
+    assert menu.title == "Changed"
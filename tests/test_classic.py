@@ -1,5 +1,7 @@
 """Tests for the classic input()-based display mode."""
 
+import asyncio
+import sys
 from unittest.mock import Mock
 
 from pymenu_cli.classic import classic_display
@@ -74,3 +76,103 @@ def test_classic_display_invalid_input(monkeypatch):
     monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
 
     classic_display(menu)
+
+
+def test_classic_display_awaits_async_action(monkeypatch, capsys):
+    """Test that classic_display runs coroutine actions to completion."""
+
+    class Actions:
+        @staticmethod
+        async def fetch():
+            await asyncio.sleep(0)
+            print("fetched")
+
+    menu = Menu("Test Menu", i_config={"actions": Actions()})
+    menu.add_item(MenuItem("Fetch", i_action="fetch"))
+
+    user_inputs = iter(["1", "1", "B"])
+    monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
+    monkeypatch.setattr("pymenu_cli.classic._clear_screen", lambda: None)
+
+    classic_display(menu)
+
+    assert capsys.readouterr().out.count("fetched") == 2
+
+
+def test_classic_display_runs_command(monkeypatch, capfd):
+    """Test that classic_display runs command items and prints their exit code."""
+    menu = Menu("Test Menu")
+    menu.add_item(
+        MenuItem("Fail", i_command=[sys.executable, "-c", "print('ran'); raise SystemExit(3)"])
+    )
+
+    user_inputs = iter(["1", "B"])
+    monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
+    monkeypatch.setattr("pymenu_cli.classic._clear_screen", lambda: None)
+
+    classic_display(menu)
+
+    out = capfd.readouterr().out
+    assert "ran" in out
+    assert "exit code 3" in out
+
+
+def test_classic_display_measures_runs(monkeypatch, capsys):
+    """Test that classic_display prints and records what each run cost."""
+    from pymenu_cli.metrics import MetricsRegistry
+
+    actions = Mock()
+    menu = Menu("Test Menu", i_config={"actions": actions})
+    menu.add_item(MenuItem("Item 1", i_action="action1"))
+
+    user_inputs = iter(["1", "B"])
+    monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
+    monkeypatch.setattr("pymenu_cli.classic._clear_screen", lambda: None)
+    metrics = MetricsRegistry()
+
+    classic_display(menu, metrics)
+
+    assert "⏱ " in capsys.readouterr().out
+    assert metrics.histogram("pymenu_action_wall_seconds", "action1").count == 1
+
+
+def test_classic_display_runs_prerequisites_first(monkeypatch, capsys):
+    """Test that classic_display runs the actions an item requires before it, and stops
+    at the first one that fails."""
+    calls = []
+    actions = Mock()
+    actions.build.side_effect = lambda: calls.append("build")
+    actions.deploy.side_effect = lambda: calls.append("deploy")
+
+    menu = Menu("Test Menu", i_config={"actions": actions})
+    sub = Menu("Tasks", i_config={"actions": actions})
+    sub.add_item(MenuItem("Build", i_action="build"))
+    sub.add_item(MenuItem("Migrate", i_action="migrate", i_requires=["build"]))
+    menu.add_item(MenuItem("Deploy", i_action="deploy", i_requires=["migrate"]))
+    menu.add_item(MenuItem("Tasks", i_submenu=sub))
+
+    user_inputs = iter(["1", "1", "B"])
+    monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
+    monkeypatch.setattr("pymenu_cli.classic._clear_screen", lambda: None)
+    actions.migrate.side_effect = [None, RuntimeError("migration failed")]
+
+    classic_display(menu)
+    assert calls == ["build", "deploy", "build"]
+    assert "↷ deploy skipped: migrate failed" in capsys.readouterr().out
+
+
+def test_classic_display_shows_run_summary_below_redrawn_menu(monkeypatch, capsys):
+    """Test that the summary of a run survives the screen being cleared for the next prompt."""
+    menu = Menu("Test Menu")
+    menu.add_item(MenuItem("Ok", i_command=[sys.executable, "-c", "pass"]))
+
+    user_inputs = iter(["1", "B"])
+    monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
+    monkeypatch.setattr("pymenu_cli.classic._clear_screen", lambda: print("<clear>"))
+
+    classic_display(menu)
+
+    screens = capsys.readouterr().out.split("<clear>")
+    assert len(screens) == 3
+    last = screens[-1]
+    assert last.index("X. Exit") < last.index("exit code 0") < last.index("⏱ ")
@@ -0,0 +1,79 @@
+"""Tests for the dependencies between actions."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from pymenu_cli.dag import action_items, find_cycle, prerequisites, resolve_prerequisites
+from pymenu_cli.models.lazy_menu import LazyMenu
+from pymenu_cli.models.menu import Menu
+from pymenu_cli.models.menu_item import MenuItem
+
+
+def test_find_cycle():
+    assert find_cycle({}) is None
+    assert find_cycle({"deploy": ["build", "migrate"], "migrate": ["build"]}) is None
+    assert find_cycle({"a": ["a"]}) == ["a", "a"]
+    cycle = find_cycle({"deploy": ["build"], "build": ["test"], "test": ["build"]})
+    assert cycle == ["build", "test", "build"]
+
+
+def test_prerequisites_come_after_their_own_prerequisites():
+    graph = {"deploy": ["migrate", "build"], "migrate": ["build"], "build": ["fetch"]}
+    assert prerequisites(graph, "deploy") == ["fetch", "build", "migrate"]
+    assert prerequisites(graph, "build") == ["fetch"]
+    assert prerequisites(graph, "fetch") == []
+    # Names missing from the graph have no prerequisites of their own
+    assert prerequisites({"deploy": ["unknown"]}, "deploy") == ["unknown"]
+
+
+def test_action_items_walks_submenus():
+    actions, sub_actions = Mock(), Mock()
+    root = Menu("Main", i_config={"actions": actions})
+    sub = Menu("Sub", i_config={"actions": sub_actions})
+    sub.add_item(MenuItem("Build", i_action="build"))
+    sub.add_item(MenuItem("Deploy", i_action="deploy"))
+    root.add_item(MenuItem("Deploy", i_action="deploy"))
+    root.add_item(MenuItem("Sub", i_submenu=sub))
+    root.add_item(MenuItem("List", i_command=["ls"]))
+
+    items = action_items(root)
+    assert sorted(items) == ["build", "deploy"]
+    assert items["deploy"] == (root.items[0], actions)
+    assert items["build"] == (sub.items[0], sub_actions)
+
+
+def _lazy_tree(actions):
+    root = Menu("Main", i_config={"actions": actions})
+    root.add_item(MenuItem("Deploy", i_action="deploy", i_requires=["migrate"]))
+    root.add_item(MenuItem("Migrate", i_action="migrate", i_requires=["build"]))
+    tools = LazyMenu(
+        "Tools",
+        lambda: [MenuItem("Build", i_action="build"), MenuItem("Lint", i_action="lint")],
+        i_config={"actions": actions},
+    )
+    other = LazyMenu("Other", lambda: [MenuItem("Docs", i_action="docs")])
+    root.add_item(MenuItem("Other", i_submenu=other))
+    root.add_item(MenuItem("Tools", i_submenu=tools))
+    return root, tools, other
+
+
+def test_action_items_stops_once_the_names_are_found():
+    root, tools, other = _lazy_tree(Mock())
+    assert sorted(action_items(root, ["deploy", "migrate"])) == ["deploy", "migrate"]
+    assert not tools.is_loaded and not other.is_loaded
+    assert "lint" in action_items(root, ["build"])
+    assert tools.is_loaded and not other.is_loaded
+
+
+def test_resolve_prerequisites_builds_only_the_menus_it_needs():
+    actions = Mock()
+    root, tools, other = _lazy_tree(actions)
+    known = {}
+    required = resolve_prerequisites(root, "deploy", ["migrate"], known)
+    assert required == [(tools.items[0], actions), (root.items[1], actions)]
+    assert not other.is_loaded
+    assert known["build"] == (tools.items[0], actions)
+
+    with pytest.raises(ValueError, match="deploy requires actions not in the menu: publish"):
+        resolve_prerequisites(root, "deploy", ["publish"], known)
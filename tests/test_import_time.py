@@ -0,0 +1,80 @@
+"""Import-time regression tests for headless and classic use."""
+
+import subprocess
+import sys
+
+import pytest
+
+TUI_MODULES = ("textual", "rich", "pyfiglet")
+
+
+def _import_profile(statement):
+    """Run a statement under ``-X importtime``.
+
+    Returns:
+        A dict mapping every imported module name to its cumulative time (us),
+        and the summed cumulative time of the top-level imports made by the
+        statement (interpreter startup imports are excluded).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    total = 0
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        modules[name.strip()] = int(cumulative)
+        if started and not name.startswith("  "):
+            total += int(cumulative)
+        # Everything imported at startup is logged before the statement runs
+        started = started or name.strip() == "site"
+    return modules, total
+
+
+@pytest.fixture(name="tui_import_time", scope="module")
+def fixture_tui_import_time():
+    """The cumulative import time of Textual's App (us), measured on this machine and run."""
+    _, total = _import_profile("import textual.app")
+    return total
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from pymenu_cli import load_menu",
+        "import pymenu_cli; pymenu_cli.Menu; pymenu_cli.MenuItem",
+        "from pymenu_cli.pymenu import load_menu; from pymenu_cli.classic import classic_display",
+    ],
+)
+def test_headless_import_skips_tui(statement, tui_import_time):
+    modules, total = _import_profile(statement)
+
+    tui = [name for name in modules if name.split(".")[0] in TUI_MODULES]
+    assert not tui, f"headless import pulled in {sorted(tui)[:5]}"
+    # Relative to a baseline from the same run, so that a slow machine does not fail it
+    assert total < tui_import_time
+
+
+def test_menu_app_is_imported_on_access():
+    modules, _ = _import_profile("import pymenu_cli; pymenu_cli.MenuApp")
+    assert "textual" in modules
+
+
+def test_lazy_exports():
+    import pymenu_cli
+    from pymenu_cli.app import MenuApp
+    from pymenu_cli.pymenu import load_menu
+
+    assert pymenu_cli.load_menu is load_menu
+    assert pymenu_cli.MenuApp is MenuApp
+    assert set(pymenu_cli.__all__) <= set(dir(pymenu_cli))
+    with pytest.raises(AttributeError):
+        pymenu_cli.missing_name  # pylint: disable=pointless-statement
@@ -0,0 +1,123 @@
+"""Tests for the job scheduler."""
+
+import pytest
+
+from pymenu_cli.jobs import CANCELLED, DONE, FAILED, QUEUED, RUNNING, SKIPPED, JobScheduler
+from pymenu_cli.models.menu_item import MenuItem
+
+
+def _items(count):
+    return [MenuItem(f"Item {i}", i_action=f"action{i}") for i in range(count)]
+
+
+def test_scheduler_limits_running_jobs_and_starts_queued_jobs_in_order():
+    scheduler = JobScheduler(limit=2)
+    jobs = [scheduler.submit(item, None) for item in _items(4)]
+    assert [job.id for job in jobs] == [1, 2, 3, 4]
+    assert all(job.state == QUEUED for job in jobs)
+
+    assert scheduler.start_ready() == jobs[:2]
+    assert scheduler.start_ready() == []
+    assert scheduler.queued == jobs[2:]
+    assert jobs[0].state == RUNNING and jobs[0].duration() is not None
+    assert jobs[2].duration() is None
+
+    scheduler.finish(jobs[1], FAILED)
+    assert scheduler.start_ready() == [jobs[2]]
+    scheduler.finish(jobs[0])
+    assert scheduler.start_ready() == [jobs[3]]
+    assert jobs[0].state == DONE
+    assert jobs[0].duration() == jobs[0].finished_at - jobs[0].started_at
+
+
+def test_scheduler_cancels_queued_jobs():
+    scheduler = JobScheduler(limit=1)
+    first, second, third = (scheduler.submit(item, None) for item in _items(3))
+    scheduler.start_ready()
+    scheduler.finish(second, CANCELLED)
+    assert second.state == CANCELLED
+    assert scheduler.queued == [third]
+
+    scheduler.finish(first)
+    assert scheduler.start_ready() == [third]
+    # Finishing a job twice has no effect
+    scheduler.finish(second, DONE)
+    assert second.state == CANCELLED
+
+
+def test_scheduler_active_jobs_per_item():
+    scheduler = JobScheduler(limit=1)
+    item, other = _items(2)
+    first = scheduler.submit(item, None)
+    scheduler.submit(other, None)
+    second = scheduler.submit(item, None)
+    scheduler.start_ready()
+    assert scheduler.active_for(item) == [first, second]
+    scheduler.finish(first)
+    assert scheduler.active_for(item) == [second]
+    assert scheduler.get(first.id) is first
+    assert scheduler.get(99) is None
+
+
+def test_scheduler_keeps_a_bounded_history():
+    scheduler = JobScheduler(limit=10, history=2)
+    jobs = [scheduler.submit(item, None) for item in _items(4)]
+    scheduler.start_ready()
+    for job in jobs[:3]:
+        scheduler.finish(job)
+    assert scheduler.jobs == [jobs[1], jobs[2], jobs[3]]
+
+
+def test_scheduler_limits_running_jobs_per_batch():
+    scheduler = JobScheduler(limit=3)
+    items = _items(4)
+    batch = scheduler.submit_batch([(item, None) for item in items[:3]], limit=1)
+    single = scheduler.submit(items[3], None)
+    assert [job.batch for job in batch.jobs] == [batch] * 3
+
+    # A batch at its limit does not hold up jobs queued behind it
+    assert scheduler.start_ready() == [batch.jobs[0], single]
+    assert scheduler.queued == batch.jobs[1:]
+    assert not batch.is_done and batch.duration() is None
+
+    scheduler.finish(batch.jobs[0])
+    assert scheduler.start_ready() == [batch.jobs[1]]
+    scheduler.finish(batch.jobs[1], FAILED)
+    scheduler.finish(batch.jobs[2], CANCELLED)
+    assert batch.is_done
+    assert batch.duration() == batch.jobs[2].finished_at - batch.jobs[0].started_at
+
+
+def test_scheduler_holds_jobs_until_their_requirements_are_done():
+    scheduler = JobScheduler(limit=4)
+    build, migrate, deploy, other = (scheduler.submit(item, None) for item in _items(4))
+    migrate.requires = [build]
+    deploy.requires = [build, migrate]
+
+    assert scheduler.start_ready() == [build, other]
+    assert scheduler.finish(build) == []
+    assert scheduler.start_ready() == [migrate]
+    scheduler.finish(migrate)
+    assert scheduler.start_ready() == [deploy]
+
+
+def test_scheduler_skips_jobs_whose_requirements_fail():
+    scheduler = JobScheduler(limit=4)
+    build, migrate, deploy, other = (scheduler.submit(item, None) for item in _items(4))
+    migrate.requires = [build]
+    deploy.requires = [migrate]
+    scheduler.start_ready()
+
+    # Dependents are skipped, directly or not, and jobs that do not depend run on
+    assert scheduler.finish(build, FAILED) == [migrate, deploy]
+    assert (migrate.state, deploy.state) == (SKIPPED, SKIPPED)
+    assert deploy.finished_at is not None and deploy.duration() is None
+    assert scheduler.queued == []
+    assert other.state == RUNNING
+
+
+def test_scheduler_rejects_invalid_limit():
+    with pytest.raises(ValueError):
+        JobScheduler(limit=0)
+    with pytest.raises(ValueError):
+        JobScheduler().submit_batch([], limit=0)
@@ -0,0 +1,62 @@
+"""Tests for the JobsPanel widget."""
+
+from textual.app import App, ComposeResult
+from textual.widgets import OptionList
+
+from pymenu_cli.jobs import FAILED, JobScheduler
+from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.widgets.jobs_panel import JobsPanel
+
+
+class JobsTestApp(App):
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+        self.selected = []
+
+    def compose(self) -> ComposeResult:
+        yield JobsPanel(self.scheduler)
+
+    def on_jobs_panel_job_selected(self, event):
+        self.selected.append(event.job_id)
+
+
+def test_render_job_shows_state_and_duration():
+    scheduler = JobScheduler(limit=1)
+    running = scheduler.submit(MenuItem("Build", i_action="build"), None)
+    queued = scheduler.submit(MenuItem("Test", i_action="test"), None)
+    scheduler.start_ready()
+    assert JobsPanel.render_job(queued).plain == "#2 … test  queued"
+    scheduler.finish(running, FAILED)
+    running.finished_at = running.started_at + 1.25
+    assert JobsPanel.render_job(running).plain == "#1 ✗ build  failed 1.2s"
+
+
+async def test_jobs_panel_lists_newest_first_and_selects_jobs():
+    scheduler = JobScheduler()
+    app = JobsTestApp(scheduler)
+    async with app.run_test() as pilot:
+        panel = app.query_one(JobsPanel)
+        panel.refresh_jobs()
+        assert not panel.display
+
+        for name in ("one", "two"):
+            scheduler.submit(MenuItem(name, i_action=name), None)
+        panel.refresh_jobs()
+        assert panel.display
+        option_list = app.query_one(OptionList)
+        assert [str(option.prompt).split()[-2] for option in option_list.options] == [
+            "two",
+            "one",
+        ]
+
+        option_list.focus()
+        await pilot.press("down", "enter")
+        await pilot.pause()
+        assert panel.highlighted_job == 1
+        panel.refresh_jobs()
+        assert panel.highlighted_job == 1
+
+        await pilot.press("escape")
+        await pilot.pause()
+        assert app.selected == [1, None]
@@ -0,0 +1,100 @@
+"""Tests for the LazyMenu class and lazy menu building."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from pymenu_cli.classic import classic_display
+from pymenu_cli.models.lazy_menu import LazyMenu
+from pymenu_cli.models.menu import Menu
+from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.pymenu import create_menu_from_data
+
+MENU_DATA = {
+    "title": "Main Menu",
+    "items": [
+        {"title": "Item 1", "action": "action1"},
+        {
+            "title": "Settings",
+            "submenu": {
+                "title": "Settings",
+                "color": {"text": "red"},
+                "items": [
+                    {"title": "Display", "action": "action2"},
+                    {"title": "Advanced", "submenu": {"title": "Advanced", "items": []}},
+                ],
+            },
+        },
+    ],
+}
+
+
+def test_lazy_menu_builds_items_once():
+    loader = Mock(return_value=[MenuItem("Item 1")])
+    menu = LazyMenu("Lazy", loader)
+
+    assert not menu.is_loaded
+    loader.assert_not_called()
+
+    assert menu.items[0].title == "Item 1"
+    assert menu.items[0].title == "Item 1"
+    assert menu.is_loaded
+    loader.assert_called_once()
+
+
+def test_lazy_menu_calls_load_listeners_once_built():
+    menu = LazyMenu("Lazy", lambda: [MenuItem("Item 1")])
+    listener = Mock(side_effect=lambda loaded: loaded.items)
+    assert menu.add_load_listener(listener)
+    listener.assert_not_called()
+
+    assert menu.items[0].title == "Item 1"
+    menu.items  # pylint: disable=pointless-statement
+    listener.assert_called_once_with(menu)
+    assert not menu.add_load_listener(listener)
+
+
+def test_lazy_menu_add_item_appends_after_loaded_items():
+    menu = LazyMenu("Lazy", lambda: [MenuItem("Loaded")])
+    menu.add_item(MenuItem("Added"))
+    assert [item.title for item in menu.items] == ["Loaded", "Added"]
+
+
+def test_create_menu_from_data_lazy_defers_submenus():
+    actions = Mock()
+    menu = create_menu_from_data(MENU_DATA, actions, lazy=True)
+
+    settings = menu.items[1].submenu
+    assert isinstance(settings, LazyMenu)
+    assert isinstance(settings, Menu)
+    assert settings.title == "Settings"
+    assert settings.color == {"text": "red"}
+    assert settings.actions is actions
+    assert not settings.is_loaded
+
+    assert settings.items[0].action == "action2"
+    advanced = settings.items[1].submenu
+    assert settings.is_loaded
+    assert not advanced.is_loaded
+    assert menu.items[1].submenu is settings
+
+
+def test_create_menu_from_data_lazy_validates_unbuilt_submenus():
+    submenu = {"title": "Deep", "items": [{"title": "Bad", "action": "bad", "timeout": -1}]}
+    menu_data = {"title": "Main Menu", "items": [{"title": "Deep", "submenu": submenu}]}
+    with pytest.raises(ValueError, match="Invalid timeout for 'Bad'"):
+        create_menu_from_data(menu_data, Mock(), lazy=True)
+
+
+def test_lazy_menu_classic_display(monkeypatch):
+    actions = Mock()
+    menu = create_menu_from_data(MENU_DATA, actions, lazy=True)
+
+    user_inputs = iter(["2", "1", "B", "B"])
+    monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
+    monkeypatch.setattr("pymenu_cli.classic._clear_screen", lambda: None)
+
+    classic_display(menu)
+
+    actions.action2.assert_called_once()
+    assert not menu.items[1].submenu.items[1].submenu.is_loaded
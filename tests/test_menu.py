@@ -108,3 +108,76 @@ def test_menu_print_banner(capsys):
     with patch("pymenu_cli.classic._print_banner") as mock_print_banner:
         menu.print_banner()
         mock_print_banner.assert_called_once_with({"title": "Banner Text", "font": "standard"})
+
+
+def _make_tree():
+    leaf_menu = Menu("Settings")
+    leaf_menu.add_item(MenuItem("General", i_action="general"))
+    tools = Menu("Tools", i_config={"items": [MenuItem("Settings", i_submenu=leaf_menu)]})
+    root = Menu("Main")
+    root.add_item(MenuItem("Tools", i_submenu=tools))
+    return root, tools, leaf_menu
+
+
+def test_menu_parent_links():
+    """
+    Test that adding an item with a submenu, in the config or later, sets its parent.
+    """
+    root, tools, settings = _make_tree()
+    assert root.parent is None
+    assert tools.parent is root
+    assert settings.parent is tools
+    assert settings.ancestors() == [root, tools, settings]
+    assert root.ancestors() == [root]
+
+
+def test_menu_find():
+    """
+    Test that items are found by their title path, as a string or a sequence.
+    """
+    root, tools, settings = _make_tree()
+    assert root.find("Tools/Settings/General") is settings.items[0]
+    assert root.find(["Tools", "Settings"]).submenu is settings
+    assert tools.find("Settings/General") is settings.items[0]
+    assert root.find("Tools/Missing") is None
+    assert root.find("Tools/Settings/General/Deeper") is None
+
+
+def test_menu_parent_links_from_data():
+    """
+    Test that menus built from data, eagerly or lazily, link back to their parents.
+    """
+    from pymenu_cli.pymenu import create_menu_from_data
+
+    data = {
+        "title": "Main",
+        "items": [
+            {
+                "title": "Tools",
+                "submenu": {
+                    "title": "Tools",
+                    "items": [{"title": "Sub", "submenu": {"title": "Sub", "items": []}}],
+                },
+            }
+        ],
+    }
+    for lazy in (False, True):
+        root = create_menu_from_data(data, Mock(), lazy=lazy)
+        sub = root.find("Tools/Sub").submenu
+        assert [menu.title for menu in sub.ancestors()] == ["Main", "Tools", "Sub"]
+
+
+def test_menu_display_writes_metrics_file_on_exit(tmp_path, monkeypatch):
+    """Test that display writes the run metrics in OpenMetrics format when it exits."""
+    menu = Menu("Test Menu", i_config={"actions": Mock()})
+    menu.add_item(MenuItem("Item 1", i_action="action1"))
+    user_inputs = iter(["1", "X"])
+    monkeypatch.setattr("builtins.input", lambda _: next(user_inputs))
+    metrics_file = tmp_path / "metrics.txt"
+
+    with pytest.raises(SystemExit):
+        menu.display(classic=True, metrics_file=str(metrics_file))
+
+    text = metrics_file.read_text(encoding="utf-8")
+    assert 'pymenu_action_wall_seconds_count{action="action1"} 1' in text
+    assert text.endswith("# EOF\n")
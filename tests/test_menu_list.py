@@ -6,6 +6,7 @@ from textual.app import App, ComposeResult
 
 from pymenu_cli.models.menu import Menu
 from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.search import SearchResult
 from pymenu_cli.widgets.menu_list import MenuListPanel
 
 
@@ -66,3 +67,109 @@ async def test_menu_list_filter():
         panel.filter_items("Sub")
         await pilot.pause()
         assert panel.visible_item_count == 1
+
+
+async def test_menu_list_search_results_show_hidden_count():
+    menu = _make_menu()
+    app = MenuListTestApp(menu)
+    async with app.run_test() as pilot:
+        panel = app.query_one(MenuListPanel)
+        item = menu.items[0]
+        panel.set_search_results([SearchResult(item, "Test Menu › Item 1", menu)], total=42)
+        await pilot.pause()
+        assert panel.visible_item_count == 1
+        assert "41 more matches" in panel.render_line(1).text
+        panel.set_search_results([SearchResult(item, "Test Menu › Item 1", menu)], 42, exact=False)
+        await pilot.pause()
+        assert "at least 41 more matches" in panel.render_line(1).text
+
+
+def _make_long_menu(count=1000):
+    menu = Menu("Long Menu", i_config={"actions": Mock()})
+    for i in range(count):
+        menu.add_item(MenuItem(f"Item {i}", i_action="action1"))
+    return menu
+
+
+async def test_menu_list_renders_only_viewport_rows():
+    menu = _make_long_menu()
+    app = MenuListTestApp(menu)
+    async with app.run_test(size=(80, 24)) as pilot:
+        panel = app.query_one(MenuListPanel)
+        panel.render_counters.reset()
+        panel.set_menu(_make_long_menu(5000))
+        await pilot.pause()
+        assert 0 < panel.render_counters.lines <= panel.page_size
+        assert panel.render_counters.formats == panel.render_counters.lines
+
+
+async def test_menu_list_cursor_move_repaints_two_cached_rows():
+    menu = _make_long_menu()
+    app = MenuListTestApp(menu)
+    async with app.run_test(size=(80, 24)) as pilot:
+        panel = app.query_one(MenuListPanel)
+        panel.focus()
+        await pilot.pause()
+
+        panel.render_counters.reset()
+        await pilot.press("down")
+        await pilot.pause()
+        assert panel.render_counters.lines == 2
+        assert panel.render_counters.formats == 2
+        assert panel.render_line(1).text.startswith("❯ Item 1")
+
+        panel.render_counters.reset()
+        await pilot.press("up")
+        await pilot.pause()
+        assert panel.render_counters.lines == 2
+        assert panel.render_counters.formats == 0
+        assert panel.render_line(0).text.startswith("❯ Item 0")
+
+
+async def test_menu_list_scrolls_with_cursor():
+    menu = _make_long_menu()
+    app = MenuListTestApp(menu)
+    async with app.run_test(size=(80, 24)) as pilot:
+        panel = app.query_one(MenuListPanel)
+        panel.focus()
+        page = panel.page_size
+
+        await pilot.press("pagedown")
+        assert panel.cursor_index == page
+        assert panel.scroll_offset.y == 1
+        await pilot.press("end")
+        assert panel.cursor_index == 999
+        assert panel.scroll_offset.y == 1000 - page
+        assert panel.render_line(page - 1).text.startswith("❯ Item 999")
+        await pilot.press("pageup")
+        assert panel.cursor_index == 999 - page
+        await pilot.press("home")
+        assert panel.cursor_index == 0
+        assert panel.scroll_offset.y == 0
+        await pilot.press("up")
+        assert panel.cursor_index == 0
+
+
+async def test_menu_list_space_marks_runnable_items():
+    menu = _make_menu()
+    app = MenuListTestApp(menu)
+    async with app.run_test() as pilot:
+        panel = app.query_one(MenuListPanel)
+        panel.focus()
+        await pilot.press("space", "down", "down", "space", "up", "space")
+        await pilot.pause()
+        # The submenu cannot be marked
+        assert [item.title for item, _ in panel.marked_items] == ["Item 1", "Item 2"]
+        assert all(owner is menu for _, owner in panel.marked_items)
+        assert "◉ Item 1" in panel.render_line(0).text
+        assert "◉" not in panel.render_line(2).text
+
+        await pilot.press("space")
+        assert [item.title for item, _ in panel.marked_items] == ["Item 1"]
+
+        # Marks are kept when the menu changes, and cleared on demand
+        panel.set_menu(Menu("Other"))
+        panel.set_menu(menu)
+        assert len(panel.marked_items) == 1
+        panel.clear_marks()
+        assert panel.marked_items == []
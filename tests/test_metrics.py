@@ -0,0 +1,66 @@
+"""Tests for action run metrics."""
+
+import time
+
+from pymenu_cli.metrics import Histogram, Measurement, MetricsRegistry, RunMetrics, measure
+
+
+def test_histogram_counts_values_into_cumulative_buckets():
+    histogram = Histogram([1.0, 2.0])
+    for value in (0.5, 1.0, 1.5, 3.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [(1.0, 2), (2.0, 3), (float("inf"), 4)]
+    assert (histogram.count, histogram.sum) == (4, 6.0)
+
+
+def test_measure_records_wall_and_cpu_time():
+    with measure() as measurement:
+        deadline = time.process_time() + 0.02
+        while time.process_time() < deadline:
+            pass
+    metrics = measurement.result
+    assert metrics.wall >= 0.02
+    assert metrics.cpu >= 0.02
+    assert metrics.rss_delta is None or metrics.rss_delta >= 0
+
+
+def test_measurement_without_process_wide_figures_only_reports_given_ones():
+    metrics = Measurement(process_wide=False).stop()
+    assert (metrics.cpu, metrics.rss_delta) == (None, None)
+    metrics = Measurement(process_wide=False).stop(0.25, 4096)
+    assert (metrics.cpu, metrics.rss_delta) == (0.25, 4096)
+
+
+def test_run_metrics_describe():
+    assert (
+        RunMetrics(1.234, 0.5, 3 << 20).describe() == "⏱ 1.23s wall · 0.50s CPU · +3.0 MiB peak RSS"
+    )
+    assert RunMetrics(0.1, 0.0, None).describe() == "⏱ 0.10s wall · 0.00s CPU"
+    assert RunMetrics(0.1, None, 0).describe() == "⏱ 0.10s wall · +0 B peak RSS"
+
+
+def test_registry_renders_openmetrics():
+    registry = MetricsRegistry()
+    registry.record("build", RunMetrics(0.2, 0.1, 2048))
+    registry.record("build", RunMetrics(20.0, 0.1, None))
+    registry.record('say "hi"', RunMetrics(0.001, 0.0, 0))
+    registry.record("fetch", RunMetrics(0.1, None, None))
+    assert registry.histogram("pymenu_action_wall_seconds", "build").count == 2
+    assert registry.histogram("pymenu_action_peak_rss_delta_bytes", "build").count == 1
+
+    lines = registry.to_openmetrics().splitlines()
+    assert lines[:3] == [
+        "# TYPE pymenu_action_wall_seconds histogram",
+        "# UNIT pymenu_action_wall_seconds seconds",
+        "# HELP pymenu_action_wall_seconds Wall-clock time of action runs.",
+    ]
+    assert 'pymenu_action_wall_seconds_bucket{action="build",le="0.25"} 1' in lines
+    assert 'pymenu_action_wall_seconds_bucket{action="build",le="30.0"} 2' in lines
+    assert 'pymenu_action_wall_seconds_bucket{action="build",le="+Inf"} 2' in lines
+    assert 'pymenu_action_wall_seconds_count{action="build"} 2' in lines
+    assert 'pymenu_action_wall_seconds_sum{action="build"} 20.2' in lines
+    assert 'pymenu_action_cpu_seconds_count{action="say \\"hi\\""} 1' in lines
+    assert 'pymenu_action_wall_seconds_count{action="fetch"} 1' in lines
+    assert registry.histogram("pymenu_action_cpu_seconds", "fetch") is None
+    assert 'pymenu_action_peak_rss_delta_bytes_bucket{action="build",le="4096.0"} 1' in lines
+    assert lines[-1] == "# EOF"
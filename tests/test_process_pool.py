@@ -0,0 +1,198 @@
+"""Tests for running actions in warm worker processes."""
+
+import io
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pymenu_cli.actions import DeferredActions
+from pymenu_cli.process_pool import ProcessPool, actions_file
+from pymenu_cli.runner import OutputSink, call_process_action
+
+ACTIONS_SOURCE = """
+import asyncio
+import os
+import sys
+import time
+
+with open(IMPORTS_FILE, "a") as marker:
+    marker.write("imported\\n")
+print("module body output")
+
+def pid():
+    print(os.getpid())
+
+def noisy():
+    print("out 1")
+    print("err 1", file=sys.stderr)
+    print("tail", end="")
+
+def hang():
+    print("hanging")
+    sys.stdout.flush()
+    time.sleep(60)
+
+def crash():
+    os._exit(3)
+
+def fail():
+    raise ValueError("boom")
+
+def burn():
+    deadline = time.process_time() + 0.1
+    while time.process_time() < deadline:
+        pass
+
+def grow():
+    data = bytearray(64 << 20)
+    data[::4096] = b"x" * len(data[::4096])
+
+async def fetch():
+    await asyncio.sleep(0)
+    print("fetched")
+"""
+
+
+@pytest.fixture(name="pool")
+def fixture_pool(tmp_path):
+    imports = tmp_path / "imports.txt"
+    imports.touch()
+    actions_path = tmp_path / "actions.py"
+    # Workers fork from a server process, so they do not see later environment changes
+    actions_path.write_text(f"IMPORTS_FILE = {str(imports)!r}\n{ACTIONS_SOURCE}", encoding="utf-8")
+    pool = ProcessPool(str(actions_path), workers=1)
+    pool.imports = imports
+    yield pool
+    pool.shutdown()
+
+
+def _run(pool, name, **kwargs):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    run = pool.run(name, stdout, stderr, **kwargs)
+    return stdout.getvalue(), stderr.getvalue(), run.error
+
+
+def test_actions_file(tmp_path):
+    actions_path = tmp_path / "actions.py"
+    actions_path.write_text("def run():\n    pass\n", encoding="utf-8")
+    assert actions_file(DeferredActions(str(actions_path))) == str(actions_path)
+    assert actions_file(SimpleNamespace(__file__="/x/actions.py")) == "/x/actions.py"
+    # A module that did ``from os import path`` is not mistaken for a DeferredActions
+    module = SimpleNamespace(__file__="/x/actions.py", path=os.path, _path="/y/other.py")
+    assert actions_file(module) == "/x/actions.py"
+    assert actions_file(SimpleNamespace()) is None
+
+
+def test_run_captures_output_in_a_worker_process(pool):
+    stdout, _, error = _run(pool, "pid")
+    assert error is None
+    assert int(stdout) != os.getpid()
+
+    assert _run(pool, "noisy") == ("out 1\ntail", "err 1\n", None)
+    assert "ValueError: boom" in _run(pool, "fail")[2]
+    assert _run(pool, "fetch") == ("fetched\n", "", None)
+
+
+def test_workers_report_the_cpu_time_and_peak_rss_growth_of_their_actions(pool):
+    run = pool.run("burn", io.StringIO(), io.StringIO())
+    assert run.error is None
+    assert 0.1 <= run.cpu_time < 1
+    run = pool.run("grow", io.StringIO(), io.StringIO())
+    assert run.error is None
+    if run.rss_delta is not None:
+        assert run.rss_delta >= 32 << 20
+    # A killed worker has nothing to report
+    run = pool.run("hang", io.StringIO(), io.StringIO(), timeout=0.2)
+    assert (run.cpu_time, run.rss_delta) == (None, None)
+
+
+def test_workers_import_the_actions_module_once(pool):
+    first = _run(pool, "pid")[0]
+    for _ in range(3):
+        assert _run(pool, "pid")[0] == first
+    assert pool.imports.read_text().splitlines() == ["imported"]
+
+
+def test_timeout_kills_and_replaces_the_worker(pool):
+    first = _run(pool, "pid")[0]
+    stdout, _, error = _run(pool, "hang", timeout=0.5)
+    assert stdout == "hanging\n"
+    assert error.startswith("TimeoutError: hang did not finish within 0.5s")
+
+    replacement = _run(pool, "pid")[0]
+    assert replacement != first
+
+
+def test_timeout_does_not_count_the_actions_module_import(tmp_path):
+    actions_path = tmp_path / "slow_actions.py"
+    actions_path.write_text(
+        "import time\ntime.sleep(1)\n\ndef quick():\n    print('quick')\n", encoding="utf-8"
+    )
+    pool = ProcessPool(str(actions_path), workers=1)
+    try:
+        assert _run(pool, "quick", timeout=0.5) == ("quick\n", "", None)
+    finally:
+        pool.shutdown()
+
+
+def test_crashed_worker_is_replaced(pool):
+    error = _run(pool, "crash")[2]
+    assert "exit code 3" in error
+    assert _run(pool, "noisy")[2] is None
+
+
+def test_cancel_kills_the_worker(pool):
+    cancel_event = threading.Event()
+    sink = OutputSink(cancel_event.set)
+    result = call_process_action(pool, "hang", cancel_event, sink)
+    assert result.error is None
+    assert sink.drain() == [(False, "hanging")]
+    assert _run(pool, "noisy")[2] is None
+
+
+def test_shutdown_stops_the_pool(pool):
+    _run(pool, "pid")
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        _run(pool, "pid")
+
+
+def test_runs_waiting_for_a_worker_can_be_cancelled(pool):
+    pool.start()
+    busy = threading.Thread(target=_run, args=(pool, "hang"), kwargs={"timeout": 5})
+    busy.start()
+    time.sleep(0.2)
+    cancel_event = threading.Event()
+    threading.Timer(0.2, cancel_event.set).start()
+    started = time.monotonic()
+    assert _run(pool, "pid", cancel_event=cancel_event) == ("", "", None)
+    assert time.monotonic() - started < 2
+    pool.shutdown()
+    busy.join(5)
+    assert not busy.is_alive()
+
+
+def test_shutdown_wakes_runs_waiting_for_a_worker(pool):
+    errors = []
+
+    def wait_for_worker():
+        try:
+            _run(pool, "pid")
+        except RuntimeError as error:
+            errors.append(error)
+
+    pool.start()
+    busy = threading.Thread(target=_run, args=(pool, "hang"), kwargs={"timeout": 5})
+    busy.start()
+    waiting = [threading.Thread(target=wait_for_worker) for _ in range(2)]
+    for thread in waiting:
+        thread.start()
+    time.sleep(0.2)
+    pool.shutdown()
+    for thread in waiting + [busy]:
+        thread.join(2)
+        assert not thread.is_alive()
+    assert len(errors) == 2
@@ -9,6 +9,27 @@ import pytest
 
 from pymenu_cli.models.menu import Menu
 from pymenu_cli.pymenu import create_menu_from_data, load_actions_module, load_menu, main
+from pymenu_cli.results import CachePolicy
+
+
+def _cli_args(**kwargs):
+    """Build a parsed-arguments stand-in with the CLI defaults, overridden by kwargs."""
+    args = {
+        "classic": False,
+        "theme": "dark",
+        "cache": False,
+        "cache_dir": None,
+        "lazy": False,
+        "streaming": False,
+        "defer_actions": False,
+        "execution": "thread",
+        "action_timeout": None,
+        "max_jobs": 4,
+        "batch_limit": None,
+        "metrics_file": None,
+    }
+    args.update(kwargs)
+    return Mock(**args)
 
 
 # Tests for load_menu function
@@ -82,6 +103,102 @@ def test_create_menu_from_data():
     assert menu.items[1].submenu.items[0].title == "Subitem 1"
 
 
+def test_create_menu_from_data_execution_options():
+    menu_data = {
+        "title": "Main Menu",
+        "items": [
+            {"title": "Build", "action": "build", "execution": "process", "timeout": 30},
+            {"title": "Status", "action": "status"},
+            {"title": "Info", "action": "info", "cache": {"ttl": 30}},
+            {"title": "Disk", "action": "disk", "cache": {"ttl": 0.5}},
+            {"title": "List", "command": ["ls", "-l"]},
+        ],
+    }
+    menu = create_menu_from_data(menu_data, Mock())
+    assert menu.items[0].execution == "process"
+    assert menu.items[0].timeout == 30
+    assert menu.items[1].execution is None
+    assert menu.items[1].timeout is None
+    assert menu.items[1].cache is None
+    assert menu.items[2].cache == CachePolicy(30)
+    assert menu.items[3].cache == CachePolicy(0.5)
+    assert menu.items[1].command is None
+    assert menu.items[4].command == ("ls", "-l")
+    assert menu.items[4].action is None and menu.items[4].is_runnable
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"execution": "fork"},
+        {"timeout": 0},
+        {"timeout": "5"},
+        {"timeout": True},
+        {"cache": 30},
+        {"cache": {}},
+        {"cache": {"ttl": -1}},
+        {"cache": {"ttl": 30, "max_entries": 2}},
+        {"cache": {"ttl": 30, "size": 2}},
+        {"command": "ls -l"},
+        {"command": []},
+        {"command": ["ls", 1]},
+        {"command": ["ls"]},
+        {"requires": "build"},
+        {"requires": ["build", ""]},
+        {"requires": [1]},
+    ],
+)
+def test_create_menu_from_data_rejects_invalid_execution_options(options):
+    menu_data = {"title": "Main Menu", "items": [{"title": "Build", "action": "build", **options}]}
+    with pytest.raises(ValueError):
+        create_menu_from_data(menu_data, Mock())
+
+
+def test_create_menu_from_data_requirements():
+    menu_data = {
+        "title": "Main Menu",
+        "items": [
+            {"title": "Deploy", "action": "deploy", "requires": ["build", "migrate"]},
+            {
+                "title": "Tasks",
+                "submenu": {
+                    "title": "Tasks",
+                    "items": [
+                        {"title": "Build", "action": "build"},
+                        {"title": "Migrate", "action": "migrate", "requires": ["build"]},
+                    ],
+                },
+            },
+        ],
+    }
+    menu = create_menu_from_data(menu_data, Mock())
+    assert menu.items[0].requires == ("build", "migrate")
+    assert menu.items[1].submenu.items[0].requires is None
+    assert menu.items[1].submenu.items[1].requires == ("build",)
+
+
+@pytest.mark.parametrize(
+    "items, message",
+    [
+        (
+            [{"title": "Deploy", "action": "deploy", "requires": ["build"]}],
+            "not found in the menu: build",
+        ),
+        (
+            [
+                {"title": "Build", "action": "build", "requires": ["test"]},
+                {"title": "Test", "action": "test", "requires": ["build"]},
+            ],
+            "form a cycle: build -> test -> build",
+        ),
+        ([{"title": "List", "command": ["ls"], "requires": ["build"]}], "has no action"),
+    ],
+)
+def test_create_menu_from_data_rejects_invalid_requirements(items, message):
+    with pytest.raises(ValueError, match=message):
+        create_menu_from_data({"title": "Main Menu", "items": items}, Mock())
+
+
 # Tests for load_actions_module function
 def test_load_actions_module(tmp_path):
     """
@@ -131,16 +248,53 @@ def test_main_with_valid_args(tmp_path, monkeypatch):
         # Mock the argparse.ArgumentParser.parse_args method
         monkeypatch.setattr(
             "argparse.ArgumentParser.parse_args",
-            lambda self: Mock(
-                menu=str(menu_file), actions=str(actions_file), classic=False, theme="dark"
-            ),
+            lambda self: _cli_args(menu=str(menu_file), actions=str(actions_file)),
         )
 
         # Call the main function
         main()
 
         # Assert that the display method was called with the expected arguments
-        mock_display.assert_called_once_with(classic=False, theme="dark")
+        mock_display.assert_called_once_with(
+            classic=False,
+            theme="dark",
+            execution="thread",
+            action_timeout=None,
+            max_jobs=4,
+            batch_limit=None,
+            metrics_file=None,
+        )
+
+
+def test_main_reports_load_errors_but_not_errors_while_running(tmp_path, monkeypatch, capsys):
+    menu_file = tmp_path / "menu.json"
+    actions_file = tmp_path / "actions.py"
+    menu_file.write_text(
+        json.dumps({"title": "Main", "items": [{"title": "Bad", "action": "a", "timeout": 0}]}),
+        encoding="utf-8",
+    )
+    actions_file.write_text("def a(): pass\n", encoding="utf-8")
+    monkeypatch.setattr(
+        "argparse.ArgumentParser.parse_args",
+        lambda self: _cli_args(menu=str(menu_file), actions=str(actions_file)),
+    )
+    main()
+    assert capsys.readouterr().out == "Error: Invalid timeout for 'Bad': 0\n"
+
+    menu_file.write_text(json.dumps({"title": "Main", "items": []}), encoding="utf-8")
+    with patch.object(Menu, "display", side_effect=ValueError("raised by an action")):
+        with pytest.raises(ValueError, match="raised by an action"):
+            main()
+
+
+@pytest.mark.parametrize(
+    "argv", [["--max-jobs", "0"], ["--batch-limit", "-1"], ["--action-timeout", "0"]]
+)
+def test_main_rejects_non_positive_limits(argv, monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["pymenu", "--menu", "m.json", "--actions", "a.py", *argv])
+    with pytest.raises(SystemExit):
+        main()
+    assert "must be greater than 0" in capsys.readouterr().err
 
 
 def test_main_with_missing_args():
@@ -151,7 +305,7 @@ def test_main_with_missing_args():
     # Mock the argparse.ArgumentParser.parse_args method
     with patch(
         "argparse.ArgumentParser.parse_args",
-        return_value=Mock(menu=None, actions=None, classic=False, theme="dark"),
+        return_value=_cli_args(menu=None, actions=None),
     ):
         with patch("argparse.ArgumentParser.print_help") as mock_print_help:
             # Call the main function
@@ -176,12 +330,34 @@ def test_main_with_classic_flag(tmp_path, monkeypatch):
     with patch.object(Menu, "display") as mock_display:
         monkeypatch.setattr(
             "argparse.ArgumentParser.parse_args",
-            lambda self: Mock(
-                menu=str(menu_file), actions=str(actions_file), classic=True, theme="dark"
-            ),
+            lambda self: _cli_args(menu=str(menu_file), actions=str(actions_file), classic=True),
         )
         main()
-        mock_display.assert_called_once_with(classic=True, theme="dark")
+        mock_display.assert_called_once_with(
+            classic=True,
+            theme="dark",
+            execution="thread",
+            action_timeout=None,
+            max_jobs=4,
+            batch_limit=None,
+            metrics_file=None,
+        )
+
+
+def test_main_passes_metrics_file(tmp_path, monkeypatch):
+    """
+    Test that --metrics-file is parsed and passed on to display.
+    """
+    menu_file = tmp_path / "menu.json"
+    actions_file = tmp_path / "actions.py"
+    menu_file.write_text(json.dumps({"title": "Main Menu", "items": []}), encoding="utf-8")
+    actions_file.write_text("", encoding="utf-8")
+    argv = ["pymenu", "-m", str(menu_file), "-a", str(actions_file), "--metrics-file", "m.txt"]
+    monkeypatch.setattr("sys.argv", argv)
+
+    with patch.object(Menu, "display") as mock_display:
+        main()
+    assert mock_display.call_args.kwargs["metrics_file"] == "m.txt"
 
 
 def test_main_with_theme_flag(tmp_path, monkeypatch):
@@ -199,9 +375,15 @@ def test_main_with_theme_flag(tmp_path, monkeypatch):
     with patch.object(Menu, "display") as mock_display:
         monkeypatch.setattr(
             "argparse.ArgumentParser.parse_args",
-            lambda self: Mock(
-                menu=str(menu_file), actions=str(actions_file), classic=False, theme="light"
-            ),
+            lambda self: _cli_args(menu=str(menu_file), actions=str(actions_file), theme="light"),
         )
         main()
-        mock_display.assert_called_once_with(classic=False, theme="light")
+        mock_display.assert_called_once_with(
+            classic=False,
+            theme="light",
+            execution="thread",
+            action_timeout=None,
+            max_jobs=4,
+            batch_limit=None,
+            metrics_file=None,
+        )
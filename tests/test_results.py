@@ -0,0 +1,41 @@
+"""Tests for the action result cache."""
+
+from pymenu_cli.results import CachePolicy, ResultCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_result_cache_replays_until_the_ttl_expires():
+    clock = _Clock()
+    cache = ResultCache(clock)
+    cache.put("status", [(False, "ok")], CachePolicy(ttl=30))
+
+    clock.now += 12
+    cached = cache.get("status")
+    assert cached.output == ((False, "ok"),)
+    assert cached.age(cache.now()) == 12
+
+    clock.now += 18
+    assert cache.get("status") is None
+    assert len(cache) == 0
+
+
+def test_result_cache_evicts_least_recently_used_entries():
+    cache = ResultCache(_Clock(), max_entries=2)
+    policy = CachePolicy(ttl=60)
+    cache.put("a", [], policy)
+    cache.put("b", [], CachePolicy(ttl=5))
+    assert cache.get("a") is not None
+    cache.put("c", [], policy)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
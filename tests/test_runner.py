@@ -0,0 +1,216 @@
+"""Tests for running actions with captured output."""
+
+import asyncio
+import sys
+import threading
+from types import SimpleNamespace
+
+from pymenu_cli.actions import DeferredActions
+from pymenu_cli.runner import (
+    OutputSink,
+    call_action,
+    call_async_action,
+    call_command,
+    install_output_capture,
+    is_async_action,
+    is_cancelled,
+    output_capture_installed,
+    uninstall_output_capture,
+)
+
+
+def test_call_action_captures_output():
+    def action():
+        print("hello")
+        print("oops", file=sys.stderr)
+
+    result = call_action(SimpleNamespace(greet=action), "greet")
+    assert result.stdout == "hello\n"
+    assert result.stderr == "oops\n"
+    assert result.error is None
+
+
+def test_call_action_formats_exceptions():
+    def action():
+        print("before")
+        raise ValueError("boom")
+
+    result = call_action(SimpleNamespace(fail=action), "fail")
+    assert result.stdout == "before\n"
+    assert "ValueError: boom" in result.error
+
+
+def test_call_action_missing_action():
+    result = call_action(SimpleNamespace(), "missing")
+    assert "AttributeError" in result.error
+
+
+def test_is_cancelled_follows_the_cancel_event():
+    event = threading.Event()
+    seen = []
+
+    def action():
+        seen.append(is_cancelled())
+        event.set()
+        seen.append(is_cancelled())
+
+    call_action(SimpleNamespace(check=action), "check", event)
+    assert seen == [False, True]
+    assert not is_cancelled()
+
+
+def test_output_sink_batches_complete_lines():
+    notified = []
+    sink = OutputSink(lambda: notified.append(None))
+    sink.stdout.write("one\ntw")
+    sink.stdout.write("o\n")
+    sink.stderr.write("bad\n")
+    sink.stdout.write("three\n")
+    assert len(notified) == 1
+    assert sink.drain() == [(False, "one\ntwo"), (True, "bad"), (False, "three")]
+
+    sink.stdout.write("four\n")
+    assert len(notified) == 2
+    assert sink.drain() == [(False, "four")]
+    assert sink.drain() == []
+
+
+def test_output_sink_close_flushes_partial_lines_and_drops_later_writes():
+    sink = OutputSink()
+    sink.stdout.write("partial")
+    assert sink.drain() == []
+    sink.close()
+    sink.stdout.write("late\n")
+    assert sink.drain() == [(False, "partial")]
+    assert sink.wrote
+
+
+def test_call_action_streams_into_sink():
+    def action():
+        print("hello")
+        print("oops", file=sys.stderr)
+        print("done", end="")
+
+    sink = OutputSink()
+    result = call_action(SimpleNamespace(greet=action), "greet", sink=sink)
+    assert result.stdout == result.stderr == ""
+    assert sink.drain() == [(False, "hello"), (True, "oops"), (False, "done")]
+
+
+async def test_call_async_action_captures_output_per_task():
+    async def worker(label):
+        for i in range(3):
+            print(f"{label} {i}")
+            await asyncio.sleep(0)
+
+    actions = SimpleNamespace(a=lambda: worker("a"), b=lambda: worker("b"))
+    stdout = sys.stdout
+    result_a, result_b = await asyncio.gather(
+        call_async_action(actions, "a"), call_async_action(actions, "b")
+    )
+    assert result_a.stdout == "a 0\na 1\na 2\n"
+    assert result_b.stdout == "b 0\nb 1\nb 2\n"
+    assert sys.stdout is stdout
+
+
+def test_installed_capture_keeps_concurrent_thread_output_separate(capsys):
+    barrier = threading.Barrier(2)
+
+    def worker(label):
+        for i in range(3):
+            barrier.wait()
+            print(f"{label} {i}")
+
+    actions = SimpleNamespace(a=lambda: worker("a"), b=lambda: worker("b"))
+    stdout = sys.stdout
+    install_output_capture()
+    try:
+        routed = sys.stdout
+        assert output_capture_installed() and routed is not stdout
+        results = {}
+        threads = [
+            threading.Thread(target=lambda n=name: results.update({n: call_action(actions, n)}))
+            for name in ("a", "b")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Running actions leaves the installed streams in place
+        assert sys.stdout is routed
+        print("outside")
+    finally:
+        uninstall_output_capture()
+    assert results["a"].stdout == "a 0\na 1\na 2\n"
+    assert results["b"].stdout == "b 0\nb 1\nb 2\n"
+    assert sys.stdout is stdout and not output_capture_installed()
+    assert capsys.readouterr().out == "outside\n"
+
+
+async def test_call_async_action_formats_exceptions():
+    async def action():
+        print("oops", file=sys.stderr)
+        raise ValueError("boom")
+
+    sink = OutputSink()
+    result = await call_async_action(SimpleNamespace(fail=action), "fail", sink)
+    assert "ValueError: boom" in result.error
+    assert sink.drain() == [(True, "oops")]
+
+
+def test_is_async_action(tmp_path):
+    async def coroutine_action():
+        pass
+
+    actions = SimpleNamespace(sync=lambda: None, coro=coroutine_action)
+    assert is_async_action(actions, "coro")
+    assert not is_async_action(actions, "sync")
+    assert not is_async_action(actions, "missing")
+
+    actions_file = tmp_path / "actions.py"
+    actions_file.write_text("async def fetch():\n    pass\n\ndef run():\n    pass\n")
+    deferred = DeferredActions(str(actions_file))
+    assert is_async_action(deferred, "fetch")
+    assert not is_async_action(deferred, "run")
+    assert not deferred._is_loaded
+
+
+async def test_call_command_captures_output_and_exit_code():
+    script = "import sys; print('out'); print('err', file=sys.stderr)"
+    result = await call_command([sys.executable, "-c", script])
+    assert (result.stdout, result.stderr) == ("out\n", "err\n")
+    assert result.exit_code == 0 and result.error is None
+    assert result.rss_delta is None or result.rss_delta >= 0
+
+    failed = await call_command([sys.executable, "-c", "raise SystemExit(3)"])
+    assert failed.exit_code == 3
+    assert failed.error.endswith("exited with code 3")
+
+    missing = await call_command(["pymenu-no-such-program"])
+    assert missing.exit_code is None
+    assert missing.error.startswith("FileNotFoundError")
+
+
+async def test_call_command_streams_into_sink():
+    sink = OutputSink()
+    script = "for i in range(3): print(i, flush=True)"
+    result = await call_command([sys.executable, "-c", script], sink)
+    assert result.stdout == "" and result.exit_code == 0
+    assert sink.drain() == [(False, "0\n1\n2")]
+
+
+async def test_call_command_kills_the_subprocess_on_timeout_and_cancel():
+    sleeper = [sys.executable, "-c", "import time; print('up', flush=True); time.sleep(30)"]
+    result = await call_command(sleeper, timeout=0.5)
+    assert result.stdout == "up\n"
+    assert result.error.startswith("TimeoutError")
+    assert result.exit_code != 0
+
+    task = asyncio.create_task(call_command(sleeper))
+    await asyncio.sleep(0.5)
+    task.cancel()
+    try:
+        await asyncio.wait_for(task, 5)
+    except asyncio.CancelledError:
+        pass
+    assert task.cancelled()
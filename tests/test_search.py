@@ -0,0 +1,239 @@
+"""Tests for the global search index."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from pymenu_cli.models.menu_item import MenuItem
+from pymenu_cli.search import (
+    BONUS_BOUNDARY,
+    SCORE_MATCH,
+    IncrementalSearch,
+    SearchCancelled,
+    SearchIndex,
+    SearchPage,
+    SearchResult,
+    fuzzy_score,
+    ngrams,
+)
+
+TITLES = ["Deploy Staging", "Deploy Production", "Status", "Logs", "Redeploy All", "Settings"]
+
+
+def _results(titles=TITLES, menu="Main"):
+    return [SearchResult(MenuItem(title), f"{menu} › {title}", None) for title in titles]
+
+
+def _index(titles=TITLES):
+    return SearchIndex(_results(titles))
+
+
+def _linear(titles, query):
+    return [i for i, title in enumerate(titles) if query.lower() in title.lower()]
+
+
+def _subsequence(query, text):
+    chars = iter(text.casefold())
+    return all(char in chars for char in query.casefold())
+
+
+def _fuzzy_linear(titles, query):
+    return [i for i, title in enumerate(titles) if _subsequence(query, f"Main › {title}")]
+
+
+def test_ngrams():
+    assert ngrams("abcd") == {"abc", "bcd"}
+    assert ngrams("ab") == set()
+
+
+def test_search_ids_finds_titles_containing_query():
+    index = _index()
+    assert index.search_ids("DEPLOY") == [0, 1, 4]
+    assert index.search_ids("s") == _linear(TITLES, "s")
+    assert index.search_ids("lo") == _linear(TITLES, "lo")
+    assert index.search_ids("xyz") == []
+
+
+def test_search_ids_verifies_contiguous_match():
+    # "deploy all" shares every trigram with no title except "Redeploy All"
+    index = _index(["Deploy", "All deploy", "Redeploy All"])
+    assert index.search_ids("deploy all") == [2]
+
+
+def test_search_ids_matches_linear_scan():
+    titles = [f"item {i} {'alpha' if i % 3 else 'beta'} {i * 7}" for i in range(500)]
+    index = _index(titles)
+    assert len(index) == 500
+    for query in ["alpha", "beta 1", "item 4", "1 alpha 7", " 35", "zzz", "a"]:
+        assert index.search_ids(query) == _linear(titles, query)
+
+
+def test_match_ids_is_a_subsequence_test_on_paths():
+    index = _index()
+    for query in ["dpl", "stg", "main", "mst", "s", "zz"]:
+        assert index.match_ids(query) == _fuzzy_linear(TITLES, query)
+    assert index.match_ids("dpl", [4, 0]) == [4, 0]
+
+
+def test_fuzzy_score_prefers_boundaries_and_consecutive_matches():
+    assert fuzzy_score("xyz", "deploy") is None
+    assert fuzzy_score("dep", "deploy") > fuzzy_score("dep", "redeploy")
+    assert fuzzy_score("ds", "deploy staging") > fuzzy_score("ds", "deploys")
+    assert fuzzy_score("s", "my status") == SCORE_MATCH + 2 * BONUS_BOUNDARY
+    # The first letter of a path segment beats a word boundary inside it
+    assert fuzzy_score("t", "main › tools") > fuzzy_score("t", "main › my tools")
+
+
+def test_search_ranks_prefix_then_boundary_then_substring():
+    index = _index(["Redeploy", "My Deploy Script", "Deploy Production", "Deploy"])
+    titles = [sr.item.title for sr in index.search("deploy")]
+    assert titles == ["Deploy", "Deploy Production", "My Deploy Script", "Redeploy"]
+
+
+def test_search_ranks_scattered_title_matches_before_path_matches():
+    results = _results(["Docker", "Disk Usage"]) + _results(["Logs"], menu="Disk")
+    index = SearchIndex(results)
+    assert [sr.item.title for sr in index.search("dsk")] == ["Disk Usage", "Logs"]
+
+
+def test_search_returns_only_top_results():
+    titles = [f"deploy {i}" for i in range(1000)] + ["deploy"]
+    index = _index(titles)
+    results = index.search("deploy", limit=5)
+    assert len(results) == 5
+    assert results[0].item.title == "deploy"
+    assert len(index.match_ids("deploy")) == 1001
+
+
+def test_rank_titles_only_looks_at_the_given_matches(monkeypatch):
+    index = _index(["Deploy", "Deploy Production", "Redeploy", "Docs"])
+    monkeypatch.setattr(index, "search_ids", Mock(side_effect=AssertionError))
+    assert index.rank_titles("deploy", [1, 2]) == [1, 2]
+    assert index.rank_titles("dep", [2, 0]) == [0, 2]
+    assert index.rank_titles("deploy", []) == []
+
+
+def test_rank_fuzzy_skips_titles_containing_the_query():
+    index = _index(["Deploy", "Docker Pull", "Redeploy"])
+    assert index.rank_fuzzy("dep", index.match_ids("dep")) == [1]
+
+
+def test_rank_checks_cancellation_between_tiers():
+    index = _index()
+    checks = []
+
+    def cancelled():
+        checks.append(None)
+        return len(checks) > 1
+
+    with pytest.raises(SearchCancelled):
+        index.rank_titles("s", index.search_ids("s"), cancelled=cancelled)
+    checks.clear()
+    with pytest.raises(SearchCancelled):
+        index.rank_fuzzy("s", index.match_ids("s"), cancelled=cancelled)
+    ids = index.search_ids("s")
+    assert index.rank_titles("s", ids, cancelled=lambda: False) == index.rank_titles("s", ids)
+
+
+def test_search_ids_checks_cancellation_between_chunks(monkeypatch):
+    monkeypatch.setattr("pymenu_cli.search.CHUNK_SIZE", 2)
+    index = _index()
+    with pytest.raises(SearchCancelled):
+        index.search_ids("s", cancelled=lambda: True)
+    assert index.search_ids("s", cancelled=lambda: False) == index.search_ids("s")
+
+
+def test_incremental_search_skips_path_scan_when_titles_fill_the_page(monkeypatch):
+    titles = [f"deploy {i}" for i in range(10)] + ["Docker Pull"]
+    search = IncrementalSearch(_index(titles), limit=5)
+    monkeypatch.setattr(search.index, "match_ids", Mock(side_effect=AssertionError))
+    page = search.search("deploy")
+    assert len(page.results) == 5
+    assert (page.total, page.exact) == (10, False)
+
+
+def test_incremental_search_scans_paths_when_titles_do_not_fill_the_page():
+    search = IncrementalSearch(_index(["Deploy", "Docker Pull", "Logs"]))
+    page = search.search("dep")
+    assert [sr.item.title for sr in page.results] == ["Deploy", "Docker Pull"]
+    assert page == SearchPage(page.results, 2)
+
+
+def test_search_result_resolves_its_item_on_demand():
+    item, menu = MenuItem("Gem", i_action="gem"), object()
+    locate = Mock(return_value=(item, menu))
+    result = SearchResult(None, "Main › Gem", None, title="Gem", kind="action", locate=locate)
+    index = SearchIndex([result])
+    assert index.search("gem") == [result] and result.is_runnable
+    locate.assert_not_called()
+
+    result.resolve()
+    result.resolve()
+    assert (result.item, result.menu) == (item, menu)
+    locate.assert_called_once_with()
+    assert SearchResult(item, "Main › Gem", menu).kind == "action"
+
+
+def test_index_extend_adds_searchable_results():
+    index = _index(["Deploy"])
+    index.extend(_results(["Redeploy", "Logs"], menu="Sub"))
+    assert len(index) == 3
+    assert index.search_ids("deploy") == [0, 1]
+    assert [sr.path for sr in index.search("logs")] == ["Sub › Logs"]
+
+
+def test_incremental_search_narrows_previous_results(monkeypatch):
+    index = _index()
+    search = IncrementalSearch(index)
+    assert search.match_ids("de") == _fuzzy_linear(TITLES, "de")
+
+    calls = []
+    original = index.match_ids
+    monkeypatch.setattr(
+        index,
+        "match_ids",
+        lambda query, ids=None, cancelled=None: calls.append(ids) or original(query, ids),
+    )
+    assert search.match_ids("dep") == _fuzzy_linear(TITLES, "dep")
+    assert search.match_ids("Deploy ") == _fuzzy_linear(TITLES, "deploy ")
+    assert search.match_ids("deploy s") == _fuzzy_linear(TITLES, "deploy s")
+    assert None not in calls
+
+
+def test_incremental_search_backspace_pops_cached_results(monkeypatch):
+    index = _index()
+    search = IncrementalSearch(index)
+    cached = search.match_ids("dep")
+    search.match_ids("depl")
+
+    monkeypatch.setattr(index, "match_ids", lambda query, ids=None, cancelled=None: [])
+    assert search.match_ids("dep") is cached
+
+
+def test_incremental_search_new_query_searches_index():
+    search = IncrementalSearch(_index())
+    search.match_ids("deploy")
+    assert search.match_ids("status") == _fuzzy_linear(TITLES, "status")
+    search.reset()
+    assert [sr.item.title for sr in search.search("logs").results] == ["Logs"]
+
+
+def test_match_ids_checks_cancellation_between_chunks(monkeypatch):
+    monkeypatch.setattr("pymenu_cli.search.CHUNK_SIZE", 2)
+    index = _index()
+    checks = []
+
+    def cancelled():
+        checks.append(None)
+        return len(checks) > 2
+
+    with pytest.raises(SearchCancelled):
+        index.match_ids("s", cancelled=cancelled)
+    assert index.match_ids("s", cancelled=lambda: False) == index.match_ids("s")
+
+
+def test_incremental_search_does_not_cache_cancelled_search():
+    search = IncrementalSearch(_index())
+    with pytest.raises(SearchCancelled):
+        search.search("dep", cancelled=lambda: True)
+    assert search.match_ids("dep") == _fuzzy_linear(TITLES, "dep")
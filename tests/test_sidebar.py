@@ -42,3 +42,60 @@ async def test_sidebar_shows_root_items():
         sidebar = app.query_one(MenuSidebar)
         tree = sidebar.query_one("Tree")
         assert tree.root.data == menu
+
+
+class LazyRootSidebarTestApp(SidebarTestApp):
+    def compose(self) -> ComposeResult:
+        yield MenuSidebar(self.menu, lazy_root=True)
+
+
+async def test_sidebar_creates_children_on_expand():
+    menu = _make_menu()
+    app = SidebarTestApp(menu)
+    async with app.run_test() as pilot:
+        sidebar = app.query_one(MenuSidebar)
+        tree = sidebar.query_one("Tree")
+        # The root and its three items; the Settings submenu is not populated yet
+        assert sidebar.node_count == 4
+        settings = tree.root.children[1]
+        assert settings.allow_expand
+        assert not settings.children
+
+        settings.expand()
+        await pilot.pause()
+        assert [str(child.label) for child in settings.children] == ["Display", "Audio"]
+        assert sidebar.node_count == 6
+
+        settings.collapse()
+        settings.expand()
+        await pilot.pause()
+        assert len(settings.children) == 2
+
+
+async def test_sidebar_lazy_root_defers_top_level_nodes():
+    menu = _make_menu()
+    app = LazyRootSidebarTestApp(menu)
+    async with app.run_test() as pilot:
+        sidebar = app.query_one(MenuSidebar)
+        tree = sidebar.query_one("Tree")
+        assert sidebar.node_count == 1
+        assert not tree.root.children
+
+        tree.root.expand()
+        await pilot.pause()
+        assert [str(child.label) for child in tree.root.children] == ["Files", "Settings", "Help"]
+
+
+async def test_sidebar_does_not_materialize_lazy_submenus():
+    from unittest.mock import Mock
+
+    from pymenu_cli.pymenu import create_menu_from_data
+
+    data = {
+        "title": "Main",
+        "items": [{"title": "Sub", "submenu": {"title": "Sub", "items": [{"title": "Leaf"}]}}],
+    }
+    menu = create_menu_from_data(data, Mock(), lazy=True)
+    app = SidebarTestApp(menu)
+    async with app.run_test() as pilot:
+        assert not menu.items[0].submenu.is_loaded
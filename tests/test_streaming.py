@@ -0,0 +1,109 @@
+"""Tests for the streaming menu loader."""
+
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from pymenu_cli.pymenu import create_menu_from_data, load_menu
+from pymenu_cli.streaming import stream_menu
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples" / "menus"
+
+
+def _dump(menu):
+    return (
+        menu.title,
+        menu.color,
+        menu.banner,
+        [
+            (item.title, item.action, item.color, _dump(item.submenu) if item.submenu else None)
+            for item in menu.items
+        ],
+    )
+
+
+@pytest.mark.parametrize("name", ["colored_menu.json", "no_colored_menu.json"])
+def test_stream_menu_matches_json_loader(name):
+    path = EXAMPLES_DIR / name
+    actions = Mock()
+    expected = create_menu_from_data(json.loads(path.read_text(encoding="utf-8")), actions)
+
+    menu = stream_menu(str(path), actions)
+
+    assert _dump(menu) == _dump(expected)
+    assert menu.items[0].submenu.actions is actions
+
+
+def test_stream_menu_decodes_strings_and_values(tmp_path):
+    menu_file = tmp_path / "menu.json"
+    menu_file.write_text(
+        '{"title": "Caf\\u00e9 \\"Menu\\"", "extra": [1, -2.5e3, true, false, null],'
+        ' "banner": {"title": "Banner", "colors": ["red", "blue"]},'
+        ' "items": [{"submenu": {"items": [], "title": "Sub"}, "title": "über"}]}',
+        encoding="utf-8",
+    )
+
+    menu = stream_menu(str(menu_file), None)
+
+    assert menu.title == 'Café "Menu"'
+    assert menu.banner == {"title": "Banner", "colors": ["red", "blue"]}
+    assert menu.items[0].title == "über"
+    assert menu.items[0].submenu.title == "Sub"
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"title": "Main", "items": [}',
+        '{"title": "Main"\n "items": []}',
+        '{"title": "Main", "items": []} extra',
+        '{"title": "Main", items: []}',
+        '{"title": "Main, "items": []}',
+        '{"title": "Main" "items": []}',
+        '{"title": "Ma\nin", "items": []}',
+        '{"title": "Main", "items": [',
+    ],
+)
+def test_stream_menu_errors_match_json(tmp_path, document):
+    menu_file = tmp_path / "menu.json"
+    menu_file.write_text(document, encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(document)
+    with pytest.raises(json.JSONDecodeError) as actual:
+        stream_menu(str(menu_file), None)
+
+    assert actual.value.msg == expected.value.msg
+    assert (actual.value.lineno, actual.value.colno) == (
+        expected.value.lineno,
+        expected.value.colno,
+    )
+
+
+def test_stream_menu_empty_file(tmp_path):
+    menu_file = tmp_path / "menu.json"
+    menu_file.write_text("", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        stream_menu(str(menu_file), None)
+
+
+def test_load_menu_streaming(tmp_path):
+    menu_file = tmp_path / "menu.json"
+    actions_file = tmp_path / "actions.py"
+    menu_file.write_text(json.dumps({"title": "Main Menu", "items": [{"title": "Item 1"}]}))
+    actions_file.write_text("def action1(): pass")
+
+    menu = load_menu(str(menu_file), str(actions_file), streaming=True)
+    assert menu.items[0].title == "Item 1"
+
+    with pytest.raises(FileNotFoundError, match="Menu JSON file not found"):
+        load_menu(str(tmp_path / "missing.json"), str(actions_file), streaming=True)
+
+    menu_file.write_text('{"title": "Main Menu", "items": [}')
+    with pytest.raises(json.JSONDecodeError, match="Invalid JSON format in menu file"):
+        load_menu(str(menu_file), str(actions_file), streaming=True)
+
+    with pytest.raises(ValueError):
+        load_menu(str(menu_file), str(actions_file), streaming=True, lazy=True)